@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+BinaryGreedyMesh - Bitmask Greedy Mesher
+
+Greedy meshing over per-column bitmasks instead of per-voxel loops.
+
+Each run of voxels along an axis is one uint64 column, so face culling
+for a whole column is two bit ops:
+
+  visible(+axis) = col & ~(col >> 1)
+  visible(-axis) = col & ~(col << 1)
+
+Visible faces are then repacked into one 2D bit-plane per (face, layer,
+material) and merged greedily row by row: a run of set bits becomes a
+quad's width, and the quad grows down while the next row contains the
+same run.
+
+Output is a flat uint64 array of packed quads (see pack layout below),
+which ChunkMeshBuilder expands into vertices.
+"""
+
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Optional native kernels (mesher_c.pyx), compiled on first import. This is
+# the only place mesher_c is loaded (chunk_mesh_builder reuses the module),
+# and the pyximport hook is removed again so importing a mesher does not
+# leave a process-wide import hook behind.
+try:
+    import pyximport
+except ImportError:
+    mesher_c = None
+else:
+    _importers = pyximport.install(setup_args={'include_dirs': np.get_include()}, language_level=3)
+    try:
+        import mesher_c
+    except ImportError:
+        mesher_c = None
+    finally:
+        pyximport.uninstall(*_importers)
+        del _importers
+
+NATIVE_MERGE_AVAILABLE = mesher_c is not None
+if NATIVE_MERGE_AVAILABLE:
+    merge_planes = mesher_c.merge_planes
+
+
+# Face order matches chunk_mesh_builder.FACES: +Y, -Y, +X, -X, +Z, -Z.
+# Each face is (normal_axis, sign); axes are 0=x, 1=y, 2=z.
+FACE_DIRECTIONS = [(1, 1), (1, -1), (0, 1), (0, -1), (2, 1), (2, -1)]
+
+# In-plane axes for a face on normal_axis: quad height runs along U
+# (plane rows), quad width along V (bits within a row).
+PLANE_AXES = {0: (1, 2), 1: (0, 2), 2: (0, 1)}
+FACE_U_AXIS = np.array([PLANE_AXES[axis][0] for axis, _ in FACE_DIRECTIONS])
+FACE_V_AXIS = np.array([PLANE_AXES[axis][1] for axis, _ in FACE_DIRECTIONS])
+
+# Packed quad layout (uint64):
+#   bits  0-5  x      bits 18-23  w (along V)
+#   bits  6-11 y      bits 24-29  h (along U)
+#   bits 12-17 z      bits 32-39  material
+#                     bits 40-42  face (FACES index)
+# (x, y, z) is the min-corner voxel of the quad.
+
+
+def pack_quad(x: int, y: int, z: int, w: int, h: int, material: int, face: int) -> int:
+    """Pack one quad into the uint64 layout above."""
+    return (face << 40) | (material << 32) | (h << 24) | (w << 18) | (z << 12) | (y << 6) | x
+
+
+def unpack_quads(quads: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Unpack quads into per-field arrays.
+
+    Returns:
+        (x, y, z, w, h, material, face) int64 arrays
+    """
+    q = quads.astype(np.int64)
+    return (
+        q & 0x3f,
+        (q >> 6) & 0x3f,
+        (q >> 12) & 0x3f,
+        (q >> 18) & 0x3f,
+        (q >> 24) & 0x3f,
+        (q >> 32) & 0xff,
+        (q >> 40) & 0x7,
+    )
+
+
+# =============================================================================
+# MESHER
+# =============================================================================
+
+def _merge_plane(rows: List[int], size: int, emit) -> None:
+    """Greedy-merge one bit-plane (row i, bit j) in place, calling emit(i, j, w, h)."""
+    for i in range(size):
+        row = rows[i]
+        while row:
+            j = (row & -row).bit_length() - 1           # First set bit
+            shifted = row >> j
+            w = (~shifted & (shifted + 1)).bit_length() - 1  # Run of ones
+            run = ((1 << w) - 1) << j
+
+            h = 1
+            while i + h < size and (rows[i + h] & run) == run:
+                rows[i + h] &= ~run
+                h += 1
+
+            row &= ~run
+            emit(i, j, w, h)
+
+
+def _unpack_columns(cols: np.ndarray, size: int) -> np.ndarray:
+    """Expand uint64[...] bit columns into bool[..., size] (bit k -> [..., k])."""
+    words = np.ascontiguousarray(cols, dtype='<u8').view(np.uint8).reshape(cols.shape + (8,))
+    return np.unpackbits(words, axis=-1, count=size, bitorder='little').view(bool)
+
+
+def mesh(voxels: np.ndarray, region: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Greedy-mesh a dense chunk.
+
+    Args:
+        voxels: uint8[CS, CS, CS] material IDs indexed [x, y, z] (0 = air,
+                anything outside the array counts as air)
+        region: Optional bool[6, CS, CS, CS] per-face mask; only faces of
+                voxels inside it are emitted (used by remesh)
+
+    Returns:
+        uint64[N] packed quads
+
+    Example:
+        >>> slab = np.zeros((32, 32, 32), np.uint8)
+        >>> slab[:, 0, :] = 1
+        >>> len(mesh(slab))  # Top, bottom and 4 edge strips
+        6
+    """
+    size = voxels.shape[0]
+    bits = np.uint64(1) << np.arange(size, dtype=np.uint64)
+    solid = voxels != 0
+    quads: List[int] = []
+    if NATIVE_MERGE_AVAILABLE:
+        # Native merge writes into one buffer (at most one quad per face)
+        out = np.empty(6 * size ** 3, dtype=np.uint64)
+        count = 0
+
+    for axis in range(3):
+        # Columns along the normal axis: cols[u, v] has bit k set if solid
+        axis_solid = np.moveaxis(solid, axis, -1)
+        axis_materials = np.moveaxis(voxels, axis, -1)
+        cols = np.bitwise_or.reduce(np.where(axis_solid, bits, np.uint64(0)), axis=-1)
+        u_axis, v_axis = PLANE_AXES[axis]
+
+        for face, (face_axis, sign) in enumerate(FACE_DIRECTIONS):
+            if face_axis != axis:
+                continue
+
+            if sign > 0:
+                visible = cols & ~(cols >> np.uint64(1))
+            else:
+                visible = cols & ~(cols << np.uint64(1))
+            if not visible.any():
+                continue
+
+            # visible[u, v] bit k -> face_mask[u, v, k]
+            face_mask = _unpack_columns(visible, size)
+            if region is not None:
+                face_mask &= np.moveaxis(region[face], axis, -1)
+            face_materials = np.where(face_mask, axis_materials, 0)
+
+            for material in np.unique(face_materials[face_mask]).tolist():
+                # Plane rows: planes[k, u] has bit v set for this material
+                planes = np.bitwise_or.reduce(
+                    np.where(face_materials == material, bits[None, :, None], np.uint64(0)),
+                    axis=1,
+                ).T
+
+                if NATIVE_MERGE_AVAILABLE:
+                    count += merge_planes(np.ascontiguousarray(planes), axis, u_axis, v_axis,
+                                          material, face, out[count:])
+                    continue
+
+                for k in np.flatnonzero(planes.any(axis=1)).tolist():
+                    def emit(i, j, w, h, k=k, material=material, face=face):
+                        origin = [0, 0, 0]
+                        origin[axis], origin[u_axis], origin[v_axis] = k, i, j
+                        quads.append(pack_quad(*origin, w, h, material, face))
+
+                    _merge_plane(planes[k].tolist(), size, emit)
+
+    if NATIVE_MERGE_AVAILABLE:
+        return out[:count].copy()
+    return np.array(quads, dtype=np.uint64)
+
+
+def quad_extents(quads: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Voxel-space bounds covered by each quad.
+
+    Returns:
+        (lo, hi): int64[N, 3] inclusive min/max voxel of each quad
+    """
+    x, y, z, w, h, _, face = unpack_quads(quads)
+    lo = np.stack([x, y, z], axis=1)
+    hi = lo.copy()
+    rows = np.arange(len(quads))
+    hi[rows, FACE_U_AXIS[face]] += h - 1
+    hi[rows, FACE_V_AXIS[face]] += w - 1
+    return lo, hi
+
+
+def remesh(voxels: np.ndarray, previous: np.ndarray, dirty: Sequence[int]) -> np.ndarray:
+    """
+    Patch a previous mesh after edits confined to a local AABB.
+
+    A face only changes if its voxel or the neighbor it faces changed, so
+    quads clear of the dirty AABB grown by one voxel are kept as-is. Quads
+    touching it are dropped, and their faces plus the grown AABB are
+    re-meshed. The result covers exactly the faces mesh(voxels) would.
+
+    Args:
+        voxels: Current uint8[CS, CS, CS] material IDs indexed [x, y, z]
+        previous: Packed quads from the last mesh of this chunk
+        dirty: [x0, y0, z0, x1, y1, z1] inclusive local AABB of the edits
+
+    Returns:
+        uint64[N] packed quads
+    """
+    size = voxels.shape[0]
+    lo = np.maximum(np.asarray(dirty[:3]) - 1, 0)
+    hi = np.minimum(np.asarray(dirty[3:]) + 1, size - 1)
+
+    quad_lo, quad_hi = quad_extents(previous)
+    touched = np.all((quad_hi >= lo) & (quad_lo <= hi), axis=1)
+
+    region = np.zeros((6, size, size, size), dtype=bool)
+    region[:, lo[0]:hi[0] + 1, lo[1]:hi[1] + 1, lo[2]:hi[2] + 1] = True
+    faces = unpack_quads(previous[touched])[6].tolist()
+    for face, (x0, y0, z0), (x1, y1, z1) in zip(faces, quad_lo[touched].tolist(), quad_hi[touched].tolist()):
+        region[face, x0:x1 + 1, y0:y1 + 1, z0:z1 + 1] = True
+
+    return np.concatenate([previous[~touched], mesh(voxels, region)])
+
+
+# Mesh of an all-air chunk
+EMPTY_QUADS = np.zeros(0, dtype=np.uint64)
+EMPTY_QUADS.flags.writeable = False
+
+
+@lru_cache(maxsize=256)
+def solid_quads(material: int, size: int) -> np.ndarray:
+    """
+    Mesh of a chunk filled with one material: one full quad per face.
+
+    Same quads mesh() emits for np.full((size,) * 3, material), without
+    building any columns. Cached per material; read-only.
+    """
+    quads = []
+    for face, (axis, sign) in enumerate(FACE_DIRECTIONS):
+        origin = [0, 0, 0]
+        origin[axis] = size - 1 if sign > 0 else 0
+        quads.append(pack_quad(*origin, size, size, material, face))
+    out = np.array(quads, dtype=np.uint64)
+    out.flags.writeable = False
+    return out
+
+
+# =============================================================================
+# VALIDATION
+# =============================================================================
+
+def _quad_cells(quads: np.ndarray) -> set:
+    """Expand quads into (face, x, y, z, material) unit faces."""
+    cells = set()
+    for x, y, z, w, h, material, face in zip(*(a.tolist() for a in unpack_quads(quads))):
+        axis = FACE_DIRECTIONS[face][0]
+        u_axis, v_axis = PLANE_AXES[axis]
+        for du in range(h):
+            for dv in range(w):
+                pos = [x, y, z]
+                pos[u_axis] += du
+                pos[v_axis] += dv
+                cells.add((face, *pos, material))
+    return cells
+
+
+def validate_binary_greedy():
+    """Check merged quads cover exactly the naive exposed faces."""
+    print("Validating binary greedy mesher...")
+
+    rng = np.random.default_rng(3)
+    corridor = np.zeros((32, 32, 32), np.uint8)
+    corridor[:, 0, :] = 1
+    corridor[:, 1:6, 0] = 2
+    corridor[:, 1:6, 9] = 2
+    corridor[:, 5, :10] = 3
+    noise = rng.integers(0, 4, size=(32, 32, 32)).astype(np.uint8) * (rng.random((32, 32, 32)) < 0.3)
+
+    for name, voxels in (("corridor", corridor), ("noise", noise.astype(np.uint8))):
+        padded = np.pad(voxels, 1)
+        expected = set()
+        for face, (axis, sign) in enumerate(FACE_DIRECTIONS):
+            offset = [1, 1, 1]
+            offset[axis] += sign
+            neighbor = padded[offset[0]:offset[0] + 32, offset[1]:offset[1] + 32, offset[2]:offset[2] + 32]
+            for x, y, z in zip(*np.nonzero((voxels != 0) & (neighbor == 0))):
+                expected.add((face, int(x), int(y), int(z), int(voxels[x, y, z])))
+
+        quads = mesh(voxels)
+        _, _, _, w, h, _, _ = unpack_quads(quads)
+        assert _quad_cells(quads) == expected
+        assert int((w * h).sum()) == len(expected)  # No overlapping quads
+        print(f"  ✓ {name}: {len(expected)} faces -> {len(quads)} quads")
+
+    solid = np.full((32, 32, 32), 7, np.uint8)
+    assert sorted(solid_quads(7, 32).tolist()) == sorted(mesh(solid).tolist())
+    assert len(mesh(np.zeros((32, 32, 32), np.uint8))) == len(EMPTY_QUADS) == 0
+    print("  ✓ solid / empty shortcuts match mesh()")
+
+
+def validate_remesh():
+    """Check patched meshes match a full re-mesh face for face."""
+    print("Validating incremental remesh...")
+
+    rng = np.random.default_rng(5)
+    voxels = np.zeros((32, 32, 32), np.uint8)
+    voxels[:, 0, :] = 1
+    voxels[:, 1:6, 0] = 2
+    voxels[:, 5, :] = 3
+    quads = mesh(voxels)
+
+    for step in range(20):
+        x, y, z = rng.integers(0, 31, size=3)
+        ext = rng.integers(0, 3, size=3)
+        voxels[x:x + ext[0] + 1, y:y + ext[1] + 1, z:z + ext[2] + 1] = rng.integers(0, 5)
+        dirty = [x, y, z, min(x + ext[0], 31), min(y + ext[1], 31), min(z + ext[2], 31)]
+
+        quads = remesh(voxels, quads, dirty)
+        _, _, _, w, h, _, _ = unpack_quads(quads)
+        full = mesh(voxels)
+        assert _quad_cells(quads) == _quad_cells(full)
+        assert int((w * h).sum()) == len(_quad_cells(full))
+
+    print(f"  ✓ 20 random edits: {len(quads)} quads (full re-mesh: {len(full)})")
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("BINARY GREEDY MESHER")
+    print("=" * 80)
+    print()
+    validate_binary_greedy()
+    validate_remesh()
+    print()
+    print("=" * 80)
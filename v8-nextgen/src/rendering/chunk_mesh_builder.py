@@ -20,24 +20,64 @@ Architecture:
 This is the "plug any renderer under me" layer.
 """
 
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, NamedTuple, Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
+import numpy as np
+
 # Import voxel system
 sys.path.insert(0, '.')
 from voxel_chunk import VoxelChunk
 from voxel_encoding import CHUNK_SIZE
+import binary_greedy_mesh
+
+# Optional native kernel (mesher_c.pyx), loaded once by binary_greedy_mesh
+NATIVE_MESHER_AVAILABLE = binary_greedy_mesh.mesher_c is not None
+if NATIVE_MESHER_AVAILABLE:
+    build_naive_mesh = binary_greedy_mesh.mesher_c.build_naive_mesh
+
+# Optional GPU array backend for MeshingStrategy.GPU (falls back to NumPy)
+try:
+    import cupy as xp
+    GPU_AVAILABLE = True
+except ImportError:
+    xp = np
+    GPU_AVAILABLE = False
+
+# Most chunks whose kernel buffers are kept (reuse_buffers); the least
+# recently meshed chunk's buffers are dropped first
+SCRATCH_POOL_SIZE = 256
+
+
+# Face definitions (normal, vertex offsets)
+# Each face is defined by its normal and 4 vertex positions.
+# mesher_c.pyx mirrors this table - keep the order in sync.
+FACES = [
+    # (nx, ny, nz), [(x0,y0,z0), (x1,y1,z1), (x2,y2,z2), (x3,y3,z3)]
+    ((0, 1, 0), [(0,1,0), (1,1,0), (1,1,1), (0,1,1)]),  # Top (+Y)
+    ((0,-1, 0), [(0,0,0), (0,0,1), (1,0,1), (1,0,0)]),  # Bottom (-Y)
+    ((1, 0, 0), [(1,0,0), (1,0,1), (1,1,1), (1,1,0)]),  # Right (+X)
+    ((-1,0, 0), [(0,0,0), (0,1,0), (0,1,1), (0,0,1)]),  # Left (-X)
+    ((0, 0, 1), [(0,0,1), (0,1,1), (1,1,1), (1,0,1)]),  # Front (+Z)
+    ((0, 0,-1), [(0,0,0), (1,0,0), (1,1,0), (0,1,0)]),  # Back (-Z)
+]
+FACE_NORMALS = [normal for normal, _ in FACES]
+FACE_CORNERS = np.array([corners for _, corners in FACES], dtype=np.float32)  # (6, 4, 3)
+QUAD_INDICES = np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)
 
 
 # =============================================================================
 # MESH DATA STRUCTURES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Vertex:
-    """Single vertex in 3D space."""
+    """Single vertex in 3D space (hashable, usable as a dict key for welding)."""
     x: float
     y: float
     z: float
@@ -47,7 +87,7 @@ class Vertex:
         return (self.x, self.y, self.z)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Quad:
     """Single quad face (4 vertices)."""
     v0: Vertex
@@ -69,7 +109,7 @@ class Quad:
         return (vertices, indices)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkMesh:
     """
     Renderable mesh data for a chunk.
@@ -95,6 +135,53 @@ class ChunkMesh:
         return len(self.vertices) == 0
 
 
+class MeshRef(NamedTuple):
+    """
+    Location of one chunk's mesh inside a batch mesh file.
+
+    Offsets are byte offsets into the file written by
+    BatchMeshBuilder.build_batch(); lengths are element counts.
+
+    Layout per chunk (each section 4-byte aligned):
+      positions: float32[positions_len, 3]
+      indices:   uint32[indices_len]
+      materials: uint16[materials_len]   (per triangle)
+      normals:   int8[materials_len, 3]  (per triangle)
+    """
+    chunk_coords: Tuple[int, int, int]
+    positions_offset: int
+    positions_len: int
+    indices_offset: int
+    indices_len: int
+    materials_offset: int
+    materials_len: int
+    normals_offset: int
+
+
+class _MeshScratch:
+    """
+    Growable kernel output buffers for one chunk.
+
+    Capacity (in faces) is tracked separately from the logical length the
+    kernel returns, and grows by 1.5x so steady edits rarely reallocate.
+    """
+    __slots__ = ('capacity', 'positions', 'indices', 'materials', 'face_ids')
+
+    def __init__(self):
+        self.capacity = 0
+        self.positions = self.indices = self.materials = self.face_ids = None
+
+    def reserve(self, faces: int) -> None:
+        """Ensure room for `faces` faces, overallocating on growth."""
+        if faces <= self.capacity and self.positions is not None:
+            return
+        self.capacity = max(faces, int(self.capacity * 1.5))
+        self.positions = np.empty((self.capacity * 4, 3), dtype=np.float32)
+        self.indices = np.empty(self.capacity * 6, dtype=np.uint32)
+        self.materials = np.empty(self.capacity * 2, dtype=np.uint16)
+        self.face_ids = np.empty(self.capacity * 2, dtype=np.uint8)
+
+
 # =============================================================================
 # MESHING STRATEGY
 # =============================================================================
@@ -104,6 +191,8 @@ class MeshingStrategy(Enum):
     NAIVE_CUBES = "naive"           # One cube per voxel (simple, inefficient)
     GREEDY = "greedy"               # Greedy meshing (efficient, more complex)
     MARCHING_CUBES = "marching"     # Smooth surfaces (future)
+    GPU = "gpu"                     # Data-parallel naive cubes (CuPy, else NumPy)
+    BINARY_GREEDY = "binary_greedy" # Greedy meshing over uint64 column bitmasks
 
 
 # =============================================================================
@@ -122,14 +211,19 @@ class ChunkMeshBuilder:
         >>> renderer.upload(mesh.chunk_coords, mesh.vertices, mesh.indices)
     """
 
-    def __init__(self, strategy: MeshingStrategy = MeshingStrategy.NAIVE_CUBES):
+    def __init__(self, strategy: MeshingStrategy = MeshingStrategy.NAIVE_CUBES, reuse_buffers: bool = False):
         """
         Initialize mesh builder.
 
         Args:
             strategy: Meshing algorithm to use
+            reuse_buffers: Keep the native kernel's output arrays per chunk
+                           and grow them in place instead of allocating
+                           them on every rebuild.
         """
         self.strategy = strategy
+        self.reuse_buffers = reuse_buffers
+        self._scratch_pool: Dict[Tuple[int, int, int], _MeshScratch] = {}
 
     def build(self, chunk: VoxelChunk) -> ChunkMesh:
         """
@@ -145,9 +239,36 @@ class ChunkMeshBuilder:
             return self._build_naive_cubes(chunk)
         elif self.strategy == MeshingStrategy.GREEDY:
             return self._build_greedy(chunk)
+        elif self.strategy == MeshingStrategy.BINARY_GREEDY:
+            return self._build_binary_greedy(chunk)
+        elif self.strategy == MeshingStrategy.GPU:
+            mesh = build_meshes_data_parallel([chunk])[0]
+            return mesh
         else:
             raise ValueError(f"Unsupported meshing strategy: {self.strategy}")
 
+    def release(self, chunk_coords: Tuple[int, int, int]) -> None:
+        """
+        Drop pooled buffers for a chunk (call when the chunk is unloaded).
+
+        Args:
+            chunk_coords: Chunk coordinates
+        """
+        self._scratch_pool.pop(chunk_coords, None)
+
+    def _scratch(self, chunk_coords: Tuple[int, int, int], max_faces: int) -> "_MeshScratch":
+        """Get kernel output buffers able to hold max_faces faces."""
+        if not self.reuse_buffers:
+            scratch = _MeshScratch()
+        else:
+            # Reinserting keeps the pool in least-recently-used order
+            scratch = self._scratch_pool.pop(chunk_coords, None) or _MeshScratch()
+            self._scratch_pool[chunk_coords] = scratch
+            if len(self._scratch_pool) > SCRATCH_POOL_SIZE:
+                del self._scratch_pool[next(iter(self._scratch_pool))]
+        scratch.reserve(max_faces)
+        return scratch
+
     # =========================================================================
     # NAIVE CUBES MESHING (Simple, One Cube Per Voxel)
     # =========================================================================
@@ -164,49 +285,31 @@ class ChunkMeshBuilder:
         Returns:
             ChunkMesh with cube geometry
         """
+        if NATIVE_MESHER_AVAILABLE:
+            return self._build_naive_cubes_native(chunk)
+
         vertices = []
         indices = []
         materials = []
         normals = []
 
-        # Face definitions (normal, vertex offsets)
-        # Each face is defined by its normal and 4 vertex positions
-        FACES = [
-            # (nx, ny, nz), [(x0,y0,z0), (x1,y1,z1), (x2,y2,z2), (x3,y3,z3)]
-            ((0, 1, 0), [(0,1,0), (1,1,0), (1,1,1), (0,1,1)]),  # Top (+Y)
-            ((0,-1, 0), [(0,0,0), (0,0,1), (1,0,1), (1,0,0)]),  # Bottom (-Y)
-            ((1, 0, 0), [(1,0,0), (1,0,1), (1,1,1), (1,1,0)]),  # Right (+X)
-            ((-1,0, 0), [(0,0,0), (0,1,0), (0,1,1), (0,0,1)]),  # Left (-X)
-            ((0, 0, 1), [(0,0,1), (0,1,1), (1,1,1), (1,0,1)]),  # Front (+Z)
-            ((0, 0,-1), [(0,0,0), (1,0,0), (1,1,0), (0,1,0)]),  # Back (-Z)
-        ]
-
         vertex_offset = 0
 
+        # Zero-padded copy flattened to bytes: the air border makes chunk
+        # boundary faces exposed, so neighbor lookups need no bounds checks
+        padded = np.zeros((CHUNK_SIZE + 2,) * 3, dtype=np.uint8)
+        _fill_padded(chunk, padded)
+        occupied = padded.tobytes()
+        stride = CHUNK_SIZE + 2
+        face_offsets = [(nx * stride + ny) * stride + nz for (nx, ny, nz), _ in FACES]
+
         # Iterate all voxels in chunk
         for local_x, local_y, local_z, material in chunk.iter_voxels():
-            if material == 0:  # Skip air
-                continue
-
-            # Check each face for exposure to air
-            for (nx, ny, nz), face_verts in FACES:
-                # Check neighbor in this direction
-                neighbor_x = local_x + nx
-                neighbor_y = local_y + ny
-                neighbor_z = local_z + nz
-
-                # Is neighbor air or out of bounds?
-                is_exposed = False
-
-                if (neighbor_x < 0 or neighbor_x >= CHUNK_SIZE or
-                    neighbor_y < 0 or neighbor_y >= CHUNK_SIZE or
-                    neighbor_z < 0 or neighbor_z >= CHUNK_SIZE):
-                    is_exposed = True  # Chunk boundary
-                else:
-                    neighbor_material = chunk.get_voxel(neighbor_x, neighbor_y, neighbor_z)
-                    is_exposed = (neighbor_material == 0)
-
-                if is_exposed:
+            base = ((local_x + 1) * stride + local_y + 1) * stride + local_z + 1
+
+            # Check each face for exposure to air (neighbor in padded [x, y, z])
+            for offset, ((nx, ny, nz), face_verts) in zip(face_offsets, FACES):
+                if not occupied[base + offset]:
                     # Add this face
                     for (dx, dy, dz) in face_verts:
                         vx = local_x + dx
@@ -226,12 +329,32 @@ class ChunkMeshBuilder:
 
                     vertex_offset += 4
 
+        return ChunkMesh(chunk.position, vertices, indices, materials, normals)
+
+    def _build_naive_cubes_native(self, chunk: VoxelChunk) -> ChunkMesh:
+        """
+        Build naive cube mesh with the mesher_c kernel (GIL released).
+
+        Args:
+            chunk: VoxelChunk to mesh
+
+        Returns:
+            ChunkMesh with cube geometry (same faces as the Python path)
+        """
+        # Zero-padded dense copy: neighbor lookups never leave the array
+        padded = np.zeros((CHUNK_SIZE + 2,) * 3, dtype=np.uint8)
+        _fill_padded(chunk, padded)
+
+        scratch = self._scratch(chunk.position, chunk.voxel_count() * 6)
+        faces = build_naive_mesh(padded, scratch.positions, scratch.indices,
+                                 scratch.materials, scratch.face_ids)
+
         return ChunkMesh(
-            chunk_coords=chunk.position,
-            vertices=vertices,
-            indices=indices,
-            materials=materials,
-            normals=normals,
+            chunk.position,
+            [tuple(v) for v in scratch.positions[:faces * 4].tolist()],
+            scratch.indices[:faces * 6].tolist(),
+            scratch.materials[:faces * 2].tolist(),
+            [FACE_NORMALS[f] for f in scratch.face_ids[:faces * 2].tolist()],
         )
 
     # =========================================================================
@@ -252,11 +375,202 @@ class ChunkMeshBuilder:
             ChunkMesh with optimized geometry
 
         Note:
-            Not yet implemented - falls back to naive cubes.
+            Uses the binary greedy mesher (see _build_binary_greedy).
+        """
+        return self._build_binary_greedy(chunk)
+
+    def _build_binary_greedy(self, chunk: VoxelChunk) -> ChunkMesh:
+        """
+        Build mesh with the bitmask greedy mesher (binary_greedy_mesh.py).
+
+        Covers exactly the faces NAIVE_CUBES emits, merged into as few
+        same-material quads as the greedy pass finds.
+
+        Args:
+            chunk: VoxelChunk to mesh
+
+        Returns:
+            ChunkMesh with merged quads
         """
-        # TODO: Implement greedy meshing
-        # For now, fall back to naive
-        return self._build_naive_cubes(chunk)
+        return self.mesh_from_quads(chunk.position, self.build_quads(chunk))
+
+    def build_quads(self, chunk: VoxelChunk, previous: Optional[np.ndarray] = None,
+                    dirty: Optional[List[int]] = None) -> np.ndarray:
+        """
+        Greedy-mesh a chunk to packed quads, optionally patching a previous result.
+
+        Args:
+            chunk: VoxelChunk to mesh
+            previous: Packed quads from the chunk's last build_quads call
+            dirty: Local AABB [x0, y0, z0, x1, y1, z1] changed since `previous`
+
+        Returns:
+            uint64[N] packed quads (see binary_greedy_mesh)
+        """
+        # Empty and single-material chunks have fixed meshes
+        if chunk.is_empty():
+            return binary_greedy_mesh.EMPTY_QUADS
+        material = chunk.uniform_material()
+        if material is not None:
+            return binary_greedy_mesh.solid_quads(material, CHUNK_SIZE)
+
+        padded = np.zeros((CHUNK_SIZE + 2,) * 3, dtype=np.uint8)
+        _fill_padded(chunk, padded)
+        voxels = padded[1:-1, 1:-1, 1:-1]
+        if previous is not None and dirty is not None:
+            return binary_greedy_mesh.remesh(voxels, previous, dirty)
+        return binary_greedy_mesh.mesh(voxels)
+
+    def mesh_from_quads(self, chunk_coords: Tuple[int, int, int], quads: np.ndarray) -> ChunkMesh:
+        """
+        Expand packed quads into a ChunkMesh.
+
+        Args:
+            chunk_coords: Chunk coordinates
+            quads: Packed quads from build_quads
+
+        Returns:
+            ChunkMesh ready for renderer
+        """
+        return ChunkMesh(chunk_coords, *_expand_quads(quads))
+
+
+def _expand_quads(quads: np.ndarray) -> Tuple[list, list, list, list]:
+    """
+    Expand packed greedy quads into ChunkMesh lists.
+
+    Each quad reuses its face's unit corners from FACES, stretched to
+    h along the plane's U axis and w along its V axis, so winding
+    matches the naive mesher.
+
+    Returns:
+        (vertices, indices, materials, normals)
+    """
+    x, y, z, w, h, material, face = binary_greedy_mesh.unpack_quads(quads)
+    count = len(quads)
+
+    scale = np.ones((count, 3), dtype=np.float32)
+    rows = np.arange(count)
+    scale[rows, binary_greedy_mesh.FACE_U_AXIS[face]] = h
+    scale[rows, binary_greedy_mesh.FACE_V_AXIS[face]] = w
+    origin = np.stack([x, y, z], axis=1).astype(np.float32)
+    positions = (origin[:, None, :] + FACE_CORNERS[face] * scale[:, None, :]).reshape(-1, 3)
+    indices = ((np.arange(count, dtype=np.uint32) * 4)[:, None] + QUAD_INDICES).reshape(-1)
+
+    return (
+        [tuple(v) for v in positions.tolist()],
+        indices.tolist(),
+        np.repeat(material, 2).tolist(),
+        [FACE_NORMALS[f] for f in np.repeat(face, 2).tolist()],
+    )
+
+
+# =============================================================================
+# DATA-PARALLEL MESHING (MeshingStrategy.GPU)
+# =============================================================================
+
+def _fill_padded(chunk: VoxelChunk, padded: np.ndarray) -> None:
+    """Scatter chunk voxels into a zeroed (CS+2)³ array at [x+1, y+1, z+1]."""
+    if chunk.dense is not None:
+        # Dense storage is [y, z, x] in encoded order
+        padded[1:-1, 1:-1, 1:-1] = chunk.dense.reshape(CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE).transpose(2, 0, 1)
+        return
+    xs, ys, zs, materials = chunk.iter_voxels_soa()
+    padded[xs + 1, ys + 1, zs + 1] = materials
+
+
+def build_mesh_arrays_data_parallel(chunks: List[VoxelChunk]) -> Dict[str, object]:
+    """
+    Mesh many chunks in one data-parallel dispatch, leaving results on device.
+
+    Every voxel face test is independent, so the whole batch is meshed with
+    array-wide operations instead of a per-voxel loop:
+
+      1. Exposure: one pass per face direction compares each voxel with
+         its neighbor in the padded volume -> faces[chunk, x, y, z, face]
+      2. Prefix sum: per-chunk face counts -> cumulative face offsets
+      3. Emit: positions / indices / materials written from the compacted
+         face list in voxel-major, face-minor order
+
+    Runs on CuPy when installed (arrays stay in GPU memory so a renderer
+    can bind them directly), otherwise on NumPy with identical output.
+
+    Args:
+        chunks: Chunks to mesh together
+
+    Returns:
+        Dict of backend arrays: positions (F*4, 3) float32, indices (F*6,)
+        uint32 (chunk-local), materials (F*2,) uint16, face_ids (F*2,) uint8,
+        face_offsets (len(chunks)+1,) int64
+    """
+    n = len(chunks)
+    size = CHUNK_SIZE
+    host = np.zeros((n, size + 2, size + 2, size + 2), dtype=np.uint8)
+    for i, chunk in enumerate(chunks):
+        _fill_padded(chunk, host[i])
+    padded = xp.asarray(host)  # Single upload for the whole batch
+    inner = padded[:, 1:-1, 1:-1, 1:-1]
+    solid = inner != 0
+
+    # 1. Exposure mask, one plane per face direction
+    faces = xp.empty((n, size, size, size, 6), dtype=bool)
+    for f, (nx, ny, nz) in enumerate(FACE_NORMALS):
+        neighbor = padded[:, 1 + nx:1 + nx + size, 1 + ny:1 + ny + size, 1 + nz:1 + nz + size]
+        faces[..., f] = solid & (neighbor == 0)
+
+    # 2. Prefix sum of per-chunk face counts -> output offsets
+    chunk_ids, xs, ys, zs, face_ids = xp.nonzero(faces)
+    counts = xp.bincount(chunk_ids, minlength=n)
+    face_offsets = xp.zeros(n + 1, dtype=xp.int64)
+    xp.cumsum(counts, out=face_offsets[1:])
+
+    # 3. Emit geometry for every exposed face at once
+    origin = xp.stack([xs, ys, zs], axis=1).astype(xp.float32)
+    positions = (origin[:, None, :] + xp.asarray(FACE_CORNERS)[face_ids]).reshape(-1, 3)
+
+    local_face = xp.arange(face_ids.size, dtype=xp.int64) - face_offsets[chunk_ids]
+    indices = ((local_face * 4).astype(xp.uint32)[:, None] + xp.asarray(QUAD_INDICES)).reshape(-1)
+
+    face_materials = inner[chunk_ids, xs, ys, zs].astype(xp.uint16)
+
+    return {
+        'positions': positions,
+        'indices': indices,
+        'materials': xp.repeat(face_materials, 2),
+        'face_ids': xp.repeat(face_ids.astype(xp.uint8), 2),
+        'face_offsets': face_offsets,
+    }
+
+
+def build_meshes_data_parallel(chunks: List[VoxelChunk]) -> List[ChunkMesh]:
+    """
+    Mesh many chunks in one dispatch and read results back as ChunkMeshes.
+
+    Args:
+        chunks: Chunks to mesh together
+
+    Returns:
+        One ChunkMesh per chunk (same faces as NAIVE_CUBES)
+    """
+    arrays = build_mesh_arrays_data_parallel(chunks)
+    to_host = xp.asnumpy if GPU_AVAILABLE else np.asarray
+    positions = to_host(arrays['positions'])
+    indices = to_host(arrays['indices'])
+    materials = to_host(arrays['materials'])
+    face_ids = to_host(arrays['face_ids'])
+    offsets = to_host(arrays['face_offsets']).tolist()
+
+    meshes = []
+    for i, chunk in enumerate(chunks):
+        f0, f1 = offsets[i], offsets[i + 1]
+        meshes.append(ChunkMesh(
+            chunk_coords=chunk.position,
+            vertices=[tuple(v) for v in positions[f0 * 4:f1 * 4].tolist()],
+            indices=indices[f0 * 6:f1 * 6].tolist(),
+            materials=materials[f0 * 2:f1 * 2].tolist(),
+            normals=[FACE_NORMALS[f] for f in face_ids[f0 * 2:f1 * 2].tolist()],
+        ))
+    return meshes
 
 
 # =============================================================================
@@ -270,31 +584,130 @@ class BatchMeshBuilder:
     Useful for initial world loading or large updates.
     """
 
-    def __init__(self, strategy: MeshingStrategy = MeshingStrategy.NAIVE_CUBES):
+    def __init__(self, strategy: MeshingStrategy = MeshingStrategy.NAIVE_CUBES,
+                 workers: int = 1, gpu_batch_size: int = 64):
         """
         Initialize batch builder.
 
         Args:
             strategy: Meshing strategy to use
+            workers: Meshing threads (only useful with the native mesher,
+                     which releases the GIL)
+            gpu_batch_size: Chunks per dispatch for MeshingStrategy.GPU
         """
         self.builder = ChunkMeshBuilder(strategy)
-
-    def build_batch(self, chunks: List[VoxelChunk]) -> List[ChunkMesh]:
+        self.workers = workers
+        self.gpu_batch_size = gpu_batch_size
+
+    def _iter_meshes(self, chunks: Iterable[VoxelChunk]) -> Iterator[ChunkMesh]:
+        """Yield meshes in input order, keeping at most `workers` in flight."""
+        if self.builder.strategy == MeshingStrategy.GPU:
+            group = []
+            for chunk in chunks:
+                group.append(chunk)
+                if len(group) == self.gpu_batch_size:
+                    yield from build_meshes_data_parallel(group)
+                    group = []
+            if group:
+                yield from build_meshes_data_parallel(group)
+            return
+
+        if self.workers <= 1:
+            for chunk in chunks:
+                yield self.builder.build(chunk)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(self.builder.build, chunk))
+                if len(pending) >= self.workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def build_batch(self, chunks: List[VoxelChunk], out_mmap_path: Path) -> List[MeshRef]:
         """
-        Build meshes for multiple chunks.
+        Build meshes for multiple chunks, streaming them into one file.
+
+        Each mesh is appended to out_mmap_path as soon as it is built and
+        then dropped, so peak memory stays at roughly one chunk's mesh no
+        matter how many chunks are in the batch. The renderer maps the
+        file back with load_mesh_buffers() and uploads in any order.
 
         Args:
             chunks: List of VoxelChunks to mesh
+            out_mmap_path: File to write packed mesh data to (overwritten)
 
         Returns:
-            List of ChunkMesh instances
+            List of MeshRef (one per non-empty mesh)
+
+        Example:
+            >>> refs = batch.build_batch(world.iter_chunks(), Path("world.mesh"))
+            >>> for ref in refs:
+            ...     positions, indices, materials, normals = load_mesh_buffers("world.mesh", ref)
+            ...     renderer.upload(ref.chunk_coords, positions, indices)
         """
-        meshes = []
-        for chunk in chunks:
-            mesh = self.builder.build(chunk)
-            if not mesh.is_empty():
-                meshes.append(mesh)
-        return meshes
+        refs = []
+        with open(out_mmap_path, 'wb') as out:
+            for mesh in self._iter_meshes(chunks):
+                if mesh.is_empty():
+                    continue
+                refs.append(_append_mesh(out, mesh))
+                del mesh  # Only one chunk's mesh alive at a time
+        return refs
+
+
+def _append_mesh(out, mesh: ChunkMesh) -> MeshRef:
+    """Write one mesh's packed sections to an open file and return its MeshRef."""
+    offsets = []
+    sections = (
+        np.asarray(mesh.vertices, dtype=np.float32).reshape(-1, 3),
+        np.asarray(mesh.indices, dtype=np.uint32),
+        np.asarray(mesh.materials, dtype=np.uint16),
+        np.asarray(mesh.normals, dtype=np.int8).reshape(-1, 3),
+    )
+    for array in sections:
+        # Keep every section 4-byte aligned so memmap views are valid
+        pad = -out.tell() % 4
+        if pad:
+            out.write(b'\0' * pad)
+        offsets.append(out.tell())
+        out.write(array.tobytes())
+
+    return MeshRef(
+        chunk_coords=mesh.chunk_coords,
+        positions_offset=offsets[0],
+        positions_len=len(sections[0]),
+        indices_offset=offsets[1],
+        indices_len=len(sections[1]),
+        materials_offset=offsets[2],
+        materials_len=len(sections[2]),
+        normals_offset=offsets[3],
+    )
+
+
+def load_mesh_buffers(mmap_path: Path, ref: MeshRef) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Map one chunk's mesh out of a batch mesh file without copying.
+
+    Args:
+        mmap_path: File written by BatchMeshBuilder.build_batch()
+        ref: MeshRef returned for the chunk
+
+    Returns:
+        (positions[N,3] float32, indices[M] uint32,
+         materials[T] uint16, normals[T,3] int8) read-only memmap views
+    """
+    def view(dtype, offset, count, shape):
+        return np.memmap(mmap_path, dtype=dtype, mode='r', offset=offset, shape=shape) if count else np.empty(shape, dtype)
+
+    return (
+        view(np.float32, ref.positions_offset, ref.positions_len, (ref.positions_len, 3)),
+        view(np.uint32, ref.indices_offset, ref.indices_len, (ref.indices_len,)),
+        view(np.uint16, ref.materials_offset, ref.materials_len, (ref.materials_len,)),
+        view(np.int8, ref.normals_offset, ref.materials_len, (ref.materials_len, 3)),
+    )
 
 
 # =============================================================================
@@ -350,10 +763,70 @@ def demo_mesh_builder():
     print(f"  Triangles: {mesh2.triangle_count()} (was {mesh.triangle_count()})")
     print()
 
+    # Pooled rebuilds grow the chunk's kernel buffers in place
+    pooled = ChunkMeshBuilder(strategy=MeshingStrategy.NAIVE_CUBES, reuse_buffers=True)
+    first = pooled.build(chunk)
+    chunk.set_voxel(1, 1, 1, material=1)
+    assert pooled.build(chunk).triangle_count() == mesh.triangle_count() != first.triangle_count()
+    chunk.set_voxel(1, 1, 1, material=0)
+    assert pooled.build(chunk).triangle_count() == mesh2.triangle_count()
+    if NATIVE_MESHER_AVAILABLE:
+        scratch = pooled._scratch_pool[chunk.position]
+        assert pooled._scratch(chunk.position, 1) is scratch
+    pooled.release(chunk.position)
+    assert not pooled._scratch_pool
+    for x in range(SCRATCH_POOL_SIZE):
+        pooled._scratch((x, 0, 0), 1)
+    pooled._scratch((0, 0, 0), 1)  # Touch the oldest, so (1, 0, 0) and (2, 0, 0) go next
+    pooled._scratch((-1, 0, 0), 1)
+    pooled._scratch((-2, 0, 0), 1)
+    assert len(pooled._scratch_pool) == SCRATCH_POOL_SIZE
+    assert (0, 0, 0) in pooled._scratch_pool
+    assert (1, 0, 0) not in pooled._scratch_pool and (2, 0, 0) not in pooled._scratch_pool
+    print("Pooled rebuild reused the chunk's kernel buffers")
+    print()
+
+    # Greedy path merges coplanar faces
+    greedy_mesh = ChunkMeshBuilder(strategy=MeshingStrategy.BINARY_GREEDY).build(chunk)
+    assert greedy_mesh.triangle_count() < mesh2.triangle_count()
+    print(f"Binary greedy mesh: {greedy_mesh.triangle_count()} triangles "
+          f"(naive: {mesh2.triangle_count()})")
+    print()
+
+    # Data-parallel path emits the same faces
+    gpu_mesh = ChunkMeshBuilder(strategy=MeshingStrategy.GPU).build(chunk)
+    assert gpu_mesh.triangle_count() == mesh2.triangle_count()
+    print(f"Data-parallel mesh ({'CuPy' if GPU_AVAILABLE else 'NumPy'} backend): "
+          f"{gpu_mesh.triangle_count()} triangles")
+    print()
+
+    # Stream a batch to a mesh file and map it back
+    import tempfile
+    import os
+    print("Streaming batch to mesh file...")
+    far_chunk = VoxelChunk(position=(1, 0, 0))
+    far_chunk.set_voxel(0, 0, 0, material=2)
+    empty_chunk = VoxelChunk(position=(2, 0, 0))
+    with tempfile.TemporaryDirectory() as tmp:
+        mesh_path = os.path.join(tmp, "batch.mesh")
+        refs = BatchMeshBuilder().build_batch([chunk, far_chunk, empty_chunk], mesh_path)
+        assert len(refs) == 2  # Empty chunk skipped
+        positions, indices, materials, normals = load_mesh_buffers(mesh_path, refs[0])
+        assert positions.shape == (mesh2.vertex_count(), 3)
+        assert indices.tolist() == mesh2.indices
+        assert materials.tolist() == mesh2.materials
+        assert [tuple(n) for n in normals.tolist()] == mesh2.normals
+        _, _, far_materials, _ = load_mesh_buffers(mesh_path, refs[1])
+        assert set(far_materials.tolist()) == {2}
+        print(f"  {len(refs)} meshes, {os.path.getsize(mesh_path):,} bytes on disk")
+        del positions, indices, materials, normals, far_materials
+    print()
+
     print("=" * 80)
     print("✓ Mesh builder ready for renderer integration!")
-    print("  - Naive cubes: ✓ Working")
-    print("  - Greedy meshing: TODO (future optimization)")
+    print(f"  - Naive cubes: ✓ Working ({'native' if NATIVE_MESHER_AVAILABLE else 'pure Python'} kernel)")
+    print("  - Data-parallel (GPU strategy): ✓ Working")
+    print("  - Binary greedy meshing: ✓ Working")
     print("  - Renderer-agnostic output")
     print("=" * 80)
 
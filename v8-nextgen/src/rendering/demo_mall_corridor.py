@@ -27,6 +27,7 @@ from dataclasses import dataclass
 sys.path.insert(0, '.')
 from voxel_world import ChunkedVoxelWorld
 from voxel_encoding import CHUNK_SIZE
+from voxel_kernels import enumerate_shell, shell_counts
 from voxel_world_monitor import VoxelWorldMonitor
 
 # =============================================================================
@@ -43,7 +44,7 @@ MAT_FOOTPRINT = 4
 # SIMPLE NPC
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SimpleNPC:
     """Minimal NPC for demo - just position and velocity."""
     id: int
@@ -92,31 +93,21 @@ def build_corridor_geometry(world: ChunkedVoxelWorld, length_chunks: int = 4) ->
     width = 10  # 10 voxels wide
     height = 6  # 6 voxels tall
 
+    # Floor (y=0), walls (z=0 and z=width-1, y=1 to height-1), ceiling
+    # (y=height-1): enumerated in one batch and written chunk by chunk
+    xyz, materials = enumerate_shell(
+        0, length_voxels, 0, height - 1, 1, height, 0, width,
+        MAT_FLOOR, MAT_WALL, MAT_CEILING,
+    )
+    world.set_voxels_bulk(xyz[:, 0], xyz[:, 1], xyz[:, 2], materials)
+
+    floor, walls, ceiling = shell_counts(length_voxels, width, 1, height)
     stats = {
-        'floor_voxels': 0,
-        'wall_voxels': 0,
-        'ceiling_voxels': 0,
+        'floor_voxels': floor,
+        'wall_voxels': walls,
+        'ceiling_voxels': ceiling,
     }
 
-    # Floor (y=0)
-    for x in range(length_voxels):
-        for z in range(width):
-            world.set_voxel(x, 0, z, MAT_FLOOR)
-            stats['floor_voxels'] += 1
-
-    # Walls (z=0 and z=width-1, y=1 to height-1)
-    for x in range(length_voxels):
-        for y in range(1, height):
-            world.set_voxel(x, y, 0, MAT_WALL)  # Left wall
-            world.set_voxel(x, y, width - 1, MAT_WALL)  # Right wall
-            stats['wall_voxels'] += 2
-
-    # Ceiling (y=height-1)
-    for x in range(length_voxels):
-        for z in range(width):
-            world.set_voxel(x, height - 1, z, MAT_CEILING)
-            stats['ceiling_voxels'] += 1
-
     total = stats['floor_voxels'] + stats['wall_voxels'] + stats['ceiling_voxels']
     print(f"  ✓ Built corridor: {total:,} voxels")
     print(f"    - Floor: {stats['floor_voxels']:,}")
@@ -297,15 +288,11 @@ def run_demo(ticks: int = 20, corridor_length: int = 4, use_monitor: bool = True
 
     # Query footprint region (Responsibility #7)
     print("Footprint analysis (region query):")
-    footprint_count = 0
-    for x, y, z, material in world.iter_voxels():
-        if material == MAT_FOOTPRINT:
-            footprint_count += 1
+    footprint_count = world.count_material(MAT_FOOTPRINT)
     print(f"  - Total footprints in world: {footprint_count}")
 
     # Query specific region
-    region_voxels = list(world.iter_region(0, 50, 0, 0, 0, 10))
-    footprints_in_region = sum(1 for _, _, _, mat in region_voxels if mat == MAT_FOOTPRINT)
+    footprints_in_region = world.count_material_in_region(0, 50, 0, 0, 0, 10, MAT_FOOTPRINT)
     print(f"  - Footprints in first 50 voxels: {footprints_in_region}")
     print()
 
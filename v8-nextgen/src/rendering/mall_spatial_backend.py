@@ -29,10 +29,22 @@ from dataclasses import dataclass
 from enum import Enum
 import sys
 
+import numpy as np
+
 # Import voxel system
 sys.path.insert(0, '.')
 from voxel_world_manager import VoxelWorldManager, VoxelWorldConfig
-from chunk_mesh_builder import ChunkMeshBuilder, MeshingStrategy
+from chunk_mesh_builder import ChunkMesh, ChunkMeshBuilder, MeshingStrategy
+from voxel_chunk import VoxelChunk
+from voxel_encoding import CHUNK_SIZE, CHUNK_VOLUME
+from voxel_kernels import shell_counts
+
+# Edits covering less than this fraction of a chunk are patched into the
+# cached mesh instead of re-meshing the whole chunk
+INCREMENTAL_REMESH_LIMIT = 0.10
+
+# Edit box standing in for edits whose bounds were drained by another consumer
+FULL_CHUNK_AABB = [0, 0, 0, CHUNK_SIZE - 1, CHUNK_SIZE - 1, CHUNK_SIZE - 1]
 
 
 # =============================================================================
@@ -52,7 +64,7 @@ class EventType(Enum):
 # ZONE GEOMETRY (Bootstrap)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ZoneGeometrySpec:
     """Specification for zone geometry."""
     zone_id: str
@@ -97,7 +109,16 @@ class MallSpatialBackend:
             config: Optional VoxelWorldConfig (uses defaults if not provided)
         """
         self.world = VoxelWorldManager(config)
-        self.mesh_builder = ChunkMeshBuilder(strategy=MeshingStrategy.NAIVE_CUBES)
+        self.mesh_builder = ChunkMeshBuilder(strategy=MeshingStrategy.BINARY_GREEDY)
+
+        # Mesh cache: last mesh + packed quads per chunk, keyed to the chunk
+        # object and generation they were built from, plus edits not yet meshed
+        self._mesh_cache: Dict[Tuple[int, int, int], Tuple[VoxelChunk, int, ChunkMesh, Any]] = {}
+        self._chunk_dirty_aabb: Dict[Tuple[int, int, int], List[int]] = {}
+        self._seen_edits: Dict[Tuple[int, int, int], int] = {}  # world.edit_counts already folded in
+
+        # DeltaBus events queued for the end-of-tick batch
+        self._pending_events: List[Dict[str, Any]] = []
 
         # Material IDs (can be configured)
         self.MAT_AIR = 0
@@ -127,28 +148,14 @@ class MallSpatialBackend:
         Example:
             >>> backend.build_corridor(length=128, width=10, height=6)
         """
-        stats = {'floor': 0, 'walls': 0, 'ceiling': 0}
-
-        # Floor (y=0)
-        for x in range(length):
-            for z in range(width):
-                self.world.set_voxel(x + x_offset, y_offset, z + z_offset, self.MAT_FLOOR)
-                stats['floor'] += 1
-
-        # Walls (z=0 and z=width-1)
-        for x in range(length):
-            for y in range(1, height):
-                self.world.set_voxel(x + x_offset, y + y_offset, z_offset, self.MAT_WALL)
-                self.world.set_voxel(x + x_offset, y + y_offset, width - 1 + z_offset, self.MAT_WALL)
-                stats['walls'] += 2
-
-        # Ceiling (y=height-1)
-        for x in range(length):
-            for z in range(width):
-                self.world.set_voxel(x + x_offset, height - 1 + y_offset, z + z_offset, self.MAT_CEILING)
-                stats['ceiling'] += 1
-
-        return stats
+        floor, walls, ceiling = self._fill_shell(
+            x_offset, length,
+            y_offset, height - 1 + y_offset,
+            1 + y_offset, height + y_offset,
+            z_offset, width,
+            self.MAT_FLOOR, self.MAT_WALL, self.MAT_CEILING,
+        )
+        return {'floor': floor, 'walls': walls, 'ceiling': ceiling}
 
     def build_zone_geometry(self, zone_id: str, geometry_spec: ZoneGeometrySpec) -> int:
         """
@@ -169,28 +176,34 @@ class MallSpatialBackend:
             >>> backend.build_zone_geometry("food_court", spec)
         """
         x_min, x_max, y_min, y_max, z_min, z_max = geometry_spec.bounds
-        count = 0
-
-        # Floor
-        for x in range(x_min, x_max + 1):
-            for z in range(z_min, z_max + 1):
-                self.world.set_voxel(x, y_min, z, geometry_spec.floor_material)
-                count += 1
-
-        # Walls (simplified)
-        for x in range(x_min, x_max + 1):
-            for y in range(y_min + 1, y_max):
-                self.world.set_voxel(x, y, z_min, geometry_spec.wall_material)
-                self.world.set_voxel(x, y, z_max, geometry_spec.wall_material)
-                count += 2
+        # Walls (simplified) stop below the ceiling
+        return sum(self._fill_shell(
+            x_min, x_max - x_min + 1,
+            y_min, y_max,
+            y_min + 1, y_max,
+            z_min, z_max - z_min + 1,
+            geometry_spec.floor_material, geometry_spec.wall_material, geometry_spec.ceiling_material,
+        ))
+
+    def _fill_shell(self, x0, length, y_floor, y_ceiling, wall_y0, wall_y1, z0, width,
+                    mat_floor, mat_wall, mat_ceiling) -> Tuple[int, int, int]:
+        """
+        Place a floor/walls/ceiling shell as four box fills.
 
-        # Ceiling
-        for x in range(x_min, x_max + 1):
-            for z in range(z_min, z_max + 1):
-                self.world.set_voxel(x, y_max, z, geometry_spec.ceiling_material)
-                count += 1
+        Each slab is split into chunk tiles and written with one slice
+        assignment per chunk. Slabs go in floor, walls, ceiling order, so
+        overlaps resolve as in voxel_kernels.enumerate_shell.
 
-        return count
+        Returns:
+            Voxels placed as (floor, walls, ceiling)
+        """
+        if length > 0 and width > 0:
+            x1, z1 = x0 + length - 1, z0 + width - 1
+            self.world.fill_aabb(x0, x1, y_floor, y_floor, z0, z1, mat_floor)
+            self.world.fill_aabb(x0, x1, wall_y0, wall_y1 - 1, z0, z0, mat_wall)
+            self.world.fill_aabb(x0, x1, wall_y0, wall_y1 - 1, z1, z1, mat_wall)
+            self.world.fill_aabb(x0, x1, y_ceiling, y_ceiling, z0, z1, mat_ceiling)
+        return shell_counts(length, width, wall_y0, wall_y1)
 
     # =========================================================================
     # 2. SIM → GEOMETRY (DeltaBus Events)
@@ -217,6 +230,34 @@ class MallSpatialBackend:
         """
         return self.world.handle_deltabus_event(delta_event)
 
+    def queue_voxel_event(self, delta_event: Dict[str, Any]) -> None:
+        """
+        Buffer a DeltaBus event until the end of the tick.
+
+        Queued events are applied together by flush_voxel_events (called
+        from on_frame_end and get_dirty_chunks_for_render), so a busy tick
+        writes each chunk once instead of once per event. Use
+        apply_voxel_event when the change must be visible immediately.
+
+        Example:
+            >>> for event in tick_events:
+            ...     backend.queue_voxel_event(event)
+            >>> backend.on_frame_end()  # Applies the batch
+        """
+        self._pending_events.append(delta_event)
+
+    def flush_voxel_events(self) -> int:
+        """
+        Apply all queued DeltaBus events in one bulk write.
+
+        Returns:
+            Number of voxels changed
+        """
+        if not self._pending_events:
+            return 0
+        events, self._pending_events = self._pending_events, []
+        return self.world.handle_deltabus_events(events)
+
     def apply_footprint(self, x: int, y: int, z: int, size: int = 1) -> int:
         """
         Apply NPC footprint (high-level semantic call).
@@ -284,6 +325,18 @@ class MallSpatialBackend:
         """
         return self.world.query_region(x_min, x_max, y_min, y_max, z_min, z_max)
 
+    def query_region_soa(self, x_min: int, x_max: int, y_min: int, y_max: int, z_min: int, z_max: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Query voxels in region as columns (xs, ys, zs, materials).
+
+        Prefer this over query_region for large regions: 4 arrays instead
+        of one Python tuple per voxel.
+
+        Example:
+            >>> xs, ys, zs, mats = backend.query_region_soa(0, 100, 0, 10, 0, 100)
+        """
+        return self.world.query_region_soa(x_min, x_max, y_min, y_max, z_min, z_max)
+
     def query_crowd_density(self, x_min: int, x_max: int, y_min: int, y_max: int, z_min: int, z_max: int) -> int:
         """
         Query crowd density (count footprints in region).
@@ -347,12 +400,43 @@ class MallSpatialBackend:
             ...     mesh = backend.build_mesh(chunk_coords)
             ...     renderer.upload(chunk_coords, mesh)
         """
+        self._sync_for_render()
         return self.world.get_render_chunks()
 
+    def get_dirty_chunk_array_for_render(self) -> np.ndarray:
+        """
+        get_dirty_chunks_for_render as an int32[N, 3] array.
+
+        The array is reused by the next call (see
+        VoxelWorldManager.get_render_chunk_array).
+
+        Example:
+            >>> dirty = backend.get_dirty_chunk_array_for_render()
+            >>> for chunk_coords in map(tuple, dirty.tolist()):
+            ...     renderer.upload(chunk_coords, backend.build_mesh(chunk_coords))
+        """
+        self._sync_for_render()
+        return self.world.get_render_chunk_array()
+
+    def _sync_for_render(self) -> None:
+        """Apply queued events, keep edit bounds before the manager clears them, drop unloaded chunks."""
+        self.flush_voxel_events()
+        world = self.world.get_world()
+        for chunk_coords in world.dirty_bounds:
+            self._absorb_world_edits(world, chunk_coords)
+        tracked = self._mesh_cache.keys() | self._chunk_dirty_aabb.keys() | self._seen_edits.keys()
+        for chunk_coords in tracked - world.chunks.keys():
+            self._evict_mesh(chunk_coords)
+
     def build_mesh(self, chunk_coords: Tuple[int, int, int]):
         """
         Build mesh for chunk (for renderer).
 
+        Meshes are cached per chunk: an unchanged chunk returns its cached
+        mesh, and small edits are patched in via incremental_remesh. Edits
+        whose dirty bounds another consumer drained first (world.edit_counts
+        moved on without them) force a full re-mesh.
+
         Args:
             chunk_coords: Chunk coordinates
 
@@ -364,10 +448,85 @@ class MallSpatialBackend:
             >>> if mesh:
             ...     renderer.upload(mesh.vertices, mesh.indices)
         """
-        chunk = self.world.get_world().get_chunk(*chunk_coords)
+        world = self.world.get_world()
+        chunk = world.get_chunk(*chunk_coords)
         if chunk is None:
+            self._evict_mesh(chunk_coords)
             return None
-        return self.mesh_builder.build(chunk)
+
+        self._absorb_world_edits(world, chunk_coords)
+        dirty = self._chunk_dirty_aabb.pop(chunk_coords, None)
+
+        cached = self._cached_mesh(chunk)
+        if cached is not None and dirty is None:
+            return cached[2]
+        return self.incremental_remesh(chunk, dirty)
+
+    def incremental_remesh(self, chunk: VoxelChunk, dirty_voxel_aabb: Optional[List[int]]) -> ChunkMesh:
+        """
+        Re-mesh a chunk, reusing cached quads outside the edited AABB.
+
+        Falls back to a full re-mesh when there is no cached mesh for this
+        chunk object, no known edit bounds, or the edits cover at least
+        INCREMENTAL_REMESH_LIMIT of the chunk.
+
+        Args:
+            chunk: VoxelChunk to mesh
+            dirty_voxel_aabb: Local [x0, y0, z0, x1, y1, z1] edited since last mesh
+
+        Returns:
+            ChunkMesh (also stored in the cache)
+        """
+        cached = self._cached_mesh(chunk)
+        previous = cached[3] if cached is not None else None
+
+        if previous is not None and dirty_voxel_aabb is not None:
+            x0, y0, z0, x1, y1, z1 = dirty_voxel_aabb
+            if (x1 - x0 + 1) * (y1 - y0 + 1) * (z1 - z0 + 1) >= INCREMENTAL_REMESH_LIMIT * CHUNK_VOLUME:
+                previous = None  # Large edit - full re-mesh is cheaper
+
+        quads = self.mesh_builder.build_quads(chunk, previous, dirty_voxel_aabb)
+        mesh = self.mesh_builder.mesh_from_quads(chunk.position, quads)
+        self._mesh_cache[chunk.position] = (chunk, chunk.generation, mesh, quads)
+        return mesh
+
+    def _cached_mesh(self, chunk: VoxelChunk) -> Optional[Tuple[VoxelChunk, int, ChunkMesh, Any]]:
+        """Cache entry for a chunk, or None if it was built from another chunk or generation."""
+        cached = self._mesh_cache.get(chunk.position)
+        if cached is None or cached[0] is not chunk or cached[1] != chunk.generation:
+            return None  # Pooled chunks are reset in place and reused
+        return cached
+
+    def _evict_mesh(self, chunk_coords: Tuple[int, int, int]) -> None:
+        """Forget the cached mesh, pending edits and builder buffers of an unloaded chunk."""
+        self.mesh_builder.release(chunk_coords)
+        self._mesh_cache.pop(chunk_coords, None)
+        self._chunk_dirty_aabb.pop(chunk_coords, None)
+        self._seen_edits.pop(chunk_coords, None)
+
+    def _absorb_world_edits(self, world, chunk_coords: Tuple[int, int, int]) -> None:
+        """Fold a chunk's unseen world edits into its pending AABB."""
+        edits = world.edit_counts.get(chunk_coords, 0)
+        seen = self._seen_edits.get(chunk_coords, 0)
+        if edits == seen:
+            return
+        self._seen_edits[chunk_coords] = edits
+        if world.dirty_since.get(chunk_coords, edits + 1) > seen + 1:
+            bounds = FULL_CHUNK_AABB  # Some edits were drained before we saw their bounds
+        else:
+            bounds = world.dirty_bounds[chunk_coords]
+        self._absorb_dirty_bounds(chunk_coords, bounds)
+
+    def _absorb_dirty_bounds(self, chunk_coords: Tuple[int, int, int], bounds: List[int]) -> None:
+        """Union a world dirty AABB into the pending edits for a chunk."""
+        pending = self._chunk_dirty_aabb.get(chunk_coords)
+        if pending is None:
+            self._chunk_dirty_aabb[chunk_coords] = list(bounds)
+        else:
+            self._chunk_dirty_aabb[chunk_coords] = (
+                [min(a, b) for a, b in zip(pending[:3], bounds[:3])] +
+                [max(a, b) for a, b in zip(pending[3:], bounds[3:])]
+            )
 
     # =========================================================================
     # 5. FRAME LIFECYCLE (Integration with Mall_OS Tick)
@@ -393,6 +552,7 @@ class MallSpatialBackend:
         Example:
             >>> backend.on_frame_end()
         """
+        self.flush_voxel_events()
         self.world.on_frame_end()
 
     def get_stats(self) -> Dict[str, Any]:
@@ -449,6 +609,13 @@ def demo_integration():
     print("-" * 80)
     changed = backend.apply_cloak_ripple(50, 0, 5, radius=3)
     print(f"  Cloak activated at (50, 0, 5): {changed} voxels rippled")
+
+    # Busy tick: queue events and apply them as one batch
+    for x in range(80, 120, 4):
+        backend.queue_voxel_event({'kind': 'FOOTSTEP', 'payload': {'x': x, 'y': 0, 'z': 3}})
+    changed = backend.flush_voxel_events()
+    assert backend.world.get_voxel(80, 0, 3) == backend.MAT_FOOTPRINT
+    print(f"  Batched 10 queued footsteps: {changed} voxels in one write")
     print()
 
     # 4. Geometry → Sim: Crowd density query (Rust Bram)
@@ -478,6 +645,17 @@ def demo_integration():
     print(f"  Dirty chunks: {len(dirty)} need re-mesh")
     for chunk_coords in dirty[:3]:  # Show first 3
         print(f"    - Chunk {chunk_coords}")
+    meshes = {coords: backend.build_mesh(coords) for coords in dirty}
+    print(f"  Meshed {sum(m.triangle_count() for m in meshes.values()):,} triangles")
+
+    # Next frame: one footprint only patches its chunk's cached mesh
+    backend.apply_footprint(70, 0, 5)
+    redirty = backend.get_dirty_chunk_array_for_render()
+    for chunk_coords in map(tuple, redirty.tolist()):
+        patched = backend.build_mesh(chunk_coords)
+        full = ChunkMeshBuilder(MeshingStrategy.BINARY_GREEDY).build(backend.world.get_world().get_chunk(*chunk_coords))
+        assert patched.triangle_count() >= full.triangle_count() > 0  # Patch may merge less
+    print(f"  Footprint at (70, 0, 5): patched {len(redirty)} cached mesh(es)")
     print()
 
     # Stats
@@ -498,5 +676,78 @@ def demo_integration():
     print("=" * 80)
 
 
+def validate_recycled_chunk_meshes():
+    """Pooled chunks reused at the same coordinates must not patch their old mesh."""
+    print("Validating meshes of recycled chunks...")
+    fresh = ChunkMeshBuilder(MeshingStrategy.BINARY_GREEDY)
+
+    # Carve a chunk empty (pooled), then write one voxel (recycled in place)
+    backend = MallSpatialBackend()
+    world = backend.world.get_world()
+    world.fill_aabb(0, 31, 0, 0, 0, 31, 1)
+    backend.build_mesh((0, 0, 0))
+    world.fill_aabb(0, 31, 0, 0, 0, 31, 0)
+    world.set_voxel(5, 5, 5, 2)
+    mesh = backend.build_mesh((0, 0, 0))
+    assert mesh.triangle_count() == fresh.build(world.get_chunk(0, 0, 0)).triangle_count()
+    print(f"  ✓ carve → recycle: {mesh.triangle_count()} triangles (full re-mesh)")
+
+    # Unload far chunks, then reload the same position
+    world.fill_aabb(0, 31, 0, 0, 0, 31, 1)
+    backend.build_mesh((0, 0, 0))
+    assert world.unload_far_chunks(10_000, 0, 0, 1) == 1
+    world.set_voxel(5, 5, 5, 2)
+    mesh = backend.build_mesh((0, 0, 0))
+    assert mesh.triangle_count() == fresh.build(world.get_chunk(0, 0, 0)).triangle_count()
+    print(f"  ✓ unload → reload: {mesh.triangle_count()} triangles (full re-mesh)")
+
+
+def validate_drained_edits_remesh():
+    """Edits whose dirty bounds another consumer drained still reach the mesh."""
+    print("Validating meshes after foreign dirty drains...")
+    fresh = ChunkMeshBuilder(MeshingStrategy.BINARY_GREEDY)
+    backend = MallSpatialBackend()
+    world = backend.world.get_world()
+    world.fill_aabb(0, 31, 0, 0, 0, 31, 1)
+    backend.build_mesh((0, 0, 0))
+
+    world.set_voxel(5, 5, 5, 2)
+    world.clear_dirty_chunks()  # e.g. VoxelWorldMonitor.on_tick_end
+    mesh = backend.build_mesh((0, 0, 0))
+    assert mesh.vertex_count() == fresh.build(world.get_chunk(0, 0, 0)).vertex_count()
+    print(f"  ✓ Fully drained edit: {mesh.vertex_count()} vertices")
+
+    world.set_voxel(20, 5, 20, 3)
+    world.clear_dirty_chunks()
+    world.set_voxel(9, 1, 9, 3)  # Bounds only cover this edit
+    mesh = backend.build_mesh((0, 0, 0))
+    assert mesh.vertex_count() == fresh.build(world.get_chunk(0, 0, 0)).vertex_count()
+    assert backend.build_mesh((0, 0, 0)) is mesh  # Unchanged chunk hits the cache
+    print(f"  ✓ Partly drained edits: {mesh.vertex_count()} vertices")
+
+
+def validate_mesh_cache_eviction():
+    """Meshes of chunks that stream out are evicted, not kept until rebuilt."""
+    print("Validating mesh cache eviction...")
+    backend = MallSpatialBackend()
+    world = backend.world.get_world()
+    for frame in range(40):
+        world.set_voxel(frame * CHUNK_SIZE, 0, 0, 1)  # Walk one chunk per frame
+        for chunk_coords in backend.get_dirty_chunks_for_render():
+            backend.build_mesh(chunk_coords)
+        world.unload_far_chunks(frame * CHUNK_SIZE, 0, 0, 2)
+    backend.get_dirty_chunks_for_render()
+    loaded = world.chunks.keys()
+    assert backend._mesh_cache.keys() <= loaded and backend._chunk_dirty_aabb.keys() <= loaded
+    assert backend.mesh_builder._scratch_pool.keys() <= loaded
+    print(f"  ✓ 40 frames streamed: {len(backend._mesh_cache)} cached meshes for {len(loaded)} loaded chunks")
+
+
 if __name__ == "__main__":
     demo_integration()
+    print()
+    validate_recycled_chunk_meshes()
+    print()
+    validate_drained_edits_remesh()
+    print()
+    validate_mesh_cache_eviction()
@@ -0,0 +1,200 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+mesher_c - Native kernels for chunk meshing
+
+Optional Cython build of the meshers' inner loops:
+  - build_naive_mesh: ChunkMeshBuilder._build_naive_cubes
+  - merge_planes: binary_greedy_mesh._merge_plane over a stack of planes
+Compiled on first import through pyximport by binary_greedy_mesh.py,
+the only module that imports it (chunk_mesh_builder.py reuses
+binary_greedy_mesh.mesher_c); when Cython is not installed the
+pure-Python paths are used instead.
+
+Input is a zero-padded dense chunk, so every neighbor test is a direct
+memoryview index with no bounds branch. The loop runs without the GIL,
+which lets BatchMeshBuilder mesh chunks on a thread pool.
+"""
+
+from libc.stdint cimport uint8_t, uint16_t, uint32_t, uint64_t
+
+# Count trailing zeros of a nonzero 64-bit word: the GCC/Clang builtin, or
+# _BitScanForward64 under MSVC, which has no __builtin_ctzll
+cdef extern from *:
+    """
+    #if defined(_MSC_VER)
+    #include <intrin.h>
+    static __inline int mesher_ctz64(unsigned long long v) {
+        unsigned long index;
+        _BitScanForward64(&index, v);
+        return (int)index;
+    }
+    #else
+    #define mesher_ctz64(v) __builtin_ctzll(v)
+    #endif
+    """
+    int mesher_ctz64(unsigned long long) nogil
+
+# Face table in the same order as chunk_mesh_builder.FACES:
+# +Y, -Y, +X, -X, +Z, -Z. Each face has a normal and 4 corner offsets.
+cdef int FACE_NORMALS[18]
+FACE_NORMALS[:] = [
+    0, 1, 0,
+    0, -1, 0,
+    1, 0, 0,
+    -1, 0, 0,
+    0, 0, 1,
+    0, 0, -1,
+]
+
+cdef int FACE_CORNERS[72]
+FACE_CORNERS[:] = [
+    0, 1, 0,  1, 1, 0,  1, 1, 1,  0, 1, 1,   # Top (+Y)
+    0, 0, 0,  0, 0, 1,  1, 0, 1,  1, 0, 0,   # Bottom (-Y)
+    1, 0, 0,  1, 0, 1,  1, 1, 1,  1, 1, 0,   # Right (+X)
+    0, 0, 0,  0, 1, 0,  0, 1, 1,  0, 0, 1,   # Left (-X)
+    0, 0, 1,  0, 1, 1,  1, 1, 1,  1, 0, 1,   # Front (+Z)
+    0, 0, 0,  1, 0, 0,  1, 1, 0,  0, 1, 0,   # Back (-Z)
+]
+
+
+cdef Py_ssize_t _mesh(
+    const uint8_t[:, :, :] voxels,
+    float[:, :] out_pos,
+    uint32_t[:] out_idx,
+    uint16_t[:] out_mat,
+    uint8_t[:] out_norm,
+) noexcept nogil:
+    cdef Py_ssize_t size = voxels.shape[0] - 2
+    cdef Py_ssize_t faces = 0
+    cdef Py_ssize_t x, y, z, v, base
+    cdef int f, c
+    cdef uint8_t material
+
+    for x in range(size):
+        for y in range(size):
+            for z in range(size):
+                material = voxels[x + 1, y + 1, z + 1]
+                if material == 0:
+                    continue
+
+                for f in range(6):
+                    if voxels[x + 1 + FACE_NORMALS[f * 3],
+                              y + 1 + FACE_NORMALS[f * 3 + 1],
+                              z + 1 + FACE_NORMALS[f * 3 + 2]] != 0:
+                        continue  # Neighbor solid - face hidden
+
+                    v = faces * 4
+                    for c in range(4):
+                        base = f * 12 + c * 3
+                        out_pos[v + c, 0] = x + FACE_CORNERS[base]
+                        out_pos[v + c, 1] = y + FACE_CORNERS[base + 1]
+                        out_pos[v + c, 2] = z + FACE_CORNERS[base + 2]
+
+                    out_idx[faces * 6 + 0] = v
+                    out_idx[faces * 6 + 1] = v + 1
+                    out_idx[faces * 6 + 2] = v + 2
+                    out_idx[faces * 6 + 3] = v
+                    out_idx[faces * 6 + 4] = v + 2
+                    out_idx[faces * 6 + 5] = v + 3
+
+                    out_mat[faces * 2] = material
+                    out_mat[faces * 2 + 1] = material
+                    out_norm[faces * 2] = f
+                    out_norm[faces * 2 + 1] = f
+
+                    faces += 1
+
+    return faces
+
+
+def build_naive_mesh(
+    const uint8_t[:, :, :] voxels,
+    float[:, :] out_pos,
+    uint32_t[:] out_idx,
+    uint16_t[:] out_mat,
+    uint8_t[:] out_norm,
+):
+    """
+    Emit exposed cube faces for a padded dense chunk.
+
+    Args:
+        voxels: uint8[CS+2, CS+2, CS+2], voxel (x,y,z) stored at [x+1, y+1, z+1]
+        out_pos: float32[4 * max_faces, 3] vertex positions
+        out_idx: uint32[6 * max_faces] triangle indices
+        out_mat: uint16[2 * max_faces] per-triangle material
+        out_norm: uint8[2 * max_faces] per-triangle face index (FACES order)
+
+    Returns:
+        Number of faces written
+    """
+    cdef Py_ssize_t faces
+    with nogil:
+        faces = _mesh(voxels, out_pos, out_idx, out_mat, out_norm)
+    return faces
+
+
+cdef Py_ssize_t _merge(
+    uint64_t[:, ::1] planes,
+    int axis, int u_axis, int v_axis,
+    uint64_t tag,
+    uint64_t[::1] out,
+) noexcept nogil:
+    cdef Py_ssize_t layers = planes.shape[0]
+    cdef Py_ssize_t size = planes.shape[1]
+    cdef Py_ssize_t count = 0
+    cdef Py_ssize_t k, i, h
+    cdef uint64_t row, run
+    cdef int j, w
+    cdef uint64_t origin[3]
+
+    for k in range(layers):
+        for i in range(size):
+            row = planes[k, i]
+            while row:
+                j = mesher_ctz64(row)                     # First set bit
+                w = mesher_ctz64(~(row >> j))             # Run of ones (rows are 32 bits, so never all ones)
+                run = ((<uint64_t>1 << w) - 1) << j
+
+                h = 1
+                while i + h < size and (planes[k, i + h] & run) == run:
+                    planes[k, i + h] &= ~run
+                    h += 1
+
+                row &= ~run
+                origin[axis] = k
+                origin[u_axis] = i
+                origin[v_axis] = j
+                out[count] = (tag | (<uint64_t>h << 24) | (<uint64_t>w << 18)
+                              | (origin[2] << 12) | (origin[1] << 6) | origin[0])
+                count += 1
+
+    return count
+
+
+def merge_planes(
+    uint64_t[:, ::1] planes,
+    int axis, int u_axis, int v_axis,
+    int material, int face,
+    uint64_t[::1] out,
+):
+    """
+    Greedy-merge a stack of bit-planes into packed quads.
+
+    Same quads, in the same order, as calling binary_greedy_mesh._merge_plane
+    on planes[k] for k = 0, 1, ... Rows are consumed in place.
+
+    Args:
+        planes: uint64[layers, CS] plane rows; planes[k, i] bit j is the face
+                at origin[axis] = k, origin[u_axis] = i, origin[v_axis] = j
+        axis, u_axis, v_axis: Normal and in-plane axes (0=x, 1=y, 2=z)
+        material, face: Packed into every quad
+        out: uint64 buffer with room for one quad per set bit
+
+    Returns:
+        Number of quads written
+    """
+    cdef uint64_t tag = (<uint64_t>face << 40) | (<uint64_t>material << 32)
+    cdef Py_ssize_t count
+    with nogil:
+        count = _merge(planes, axis, u_axis, v_axis, tag, out)
+    return count
@@ -4,30 +4,75 @@ VoxelChunk - Sparse 32³ Chunk Storage
 
 Based on Biomes' voxeloo/tensors sparse chunk system.
 Uses position encoding for memory-efficient sparse voxel storage.
+Chunks that fill up past DENSE_THRESHOLD voxels switch to a flat
+uint8 array (1 byte/voxel) indexed by the same encoded position.
+
+Coordinate range checks on the public accessors are asserts; run
+release builds with `python -O` to drop them from the voxel hot path.
 
 Reference:
   - biomes-game/voxeloo/tensors/sparse.hpp:44-73
   - See: v8-nextgen/reference/biomes/voxel_math/sparse.hpp
 """
 
-from typing import Dict, Optional, Tuple, Iterator
-from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple, Iterator
+from dataclasses import dataclass, field
+import copy
+from functools import lru_cache
 import sys
 
+import numpy as np
+
 # Import encoding utilities
 from voxel_encoding import (
     CHUNK_SIZE,
     CHUNK_VOLUME,
-    encode_tensor_pos,
-    decode_tensor_pos,
+    encode_tensor_pos_batch,
+    decode_tensor_pos_batch,
 )
+from voxel_kernels import nonair_columns, region_columns
+
+# Sparse dict → dense array promotion point (~1.6% full). A dict entry
+# costs ~68 bytes (hash table slot plus the int key object), so past ~480
+# entries the 32 KB dense array (1 byte/voxel) is the smaller layout.
+DENSE_THRESHOLD = 512
+
+# Dense → sparse demotion point (~0.8% full), where the dict is back under
+# half the dense array. Half of DENSE_THRESHOLD, so a chunk near the
+# promotion point doesn't switch layouts on every edit.
+SPARSE_THRESHOLD = DENSE_THRESHOLD // 2
+
+# Material IDs are uint8 (dense storage, 256-bin histogram). Every valid ID
+# is one of CPython's cached small ints (0-256), so sparse dict values share
+# those objects and never allocate a PyLong per voxel.
+MAX_MATERIAL = 255
+
+# Position tuple estimate (3 ints) counted in memory_usage
+POSITION_BYTES = 24
+
+# Sparse dict entry estimate (key + value) counted in memory_usage
+SPARSE_ENTRY_BYTES = 8
+
+
+@lru_cache(maxsize=64)
+def _box_offsets(size_y: int, size_z: int, size_x: int) -> np.ndarray:
+    """
+    Encoded offsets of every voxel in a box, relative to its min corner.
+
+    Cached per shape: corridors, stamps and slabs reuse a few box sizes,
+    so a fill is one add onto the encoded min corner. Read-only.
+    """
+    ys, zs, xs = np.ogrid[0:size_y, 0:size_z, 0:size_x]
+    offsets = encode_tensor_pos_batch(xs, ys, zs).ravel()
+    offsets.flags.writeable = False
+    return offsets
 
 
 # =============================================================================
 # VOXEL CHUNK (Stage 1: Basic Storage)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class VoxelChunk:
     """
     32³ sparse voxel chunk with encoded position storage.
@@ -36,11 +81,18 @@ class VoxelChunk:
 
     Only stores non-air voxels (air = material_id 0).
     Uses bit-packed position encoding for 66.7% memory savings.
+    Promotes itself to dense storage once it holds DENSE_THRESHOLD voxels,
+    and demotes back to sparse when it drops below SPARSE_THRESHOLD.
 
     Attributes:
         position: Chunk coordinates (cx, cy, cz) in world space
         data: Sparse dict {encoded_pos: material_id}
-              Only non-zero materials stored
+              Only non-zero materials stored (None once dense)
+        dense: uint8[CHUNK_VOLUME] indexed by encoded_pos (None while sparse)
+        material_counts: int32[256] voxels per material ID ([0] counts air)
+
+    Storage is copy-on-write after clone(): mutators call _own_storage()
+    before writing in place.
 
     Example:
         >>> chunk = VoxelChunk(position=(0, 0, 0))
@@ -52,12 +104,67 @@ class VoxelChunk:
     """
 
     position: Tuple[int, int, int]  # Chunk coordinates (cx, cy, cz)
-    data: Dict[int, int] = None     # {encoded_pos: material_id}
+    data: Optional[Dict[int, int]] = None   # {encoded_pos: material_id}
+    dense: Optional[np.ndarray] = None      # uint8[CHUNK_VOLUME] once promoted
+    material_counts: np.ndarray = field(default=None, init=False, repr=False, compare=False)
+    _shared: bool = field(default=False, init=False, repr=False, compare=False)  # Storage shared with a clone
+    generation: int = field(default=0, init=False, repr=False, compare=False)  # Bumped by reset() (pool reuse)
 
     def __post_init__(self):
         """Initialize sparse storage."""
-        if self.data is None:
+        if self.dense is not None:
+            self.data = None
+        elif self.data is None:
             self.data = {}
+        self._recount_materials()
+
+    @classmethod
+    def from_dense(cls, position: Tuple[int, int, int], dense: np.ndarray) -> 'VoxelChunk':
+        """
+        Wrap a uint8[CHUNK_VOLUME] array, demoting to sparse if mostly air.
+
+        The array is adopted, not copied.
+        """
+        chunk = cls(position=position, dense=dense)
+        chunk._demote_if_sparse()
+        return chunk
+
+    def _recount_materials(self) -> None:
+        """Rebuild the material histogram from storage (after bulk edits)."""
+        if self.dense is not None:
+            self.material_counts = np.bincount(self.dense, minlength=256).astype(np.int32)
+            return
+        count = len(self.data)
+        counts = np.bincount(np.fromiter(self.data.values(), dtype=np.uint8, count=count), minlength=256)
+        counts[0] = CHUNK_VOLUME - count
+        self.material_counts = counts.astype(np.int32)
+
+    def _promote_to_dense(self) -> None:
+        """Move sparse entries into a flat uint8 array."""
+        dense = np.zeros(CHUNK_VOLUME, dtype=np.uint8)
+        count = len(self.data)
+        dense[np.fromiter(self.data.keys(), dtype=np.int64, count=count)] = \
+            np.fromiter(self.data.values(), dtype=np.uint8, count=count)
+        self.dense = dense
+        self.data = None
+        self._shared = False
+
+    def _own_storage(self) -> None:
+        """Copy storage still shared with a clone before the first in-place write."""
+        if self.dense is not None:
+            self.dense = self.dense.copy()
+        else:
+            self.data = self.data.copy()
+        self._shared = False
+
+    def _demote_if_sparse(self) -> None:
+        """Move a mostly-air dense chunk back into the sparse dict."""
+        if self.dense is None or self.material_counts[0] <= CHUNK_VOLUME - SPARSE_THRESHOLD:
+            return
+        encoded = np.flatnonzero(self.dense)
+        self.data = dict(zip(encoded.tolist(), self.dense[encoded].tolist()))
+        self.dense = None
+        self._shared = False
 
     # =========================================================================
     # CORE VOXEL ACCESS
@@ -76,20 +183,164 @@ class VoxelChunk:
             >>> chunk.get_voxel(10, 20, 15)
             5
         """
-        # Validate coordinates
-        assert 0 <= x < CHUNK_SIZE, f"X out of range: {x}"
-        assert 0 <= y < CHUNK_SIZE, f"Y out of range: {y}"
-        assert 0 <= z < CHUNK_SIZE, f"Z out of range: {z}"
+        # Validate coordinates (external entry point; stripped under -O).
+        # One test for all axes: bits above 0x1f, incl. a negative's sign bits
+        assert not (x | y | z) & ~0x1f, f"Out of range: {(x, y, z)} (must be 0-31)"
+        assert not material & ~MAX_MATERIAL, f"Material {material} out of range (must be 0-{MAX_MATERIAL})"
 
-        # Encode position
-        encoded = encode_tensor_pos(x, y, z)
+        self.set_voxel_unchecked((y << 10) | (z << 5) | x, material)  # encode_tensor_pos layout
 
-        if material == 0:
+    def set_voxel_unchecked(self, encoded: int, material: int) -> None:
+        """
+        set_voxel for an already-encoded position, without bounds checks.
+
+        For internal callers whose coordinates are in range by construction
+        (world → local conversion, chunk tiles, mesher neighbors).
+
+        Args:
+            encoded: Encoded position (0-32767)
+            material: Material ID (0 = air, removes voxel)
+        """
+        if self._shared:
+            self._own_storage()
+        if self.dense is not None:
+            old = int(self.dense[encoded])
+            self.dense[encoded] = material
+        elif material == 0:
             # Air - remove from sparse dict
-            self.data.pop(encoded, None)
+            old = self.data.pop(encoded, 0)
         else:
             # Solid - store in sparse dict
+            old = self.data.get(encoded, 0)
             self.data[encoded] = material
+            if len(self.data) > DENSE_THRESHOLD:
+                self._promote_to_dense()
+
+        counts = self.material_counts
+        counts[old] -= 1
+        counts[material] += 1
+        if material == 0 and self.dense is not None:
+            self._demote_if_sparse()
+
+    def setter_for(self, material: int) -> Callable[[int, int, int], None]:
+        """
+        Specialized set_voxel for one material.
+
+        The air/solid branch is resolved here, once, instead of on every
+        write. For authoring loops that stamp one material many times.
+
+        Args:
+            material: Material ID every call writes (0 = air)
+
+        Returns:
+            put(x, y, z) with the same effect as set_voxel(x, y, z, material)
+
+        Raises:
+            ValueError: If material is outside 0-MAX_MATERIAL
+
+        Example:
+            >>> put = chunk.setter_for(5)
+            >>> put(10, 20, 15)
+            >>> chunk.get_voxel(10, 20, 15)
+            5
+        """
+        if not 0 <= material <= MAX_MATERIAL:
+            raise ValueError(f"Material {material} out of range (must be 0-{MAX_MATERIAL})")
+        material = int(material)  # Store the cached small int, not a NumPy scalar
+
+        if material == 0:
+            def put(x: int, y: int, z: int) -> None:
+                assert not (x | y | z) & ~0x1f, f"Out of range: {(x, y, z)} (must be 0-31)"
+                encoded = (y << 10) | (z << 5) | x  # encode_tensor_pos layout
+                if self._shared:
+                    self._own_storage()
+                dense = self.dense
+                if dense is None:
+                    old = self.data.pop(encoded, 0)
+                else:
+                    old = int(dense[encoded])
+                    dense[encoded] = 0
+                if old:
+                    counts = self.material_counts
+                    counts[old] -= 1
+                    counts[0] += 1
+                    if dense is not None:
+                        self._demote_if_sparse()
+            return put
+
+        def put(x: int, y: int, z: int) -> None:
+            assert not (x | y | z) & ~0x1f, f"Out of range: {(x, y, z)} (must be 0-31)"
+            encoded = (y << 10) | (z << 5) | x  # encode_tensor_pos layout
+            if self._shared:
+                self._own_storage()
+            dense = self.dense
+            if dense is None:
+                data = self.data
+                old = data.get(encoded, 0)
+                data[encoded] = material
+                if len(data) > DENSE_THRESHOLD:
+                    self._promote_to_dense()
+            else:
+                old = int(dense[encoded])
+                dense[encoded] = material
+            if old != material:
+                counts = self.material_counts
+                counts[old] -= 1
+                counts[material] += 1
+        return put
+
+    def set_voxels_encoded(self, encoded: np.ndarray, materials) -> None:
+        """
+        Set many voxels by encoded position in one call.
+
+        Writes are applied in array order, so the last write to a
+        position wins (same as repeated set_voxel calls).
+
+        Args:
+            encoded: Integer array of encoded positions (0-32767)
+            materials: Material ID, or array of IDs matching encoded
+
+        Example:
+            >>> chunk.set_voxels_encoded(np.array([0, 1, 2]), 4)
+            >>> chunk.get_voxel(2, 0, 0)
+            4
+        """
+        if self.dense is None and len(self.data) + len(encoded) > DENSE_THRESHOLD:
+            self._promote_to_dense()
+        elif self._shared:
+            self._own_storage()
+
+        if self.dense is not None:
+            self.dense[encoded] = materials
+            self._recount_materials()
+            self._demote_if_sparse()
+            return
+
+        self._set_sparse_encoded(encoded, materials)
+        self._recount_materials()
+
+    def _set_sparse_encoded(self, encoded: np.ndarray, materials) -> None:
+        """Dict path of set_voxels_encoded (histogram updated by caller)."""
+        keys = np.asarray(encoded).tolist()
+        if np.ndim(materials) == 0:
+            if materials == 0:
+                for key in keys:
+                    self.data.pop(key, None)
+            else:
+                self.data.update(dict.fromkeys(keys, int(materials)))
+            return
+
+        materials = np.asarray(materials)
+        if materials.all():
+            self.data.update(zip(keys, materials.tolist()))
+            return
+
+        # Mixed solid/air writes - keep per-voxel ordering
+        for key, material in zip(keys, materials.tolist()):
+            if material == 0:
+                self.data.pop(key, None)
+            else:
+                self.data[key] = material
 
     def get_voxel(self, x: int, y: int, z: int) -> int:
         """
@@ -108,13 +359,17 @@ class VoxelChunk:
             >>> chunk.get_voxel(0, 0, 0)  # Not set = air
             0
         """
-        # Validate coordinates
-        assert 0 <= x < CHUNK_SIZE, f"X out of range: {x}"
-        assert 0 <= y < CHUNK_SIZE, f"Y out of range: {y}"
-        assert 0 <= z < CHUNK_SIZE, f"Z out of range: {z}"
+        # Validate coordinates (external entry point; stripped under -O).
+        # One test for all axes: bits above 0x1f, incl. a negative's sign bits
+        assert not (x | y | z) & ~0x1f, f"Out of range: {(x, y, z)} (must be 0-31)"
+
+        return self.get_voxel_unchecked((y << 10) | (z << 5) | x)  # encode_tensor_pos layout
 
-        # Encode and lookup (default to air if not found)
-        encoded = encode_tensor_pos(x, y, z)
+    def get_voxel_unchecked(self, encoded: int) -> int:
+        """get_voxel for an already-encoded position, without bounds checks."""
+        # Default to air if not found
+        if self.dense is not None:
+            return int(self.dense[encoded])
         return self.data.get(encoded, 0)
 
     # =========================================================================
@@ -135,6 +390,8 @@ class VoxelChunk:
             >>> chunk.voxel_count()
             2
         """
+        if self.dense is not None:
+            return CHUNK_VOLUME - int(self.material_counts[0])
         return len(self.data)
 
     def is_empty(self) -> bool:
@@ -152,7 +409,31 @@ class VoxelChunk:
             >>> chunk.is_empty()
             False
         """
-        return len(self.data) == 0
+        return self.voxel_count() == 0
+
+    def uniform_material(self) -> Optional[int]:
+        """
+        Material of a chunk completely filled with one material.
+
+        Such chunks (and empty ones) have trivial meshes, so meshers can
+        skip them.
+
+        Returns:
+            Material ID, or None unless every voxel holds that one material
+
+        Example:
+            >>> chunk = VoxelChunk((0, 0, 0))
+            >>> chunk.fill_aabb(0, 31, 0, 31, 0, 31, material=3)
+            32768
+            >>> chunk.uniform_material()
+            3
+        """
+        if self.dense is None:
+            return None  # Sparse chunks hold at most DENSE_THRESHOLD voxels
+        material = int(self.material_counts.argmax())
+        if material and self.material_counts[material] == CHUNK_VOLUME:
+            return material
+        return None
 
     def memory_usage(self) -> Dict[str, int]:
         """
@@ -169,20 +450,28 @@ class VoxelChunk:
             >>> stats['voxel_count']
             100
         """
-        # Python dict overhead: ~8 bytes per entry (key+value)
-        dict_overhead = len(self.data) * 8
+        voxel_count = self.voxel_count()
 
-        # Tuple for position (3 ints = 24 bytes)
-        position_size = 24
+        # Python dict overhead: ~8 bytes per entry (key+value)
+        dict_overhead = len(self.data) * SPARSE_ENTRY_BYTES if self.data is not None else 0
+        dense_bytes = self.dense.nbytes if self.dense is not None else 0
+        storage = dict_overhead + dense_bytes
 
         return {
-            'voxel_count': len(self.data),
+            'voxel_count': voxel_count,
             'dict_bytes': dict_overhead,
-            'position_bytes': position_size,
-            'total_bytes': dict_overhead + position_size,
-            'bytes_per_voxel': dict_overhead / len(self.data) if self.data else 0
+            'dense_bytes': dense_bytes,
+            'position_bytes': POSITION_BYTES,
+            'total_bytes': storage + POSITION_BYTES,
+            'bytes_per_voxel': storage / voxel_count if voxel_count else 0
         }
 
+    def total_bytes(self) -> int:
+        """memory_usage()['total_bytes'] without building the dict (for world stats)."""
+        if self.dense is not None:
+            return self.dense.nbytes + POSITION_BYTES
+        return len(self.data) * SPARSE_ENTRY_BYTES + POSITION_BYTES
+
     def density(self) -> float:
         """
         Calculate chunk density (percentage of non-air voxels).
@@ -196,7 +485,7 @@ class VoxelChunk:
             >>> chunk.density()
             3.0517578125e-05  # ~0.003%
         """
-        return len(self.data) / CHUNK_VOLUME
+        return self.voxel_count() / CHUNK_VOLUME
 
     # =========================================================================
     # ITERATION
@@ -206,6 +495,9 @@ class VoxelChunk:
         """
         Iterate over all non-air voxels in chunk.
 
+        Legacy per-voxel view; bulk consumers should take the columns from
+        iter_voxels_soa instead of building a tuple per voxel.
+
         Yields:
             Tuples of (x, y, z, material_id)
 
@@ -216,14 +508,86 @@ class VoxelChunk:
             >>> list(chunk.iter_voxels())
             [(5, 10, 15, 1), (10, 20, 25, 2)]
         """
-        for encoded_pos, material in self.data.items():
-            x, y, z = decode_tensor_pos(encoded_pos)
-            yield (x, y, z, material)
+        # Decode all positions in one batch, then hand out Python ints
+        yield from zip(*(column.tolist() for column in self.iter_voxels_soa()))
 
     def __iter__(self):
         """Support for 'for x, y, z, mat in chunk' syntax."""
         return self.iter_voxels()
 
+    def iter_voxels_soa(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        All non-air voxels as columns, in iter_voxels order.
+
+        Returns:
+            (xs, ys, zs, materials) int32 local coords and uint8 materials
+
+        Example:
+            >>> chunk = VoxelChunk((0, 0, 0))
+            >>> chunk.set_voxel(5, 10, 15, 1)
+            >>> [a.tolist() for a in chunk.iter_voxels_soa()]
+            [[5], [10], [15], [1]]
+        """
+        if self.dense is not None:
+            return nonair_columns(self.dense, self.voxel_count())
+        count = len(self.data)
+        encoded = np.fromiter(self.data.keys(), dtype=np.int32, count=count)
+        materials = np.fromiter(self.data.values(), dtype=np.uint8, count=count)
+        return (*decode_tensor_pos_batch(encoded), materials)
+
+    def pack_for_gpu(self) -> np.ndarray:
+        """
+        Non-air voxels as one uint32 per voxel, ready to upload.
+
+        Layout is (x << 24) | (y << 16) | (z << 8) | material with local
+        coords, in iter_voxels order.
+
+        Example:
+            >>> chunk = VoxelChunk((0, 0, 0))
+            >>> chunk.set_voxel(5, 10, 15, 1)
+            >>> hex(int(chunk.pack_for_gpu()[0]))
+            '0x50a0f01'
+        """
+        xs, ys, zs, materials = self.iter_voxels_soa()
+        packed = xs.astype(np.uint32) << 24
+        packed |= ys.astype(np.uint32) << 16
+        packed |= zs.astype(np.uint32) << 8
+        packed |= materials
+        return packed
+
+    def region_arrays(
+        self,
+        x_min: int, x_max: int,
+        y_min: int, y_max: int,
+        z_min: int, z_max: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Non-air voxels in a local box as columns (no per-voxel tuples).
+
+        Args:
+            x_min, x_max, y_min, y_max, z_min, z_max: Local bounds (inclusive, 0-31)
+
+        Returns:
+            (xs, ys, zs, materials) int32 local coords and uint8 materials
+
+        Example:
+            >>> chunk = VoxelChunk((0, 0, 0))
+            >>> chunk.set_voxel(5, 10, 15, 1)
+            >>> xs, ys, zs, mats = chunk.region_arrays(0, 31, 0, 31, 0, 31)
+            >>> xs.tolist(), mats.tolist()
+            ([5], [1])
+        """
+        if self.dense is not None:
+            return region_columns(self.dense, x_min, x_max, y_min, y_max, z_min, z_max)
+
+        xs, ys, zs, materials = self.iter_voxels_soa()
+        inside = (
+            (xs >= x_min) & (xs <= x_max) &
+            (ys >= y_min) & (ys <= y_max) &
+            (zs >= z_min) & (zs <= z_max)
+        )
+        return xs[inside], ys[inside], zs[inside], materials[inside]
+
     # =========================================================================
     # STAGE 2: CHUNK OPERATIONS
     # =========================================================================
@@ -238,6 +602,8 @@ class VoxelChunk:
         """
         Fill a box region with a material.
 
+        The box is clipped to the chunk, then written with fill_aabb.
+
         Args:
             x_min, x_max: X range (inclusive)
             y_min, y_max: Y range (inclusive)
@@ -252,14 +618,75 @@ class VoxelChunk:
             >>> chunk.fill_region(10, 15, 10, 15, 10, 15, material=1)
             216  # 6x6x6 = 216 voxels
         """
-        count = 0
-        for x in range(x_min, x_max + 1):
-            for y in range(y_min, y_max + 1):
-                for z in range(z_min, z_max + 1):
-                    if 0 <= x < CHUNK_SIZE and 0 <= y < CHUNK_SIZE and 0 <= z < CHUNK_SIZE:
-                        self.set_voxel(x, y, z, material)
-                        count += 1
-        return count
+        last = CHUNK_SIZE - 1
+        return self.fill_aabb(
+            max(x_min, 0), min(x_max, last),
+            max(y_min, 0), min(y_max, last),
+            max(z_min, 0), min(z_max, last),
+            material,
+        )
+
+    def fill_aabb(
+        self,
+        x_min: int, x_max: int,
+        y_min: int, y_max: int,
+        z_min: int, z_max: int,
+        material: int
+    ) -> int:
+        """
+        Fill a local box with one slice assignment (no per-voxel encoding).
+
+        Unlike fill_region the box is not clipped; it must lie inside the
+        chunk (see ChunkedVoxelWorld.iter_chunk_tiles).
+
+        Args:
+            x_min, x_max, y_min, y_max, z_min, z_max: Local bounds (inclusive, 0-31)
+            material: Material ID to fill with
+
+        Returns:
+            Number of voxels set
+
+        Example:
+            >>> chunk = VoxelChunk((0, 0, 0))
+            >>> chunk.fill_aabb(0, 31, 0, 0, 0, 31, material=1)
+            1024
+        """
+        size_x, size_y, size_z = x_max - x_min + 1, y_max - y_min + 1, z_max - z_min + 1
+        if size_x <= 0 or size_y <= 0 or size_z <= 0:
+            return 0
+        volume = size_x * size_y * size_z
+
+        if volume == CHUNK_VOLUME:
+            # Whole chunk: new storage outright, no promote, zero-fill or recount
+            if material == 0:
+                self.clear()
+                return volume
+            self.dense = np.full(CHUNK_VOLUME, material, dtype=np.uint8)
+            self.data = None
+            self._shared = False
+            self.material_counts.fill(0)
+            self.material_counts[material] = CHUNK_VOLUME
+            return volume
+
+        if self.dense is None:
+            if len(self.data) + volume <= DENSE_THRESHOLD:
+                base = (y_min << 10) | (z_min << 5) | x_min
+                self.set_voxels_encoded(_box_offsets(size_y, size_z, size_x) + base, material)
+                return volume
+            self._promote_to_dense()
+        elif self._shared:
+            self._own_storage()
+
+        # Dense storage is [y, z, x]; histogram moves by what the box held
+        box = self.dense.reshape(CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE)[
+            y_min:y_max + 1, z_min:z_max + 1, x_min:x_max + 1
+        ]
+        self.material_counts -= np.bincount(box.ravel(), minlength=256).astype(np.int32)
+        box[...] = material
+        self.material_counts[material] += volume
+        if material == 0:
+            self._demote_if_sparse()
+        return volume
 
     def clear(self) -> None:
         """
@@ -273,7 +700,23 @@ class VoxelChunk:
             >>> chunk.is_empty()
             True
         """
-        self.data.clear()
+        self.data = {}
+        self.dense = None
+        self._shared = False
+        counts = self.material_counts  # Never shared: clone() copies it
+        counts.fill(0)
+        counts[0] = CHUNK_VOLUME
+
+    def reset(self, position: Tuple[int, int, int]) -> None:
+        """
+        Empty the chunk and move it to new coordinates (chunk pooling).
+
+        Bumps generation, so caches keyed on the chunk object can tell a
+        recycled chunk from the one they last saw.
+        """
+        self.position = position
+        self.generation += 1
+        self.clear()
 
     def get_bounds(self) -> Optional[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]:
         """
@@ -292,15 +735,23 @@ class VoxelChunk:
         if self.is_empty():
             return None
 
-        x_vals, y_vals, z_vals = [], [], []
-        for x, y, z, _ in self.iter_voxels():
-            x_vals.append(x)
-            y_vals.append(y)
-            z_vals.append(z)
-
+        if self.dense is not None:
+            # Project occupancy onto each axis of the [y, z, x] layout
+            solid = self.dense.reshape(CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE) != 0
+            ys = np.flatnonzero(solid.any(axis=(1, 2)))
+            zs = np.flatnonzero(solid.any(axis=(0, 2)))
+            xs = np.flatnonzero(solid.any(axis=(0, 1)))
+            return (
+                (int(xs[0]), int(ys[0]), int(zs[0])),
+                (int(xs[-1]), int(ys[-1]), int(zs[-1]))
+            )
+
+        # Positions only - materials don't affect the bounds
+        encoded = np.fromiter(self.data.keys(), dtype=np.int32, count=len(self.data))
+        xs, ys, zs = decode_tensor_pos_batch(encoded)
         return (
-            (min(x_vals), min(y_vals), min(z_vals)),
-            (max(x_vals), max(y_vals), max(z_vals))
+            (int(xs.min()), int(ys.min()), int(zs.min())),
+            (int(xs.max()), int(ys.max()), int(zs.max()))
         )
 
     def count_material(self, material: int) -> int:
@@ -321,11 +772,57 @@ class VoxelChunk:
             >>> chunk.count_material(1)
             2
         """
-        return sum(1 for mat in self.data.values() if mat == material)
+        if material == 0:
+            return 0  # Air is never stored
+        return int(self.material_counts[material])
+
+    def count_material_in_aabb(self, material: int, local_aabb: Tuple[int, int, int, int, int, int]) -> int:
+        """
+        Count voxels of a material inside a local box.
+
+        Uses the material histogram to skip chunks without the material and
+        to answer boxes covering the whole chunk without touching voxels.
+
+        Args:
+            material: Material ID to count
+            local_aabb: (x_min, x_max, y_min, y_max, z_min, z_max), inclusive 0-31
+
+        Returns:
+            Number of matching voxels in the box
+
+        Example:
+            >>> chunk = VoxelChunk((0, 0, 0))
+            >>> chunk.fill_region(0, 3, 0, 0, 0, 3, material=4)
+            16
+            >>> chunk.count_material_in_aabb(4, (0, 1, 0, 31, 0, 31))
+            8
+        """
+        if material == 0:
+            return 0  # Air is never stored
+        total = int(self.material_counts[material])
+        if total == 0:
+            return 0
+
+        x_min, x_max, y_min, y_max, z_min, z_max = local_aabb
+        last = CHUNK_SIZE - 1
+        if x_min <= 0 and y_min <= 0 and z_min <= 0 and x_max >= last and y_max >= last and z_max >= last:
+            return total
+
+        if self.dense is not None:
+            box = self.dense.reshape(CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE)[
+                y_min:y_max + 1, z_min:z_max + 1, x_min:x_max + 1
+            ]
+            return int(np.count_nonzero(box == material))
+
+        _, _, _, materials = self.region_arrays(*local_aabb)
+        return int(np.count_nonzero(materials == material))
 
     def clone(self) -> 'VoxelChunk':
         """
-        Create a deep copy of this chunk.
+        Create an independent copy of this chunk.
+
+        O(1): the copy shares storage copy-on-write, so the dict or dense
+        array is only duplicated when one side is first written.
 
         Returns:
             New VoxelChunk with same data
@@ -340,10 +837,64 @@ class VoxelChunk:
             >>> chunk.get_voxel(10, 10, 10)  # Original unchanged
             0
         """
-        return VoxelChunk(
-            position=self.position,
-            data=self.data.copy()
-        )
+        clone = copy.copy(self)
+        clone.material_counts = self.material_counts.copy()
+        self._shared = clone._shared = True
+        return clone
+
+    def pack_rle(self) -> bytes:
+        """
+        Run-length encode the chunk in encoded-position order.
+
+        Layout (little-endian): uint16 run count N, then N uint16 run
+        lengths, then N uint8 materials. Air runs are stored like any
+        other material, so a solid or empty chunk packs to 5 bytes.
+        Chunks too noisy to shrink store N = 0 and the raw dense bytes.
+
+        Returns:
+            Packed bytes (see unpack_rle)
+
+        Example:
+            >>> chunk = VoxelChunk((0, 0, 0))
+            >>> chunk.fill_aabb(0, 31, 0, 31, 0, 31, material=1)
+            32768
+            >>> len(chunk.pack_rle())
+            5
+        """
+        flat = self.dense
+        if flat is None:
+            flat = np.zeros(CHUNK_VOLUME, dtype=np.uint8)
+            count = len(self.data)
+            flat[np.fromiter(self.data.keys(), dtype=np.int64, count=count)] = \
+                np.fromiter(self.data.values(), dtype=np.uint8, count=count)
+
+        starts = np.flatnonzero(flat[1:] != flat[:-1]) + 1
+        if 3 * (len(starts) + 1) >= CHUNK_VOLUME:
+            return bytes(2) + flat.tobytes()
+        lengths = np.diff(starts, prepend=0, append=CHUNK_VOLUME).astype('<u2')
+        materials = flat[np.insert(starts, 0, 0)]
+        header = np.array([len(lengths)], dtype='<u2')
+        return b''.join(column.tobytes() for column in (header, lengths, materials))
+
+    @classmethod
+    def unpack_rle(cls, position: Tuple[int, int, int], data: bytes) -> 'VoxelChunk':
+        """
+        Rebuild a chunk from pack_rle output.
+
+        Raises:
+            ValueError: If the runs do not cover exactly CHUNK_VOLUME voxels
+        """
+        runs = int(np.frombuffer(data, dtype='<u2', count=1)[0])
+        expected = 2 + (3 * runs if runs else CHUNK_VOLUME)
+        if len(data) != expected:
+            raise ValueError(f"RLE payload is {len(data)} bytes, expected {expected} for {runs} runs")
+        if not runs:
+            return cls.from_dense(position, np.frombuffer(data, dtype=np.uint8, offset=2).copy())
+        lengths = np.frombuffer(data, dtype='<u2', count=runs, offset=2)
+        if int(lengths.sum(dtype=np.int64)) != CHUNK_VOLUME:
+            raise ValueError(f"RLE runs cover {int(lengths.sum(dtype=np.int64))} voxels, expected {CHUNK_VOLUME}")
+        materials = np.frombuffer(data, dtype=np.uint8, count=runs, offset=2 + 2 * runs)
+        return cls.from_dense(position, np.repeat(materials, lengths))
 
     def replace_material(self, old_material: int, new_material: int) -> int:
         """
@@ -365,15 +916,31 @@ class VoxelChunk:
             >>> chunk.count_material(2)
             216
         """
-        count = 0
-        for encoded_pos, material in list(self.data.items()):
-            if material == old_material:
-                if new_material == 0:
-                    # Replacing with air - remove
-                    del self.data[encoded_pos]
-                else:
-                    self.data[encoded_pos] = new_material
-                count += 1
+        if old_material == 0:
+            return 0  # Air is never stored
+        count = int(self.material_counts[old_material])
+        if count == 0 or new_material == old_material:
+            return count
+
+        if self.dense is not None:
+            if self._shared:
+                self._own_storage()
+            self.dense[self.dense == old_material] = new_material
+        elif new_material == 0:
+            # Replacing with air - rebuild without the matches
+            self.data = {pos: mat for pos, mat in self.data.items() if mat != old_material}
+        else:
+            # One pass, no (key, value) list copy; insertion order is kept
+            self.data = {
+                pos: new_material if mat == old_material else mat
+                for pos, mat in self.data.items()
+            }
+        self._shared = False  # Storage was copied or rebuilt above
+
+        self.material_counts[old_material] -= count
+        self.material_counts[new_material] += count
+        if new_material == 0:
+            self._demote_if_sparse()
         return count
 
     # =========================================================================
@@ -384,7 +951,7 @@ class VoxelChunk:
         """String representation."""
         return (
             f"VoxelChunk(pos={self.position}, "
-            f"voxels={len(self.data)}, "
+            f"voxels={self.voxel_count()}, "
             f"density={self.density()*100:.2f}%)"
         )
 
@@ -462,21 +1029,193 @@ def test_chunk_operations():
     print(f"  ✓ Replace material: {replaced} voxels (1 → 2)")
 
     # Clone
-    copy = chunk.clone()
-    copy.set_voxel(20, 20, 20, material=3)
+    cloned = chunk.clone()
+    cloned.set_voxel(20, 20, 20, material=3)
     assert chunk.get_voxel(20, 20, 20) == 0  # Original unchanged
-    assert copy.get_voxel(20, 20, 20) == 3
+    assert cloned.get_voxel(20, 20, 20) == 3
     print(f"  ✓ Clone: independent copy works")
 
     # Clear
     chunk.clear()
     assert chunk.is_empty()
-    assert copy.voxel_count() == 217  # Original had 216, plus 1 new
+    assert cloned.voxel_count() == 217  # Original had 216, plus 1 new
     print(f"  ✓ Clear: chunk empty, copy unaffected")
 
     print(f"  ✓ Stage 2 complete!")
 
 
+def test_dense_promotion():
+    """Test sparse → dense promotion keeps the same contents."""
+    print("\nTesting VoxelChunk (Dense Promotion)...")
+
+    chunk = VoxelChunk(position=(0, 0, 0))
+    expected = {}
+    for x in range(32):
+        for z in range(32):
+            for y in range(3):
+                material = 1 + (x + y + z) % 3
+                chunk.set_voxel(x, y, z, material)
+                expected[(x, y, z)] = material
+    assert chunk.dense is not None and chunk.data is None
+    assert chunk.voxel_count() == len(expected) == 3072
+    print(f"  ✓ Promoted past {DENSE_THRESHOLD} voxels: {chunk}")
+
+    assert {(x, y, z): m for x, y, z, m in chunk.iter_voxels()} == expected
+    assert chunk.get_voxel(5, 1, 7) == expected[(5, 1, 7)]
+    assert chunk.get_voxel(5, 10, 7) == 0
+    assert chunk.get_bounds() == ((0, 0, 0), (31, 2, 31))
+    print(f"  ✓ Reads match sparse contents")
+
+    chunk.set_voxel(5, 1, 7, 0)
+    chunk.set_voxel(5, 1, 7, 0)  # Clearing air twice doesn't double count
+    assert chunk.voxel_count() == 3071
+    assert chunk.count_material(1) == sum(1 for m in expected.values() if m == 1) - (expected[(5, 1, 7)] == 1)
+    replaced = chunk.replace_material(2, 0)
+    assert chunk.voxel_count() == 3071 - replaced
+    print(f"  ✓ Dense writes keep voxel count in sync")
+
+    assert chunk.material_counts.sum() == CHUNK_VOLUME
+    assert chunk.count_material(3) == int(np.count_nonzero(chunk.dense == 3))
+    box = (4, 20, 0, 1, 8, 31)
+    expected_in_box = sum(1 for x, y, z, m in chunk.iter_voxels()
+                          if m == 3 and 4 <= x <= 20 and y <= 1 and 8 <= z)
+    assert chunk.count_material_in_aabb(3, box) == expected_in_box
+    assert chunk.count_material_in_aabb(3, (0, 31, 0, 31, 0, 31)) == chunk.count_material(3)
+    assert chunk.count_material_in_aabb(7, box) == 0
+    print(f"  ✓ Material histogram answers region counts")
+
+    cloned = chunk.clone()
+    cloned.set_voxel(0, 20, 0, 4)
+    assert chunk.get_voxel(0, 20, 0) == 0
+
+    # Copy-on-write: every mutator leaves the other side untouched
+    edits = (
+        lambda c: c.set_voxel(1, 20, 1, 5),
+        lambda c: c.setter_for(0)(0, 0, 0),
+        lambda c: c.set_voxels_encoded(np.arange(40, 60), 6),
+        lambda c: c.fill_aabb(0, 3, 0, 3, 0, 3, 7),
+        lambda c: c.replace_material(3, 1),
+        lambda c: c.replace_material(1, 0),
+        lambda c: c.fill_aabb(0, 31, 0, 31, 0, 31, 2),
+        lambda c: c.fill_aabb(0, 31, 0, 31, 0, 31, 0),
+    )
+    sparse = VoxelChunk(position=(0, 0, 0))
+    sparse.fill_aabb(0, 7, 0, 1, 0, 7, 3)
+    for source in (chunk, sparse):
+        for edit in edits:
+            original = source.clone()
+            cloned = original.clone()
+            for writer, other in ((original, cloned), (cloned.clone(), original)):
+                before = sorted(other.iter_voxels()), other.material_counts.copy()
+                edit(writer)
+                assert sorted(other.iter_voxels()) == before[0]
+                assert np.array_equal(other.material_counts, before[1])
+    chunk.clear()
+    assert chunk.is_empty() and chunk.dense is None
+    print(f"  ✓ Clone/clear work on dense chunks (clones are copy-on-write)")
+
+    for box in ((2, 5, 0, 3, 7, 9), (0, 31, 0, 2, 0, 31)):  # Stays sparse, then promotes
+        reference = chunk.clone()
+        x_min, x_max, y_min, y_max, z_min, z_max = box
+        for x in range(x_min, x_max + 1):
+            for y in range(y_min, y_max + 1):
+                for z in range(z_min, z_max + 1):
+                    reference.set_voxel(x, y, z, 6)
+        assert chunk.fill_aabb(*box, material=6) == (x_max - x_min + 1) * (y_max - y_min + 1) * (z_max - z_min + 1)
+        assert dict(((x, y, z), m) for x, y, z, m in chunk) == dict(((x, y, z), m) for x, y, z, m in reference)
+        assert np.array_equal(chunk.material_counts, reference.material_counts)
+    assert chunk.fill_region(-4, 40, 1, 1, 30, 35, material=0) == 32 * 2
+    assert chunk.fill_region(5, 4, 0, 31, 0, 31, material=1) == 0
+    chunk.fill_region(0, 31, 0, 3, 0, 31, material=0)
+    assert chunk.voxel_count() == 0 and chunk.material_counts[0] == CHUNK_VOLUME
+    print(f"  ✓ fill_aabb/fill_region match per-voxel writes (sparse and dense)")
+
+    chunk.fill_aabb(0, 31, 0, 2, 0, 31, material=5)
+    chunk.fill_aabb(0, 31, 1, 2, 0, 31, material=0)
+    assert chunk.dense is not None  # 1024 voxels: above SPARSE_THRESHOLD
+    chunk.fill_aabb(0, 31, 0, 0, 0, 23, material=0)
+    assert chunk.dense is not None and chunk.voxel_count() == SPARSE_THRESHOLD
+    chunk.set_voxel(31, 0, 31, 0)
+    assert chunk.dense is None and chunk.voxel_count() == SPARSE_THRESHOLD - 1
+    assert chunk.data == {(z << 5) | x: 5 for z in range(24, 32) for x in range(32) if (x, z) != (31, 31)}
+    print(f"  ✓ Demoted below {SPARSE_THRESHOLD} voxels: {chunk}")
+
+    for source, material in ((chunk, 4), (chunk, 0), (VoxelChunk(position=(0, 0, 0)), 4)):
+        whole = source.clone()
+        assert whole.fill_aabb(0, 31, 0, 31, 0, 31, material) == CHUNK_VOLUME
+        counts = whole.material_counts.copy()
+        whole._recount_materials()
+        assert np.array_equal(whole.material_counts, counts) and whole.get_voxel(31, 0, 31) == material
+        assert (whole.dense is None) == (material == 0)
+    print(f"  ✓ Whole-chunk fills replace storage directly")
+
+    solid = VoxelChunk(position=(0, 0, 0))
+    solid.fill_aabb(0, 31, 0, 31, 0, 31, material=6)
+    assert solid.uniform_material() == 6
+    solid.set_voxel(4, 4, 4, 0)
+    assert solid.uniform_material() is None
+    print(f"  ✓ uniform_material detects single-material chunks")
+
+    stamped, reference = VoxelChunk(position=(0, 0, 0)), VoxelChunk(position=(0, 0, 0))
+    put_stone, put_air = stamped.setter_for(np.uint8(2)), stamped.setter_for(0)
+    for y in range(4):  # Promotes past DENSE_THRESHOLD, then carves back below SPARSE_THRESHOLD
+        for z in range(32):
+            for x in range(32):
+                put_stone(x, y, z)
+                put_stone(x, y, z)  # Restamping the same material doesn't double count
+                reference.set_voxel(x, y, z, 2)
+    assert stamped.dense is not None
+    for y in range(4):
+        for z in range(31):
+            for x in range(32):
+                put_air(x, y, z)
+                reference.set_voxel(x, y, z, 0)
+    assert stamped.dense is None and stamped.data == reference.data
+    assert all(type(m) is int for m in stamped.data.values())  # Cached small ints, not NumPy scalars
+    assert np.array_equal(stamped.material_counts, reference.material_counts)
+    try:
+        stamped.setter_for(MAX_MATERIAL + 1)
+        assert False, "material 256 should not fit"
+    except ValueError:
+        pass
+    print(f"  ✓ setter_for matches set_voxel across promotion/demotion")
+
+
+def test_rle_packing():
+    """Test run-length packing round-trips sparse, dense and uniform chunks."""
+    print("\nTesting RLE packing...")
+
+    rng = np.random.default_rng(11)
+    noisy = VoxelChunk(position=(0, 0, 0))
+    encoded = np.flatnonzero(rng.random(CHUNK_VOLUME) < 0.3)
+    noisy.set_voxels_encoded(encoded, rng.integers(1, 256, size=encoded.size).astype(np.uint8))
+
+    floor = VoxelChunk(position=(1, 0, 0))
+    floor.fill_aabb(0, 31, 0, 1, 0, 31, material=2)
+    sparse = VoxelChunk(position=(0, 2, 0))
+    sparse.set_voxel(31, 31, 31, 9)
+    solid = VoxelChunk(position=(0, 0, 3))
+    solid.fill_aabb(0, 31, 0, 31, 0, 31, material=255)
+
+    for chunk in (noisy, floor, sparse, solid, VoxelChunk(position=(5, 5, 5))):
+        packed = chunk.pack_rle()
+        restored = VoxelChunk.unpack_rle(chunk.position, packed)
+        assert sorted(restored.iter_voxels()) == sorted(chunk.iter_voxels())
+        assert np.array_equal(restored.material_counts, chunk.material_counts)
+        assert (restored.dense is None) == (chunk.dense is None)
+        print(f"  ✓ {chunk.voxel_count():6d} voxels -> {len(packed):6d} bytes")
+    assert len(solid.pack_rle()) == len(floor.pack_rle()) - 3 == 5
+    assert len(noisy.pack_rle()) == 2 + CHUNK_VOLUME  # Raw fallback
+
+    for bad in (floor.pack_rle()[:-1], b'\x01\x00\x00\x01\x01'):
+        try:
+            VoxelChunk.unpack_rle((0, 0, 0), bad)
+            assert False, "malformed RLE should not unpack"
+        except ValueError:
+            pass
+    print(f"  ✓ Malformed payloads rejected")
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -489,6 +1228,8 @@ if __name__ == "__main__":
 
     test_basic_chunk()
     test_chunk_operations()
+    test_dense_promotion()
+    test_rle_packing()
 
     print()
     print("=" * 80)
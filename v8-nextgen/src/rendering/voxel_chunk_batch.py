@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+VoxelChunkBatch - Batched Dense Chunk Edits
+
+Stacks N chunks into one uint8[N, CHUNK_VOLUME] tensor so carve/fill,
+material swaps and material counts run as one array op over every chunk
+instead of one Python call per chunk. Lives on the GPU via CuPy when it
+is installed; otherwise the same code runs on NumPy.
+
+Data crosses PCIe twice: once when the batch is built and once when it
+is written back. Keep the batch alive across edits within a frame.
+"""
+
+from typing import List, Sequence, Tuple
+import sys
+
+import numpy as np
+
+sys.path.insert(0, '.')
+from voxel_chunk import VoxelChunk
+from voxel_encoding import CHUNK_SIZE, CHUNK_VOLUME
+from voxel_world import ChunkedVoxelWorld
+
+# Optional GPU array backend (NumPy-compatible API)
+try:
+    import cupy as xp
+    CUPY_AVAILABLE = True
+except ImportError:
+    xp = np
+    CUPY_AVAILABLE = False
+
+
+def _to_host(array) -> np.ndarray:
+    """Download a backend array to a NumPy array (no-op on NumPy)."""
+    return array.get() if CUPY_AVAILABLE else array
+
+
+def _fill_boxes_sliced(grid, chunk_ids: np.ndarray, boxes: np.ndarray, material: int) -> None:
+    """One slice assignment per box (cheapest on CPU)."""
+    for i, (x0, x1, y0, y1, z0, z1) in zip(chunk_ids.tolist(), boxes.tolist()):
+        grid[i, y0:y1 + 1, z0:z1 + 1, x0:x1 + 1] = material
+
+
+def _fill_boxes_masked(backend, grid, chunk_ids: np.ndarray, boxes: np.ndarray, material: int) -> None:
+    """All boxes in one broadcast select (one pass over the touched chunks on GPU)."""
+    ids = backend.asarray(chunk_ids)
+    b = backend.asarray(boxes)[:, :, None, None, None]
+    axis = backend.arange(CHUNK_SIZE)
+    x, z, y = axis[None, None, None, :], axis[None, None, :, None], axis[None, :, None, None]
+    inside = ((x >= b[:, 0]) & (x <= b[:, 1]) &
+              (y >= b[:, 2]) & (y <= b[:, 3]) &
+              (z >= b[:, 4]) & (z <= b[:, 5]))
+    grid[ids] = backend.where(inside, backend.uint8(material), grid[ids])
+
+
+class VoxelChunkBatch:
+    """
+    N chunks held as one uint8[N, CHUNK_VOLUME] tensor.
+
+    Slabs use the VoxelChunk.dense layout (encoded position, [y, z, x]
+    when reshaped), so the results convert straight back to chunks.
+
+    Attributes:
+        positions: Chunk coordinates, one per slab
+        slabs: uint8[N, CHUNK_VOLUME] on the active backend
+        modified: bool[N] (host) slabs changed since the batch was built
+
+    Example:
+        >>> batch = VoxelChunkBatch.from_chunks([VoxelChunk((0, 0, 0))])
+        >>> batch.fill_aabb([0], [(0, 31, 0, 0, 0, 31)], material=2)
+        1024
+        >>> batch.count_material(2).tolist()
+        [1024]
+    """
+
+    def __init__(self, positions: List[Tuple[int, int, int]], slabs):
+        self.positions = positions
+        self.slabs = slabs
+        self.modified = np.zeros(len(positions), dtype=bool)
+
+    @classmethod
+    def from_chunks(cls, chunks: Sequence[VoxelChunk]) -> 'VoxelChunkBatch':
+        """Pack chunks (sparse or dense) and upload them in one transfer."""
+        host = np.zeros((len(chunks), CHUNK_VOLUME), dtype=np.uint8)
+        for slab, chunk in zip(host, chunks):
+            if chunk.dense is not None:
+                slab[:] = chunk.dense
+            elif chunk.data:
+                count = len(chunk.data)
+                slab[np.fromiter(chunk.data.keys(), dtype=np.int64, count=count)] = \
+                    np.fromiter(chunk.data.values(), dtype=np.uint8, count=count)
+        return cls([chunk.position for chunk in chunks], xp.asarray(host))
+
+    @classmethod
+    def from_world(cls, world: ChunkedVoxelWorld, positions: Sequence[Tuple[int, int, int]]) -> 'VoxelChunkBatch':
+        """Batch world chunks by position; unloaded positions start as air."""
+        chunks = [world.chunks.get(pos) for pos in positions]
+        return cls.from_chunks([
+            VoxelChunk(position=pos) if chunk is None else chunk
+            for pos, chunk in zip(positions, chunks)
+        ])
+
+    def __len__(self) -> int:
+        """Number of chunks in the batch."""
+        return len(self.positions)
+
+    def fill_aabb(self, chunk_ids, local_aabbs, material: int) -> int:
+        """
+        Fill one local box in each listed chunk.
+
+        Boxes follow VoxelChunk.fill_aabb: inclusive local bounds
+        (x_min, x_max, y_min, y_max, z_min, z_max), not clipped.
+
+        Args:
+            chunk_ids: Slab indices, each listed at most once
+            local_aabbs: One box per chunk id, shape (M, 6)
+            material: Material ID to fill with (0 carves)
+
+        Returns:
+            Number of voxels set
+        """
+        chunk_ids = np.asarray(chunk_ids, dtype=np.int64)
+        boxes = np.asarray(local_aabbs, dtype=np.int64).reshape(-1, 6)
+        if not len(chunk_ids):
+            return 0
+
+        grid = self.slabs.reshape(-1, CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE)
+        if CUPY_AVAILABLE:
+            _fill_boxes_masked(xp, grid, chunk_ids, boxes, material)
+        else:
+            _fill_boxes_sliced(grid, chunk_ids, boxes, material)
+        self.modified[chunk_ids] = True
+
+        sizes = (boxes[:, 1::2] - boxes[:, 0::2] + 1).clip(min=0)
+        return int(sizes.prod(axis=1).sum())
+
+    def replace_material(self, old_material: int, new_material: int) -> int:
+        """
+        Replace one material with another in every chunk.
+
+        Returns:
+            Number of voxels replaced
+        """
+        if old_material == 0:
+            return 0  # Air is never stored (see VoxelChunk.replace_material)
+        if new_material == old_material:
+            return int(self.count_material(old_material).sum())  # Matches, but nothing to write
+        matches = self.slabs == old_material
+        per_chunk = _to_host(matches.sum(axis=1))
+        self.slabs[matches] = new_material
+        self.modified |= per_chunk > 0
+        return int(per_chunk.sum())
+
+    def count_material(self, material: int) -> np.ndarray:
+        """Per-chunk voxel counts of a material (host int array)."""
+        return _to_host((self.slabs == material).sum(axis=1))
+
+    def to_chunks(self) -> List[VoxelChunk]:
+        """Download the batch as new VoxelChunks (sparse if mostly air)."""
+        host = _to_host(self.slabs)
+        return [VoxelChunk.from_dense(pos, slab.copy()) for pos, slab in zip(self.positions, host)]
+
+    def write_to_world(self, world: ChunkedVoxelWorld) -> int:
+        """
+        Replace the modified chunks in a world and mark them dirty.
+
+        Chunks left empty are unloaded, as ChunkedVoxelWorld.fill_aabb does.
+
+        Returns:
+            Number of chunks written back
+        """
+        ids = np.flatnonzero(self.modified)
+        if not len(ids):
+            return 0
+        host = _to_host(self.slabs[xp.asarray(ids)])
+        for slab, i in zip(host, ids.tolist()):
+            pos = self.positions[i]
+            chunk = VoxelChunk.from_dense(pos, slab)
+            if chunk.is_empty():
+                world.unload_chunk(*pos)
+                continue
+            world.put_chunk(chunk)
+        self.modified[:] = False
+        return len(ids)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        backend = 'cupy' if CUPY_AVAILABLE else 'numpy'
+        return f"VoxelChunkBatch({len(self)} chunks, {int(self.modified.sum())} modified, {backend})"
+
+
+# =============================================================================
+# VALIDATION
+# =============================================================================
+
+def validate_chunk_batch():
+    """Check batched edits against the same edits made chunk by chunk."""
+    print("Validating VoxelChunkBatch...")
+
+    world = ChunkedVoxelWorld()
+    world.fill_aabb(-40, 40, 0, 20, -10, 50, 3)  # Dense and sparse chunks
+    world.fill_aabb(0, 5, 30, 31, 0, 5, 4)
+    reference = ChunkedVoxelWorld()
+    reference.chunks = {pos: chunk.clone() for pos, chunk in world.chunks.items()}
+
+    positions = sorted(world.chunks) + [(5, 5, 5)]  # Plus one unloaded position
+    batch = VoxelChunkBatch.from_world(world, positions)
+    assert batch.count_material(3).tolist() == [
+        reference.chunks[pos].count_material(3) if pos in reference.chunks else 0 for pos in positions
+    ]
+
+    rng = np.random.default_rng(5)
+    ids = np.arange(len(positions))
+    lo = rng.integers(0, 32, size=(len(ids), 3))
+    hi = np.minimum(lo + rng.integers(-2, 20, size=(len(ids), 3)), 31)
+    boxes = np.stack([lo[:, 0], hi[:, 0], lo[:, 1], hi[:, 1], lo[:, 2], hi[:, 2]], axis=1)
+
+    filled = batch.fill_aabb(ids, boxes, 0)
+    assert filled == sum(reference.load_chunk(*pos).fill_aabb(*box, 0)
+                         for pos, box in zip(positions, boxes.tolist()))
+    assert batch.replace_material(3, 6) == sum(c.replace_material(3, 6) for c in reference.chunks.values())
+    modified = batch.modified.copy()
+    assert batch.replace_material(6, 6) == sum(c.replace_material(6, 6) for c in reference.chunks.values()) > 0
+    assert np.array_equal(batch.modified, modified)
+    print(f"  ✓ fill_aabb + replace_material: {filled} voxels carved over {len(batch)} chunks")
+
+    masked = np.zeros((len(ids), CHUNK_VOLUME), dtype=np.uint8)
+    sliced = masked.copy()
+    _fill_boxes_masked(np, masked.reshape(-1, CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE), ids, boxes, 7)
+    _fill_boxes_sliced(sliced.reshape(-1, CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE), ids, boxes, 7)
+    assert np.array_equal(masked, sliced)
+    print(f"  ✓ GPU (masked) and CPU (sliced) box fills agree")
+
+    world.clear_dirty_chunks()
+    written = batch.write_to_world(world)
+    for pos in positions:
+        ref = reference.chunks[pos]
+        if ref.is_empty():
+            assert pos not in world.chunks
+            continue
+        chunk = world.chunks[pos]
+        assert np.array_equal(chunk.material_counts, ref.material_counts)
+        assert sorted(chunk.iter_voxels()) == sorted(ref.iter_voxels())
+        assert world.is_chunk_dirty(*pos)
+    print(f"  ✓ write_to_world: {written} chunks match per-chunk edits")
+    print(f"  ✓ Backend: {'CuPy' if CUPY_AVAILABLE else 'NumPy'}")
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("VOXEL CHUNK BATCH")
+    print("=" * 80)
+    print()
+    validate_chunk_batch()
+    print()
+    print("=" * 80)
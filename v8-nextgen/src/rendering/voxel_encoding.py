@@ -10,7 +10,10 @@ Reference:
   - See: v8-nextgen/reference/biomes/voxel_math/tensors.hpp
 """
 
-from typing import Tuple
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+import numpy as np
 
 
 # =============================================================================
@@ -19,6 +22,8 @@ from typing import Tuple
 
 CHUNK_SIZE = 32  # 32x32x32 voxels per chunk (matches Biomes)
 CHUNK_VOLUME = CHUNK_SIZE ** 3  # 32,768 voxels
+CHUNK_SHIFT = 5  # log2(CHUNK_SIZE): world >> CHUNK_SHIFT == world // CHUNK_SIZE
+assert CHUNK_SIZE == 1 << CHUNK_SHIFT  # Hot paths inline >> 5 and & 31 for the 5-bit layout
 
 
 # =============================================================================
@@ -56,10 +61,8 @@ def encode_tensor_pos(x: int, y: int, z: int) -> int:
         >>> encode_tensor_pos(15, 15, 15)
         15855
     """
-    # Validate input range
-    assert 0 <= x < CHUNK_SIZE, f"X out of range: {x} (must be 0-31)"
-    assert 0 <= y < CHUNK_SIZE, f"Y out of range: {y} (must be 0-31)"
-    assert 0 <= z < CHUNK_SIZE, f"Z out of range: {z} (must be 0-31)"
+    # Validate input range (any bit above 0x1f - negatives included - is out)
+    assert not (x | y | z) & ~0x1f, f"Out of range: {(x, y, z)} (must be 0-31)"
 
     # Encode (5 bits each, YZX order)
     k_0 = (y & 0x1f) << 10  # Y: bits 10-14
@@ -69,11 +72,14 @@ def encode_tensor_pos(x: int, y: int, z: int) -> int:
     return k_0 | k_1 | k_2
 
 
+@lru_cache(maxsize=CHUNK_VOLUME)
 def decode_tensor_pos(encoded: int) -> Tuple[int, int, int]:
     """
     Decode integer back to 3D position.
 
-    Reverses the encoding from encode_tensor_pos().
+    Reverses the encoding from encode_tensor_pos(). The 15-bit input space
+    is small, so results are memoized into a lookup table filled on first
+    use; repeat decodes skip the shifts and the tuple allocation.
 
     This matches Biomes' decoding from tensors.hpp:27-32:
       auto y = static_cast<unsigned int>((pos >> 10) & 0x1f);
@@ -106,6 +112,204 @@ def decode_tensor_pos(encoded: int) -> Tuple[int, int, int]:
     return (x, y, z)
 
 
+def encode_tensor_pos_batch(xs: np.ndarray, ys: np.ndarray, zs: np.ndarray) -> np.ndarray:
+    """
+    Vectorized encode_tensor_pos over coordinate arrays (same bit layout).
+
+    Inputs broadcast, so np.ogrid axes encode a whole box at once. No
+    range checks; callers pass chunk-local coordinates.
+
+    Args:
+        xs, ys, zs: Integer arrays of local coordinates (0-31)
+
+    Returns:
+        int32 array of encoded positions
+
+    Example:
+        >>> encode_tensor_pos_batch(np.array([0, 31]), np.array([0, 31]), np.array([0, 31]))
+        array([    0, 32767], dtype=int32)
+    """
+    return (
+        (np.asarray(ys, dtype=np.int32) << 10)
+        | (np.asarray(zs, dtype=np.int32) << 5)
+        | np.asarray(xs, dtype=np.int32)
+    )
+
+
+def decode_tensor_pos_batch(encoded: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized decode_tensor_pos.
+
+    Args:
+        encoded: Integer array of encoded positions
+
+    Returns:
+        (xs, ys, zs) arrays, same dtype as encoded
+
+    Example:
+        >>> decode_tensor_pos_batch(np.array([15855]))
+        (array([15]), array([15]), array([15]))
+    """
+    encoded = np.asarray(encoded)
+    return encoded & 0x1f, (encoded >> 10) & 0x1f, (encoded >> 5) & 0x1f
+
+
+def offset_tensor_pos_batch(encoded: np.ndarray, dx: int = 0, dy: int = 0, dz: int = 0) -> np.ndarray:
+    """
+    Move encoded positions by (dx, dy, dz) without decoding them.
+
+    The layout is linear in each coordinate, so a step is one add of
+    (dy << 10) + (dz << 5) + dx. No range checks: a coordinate pushed
+    outside 0-31 carries into its neighbor, so callers keep moves in-chunk.
+
+    Args:
+        encoded: Integer array of encoded positions
+        dx, dy, dz: Step along each axis
+
+    Returns:
+        Array of moved positions, same dtype as encoded
+
+    Example:
+        >>> offset_tensor_pos_batch(np.array([15855]), dx=1)
+        array([15856])
+    """
+    encoded = np.asarray(encoded)
+    step = (dy << 10) + (dz << 5) + dx
+    if step < 0:  # Subtract instead, so unsigned arrays keep their dtype
+        return encoded - encoded.dtype.type(-step)
+    return encoded + encoded.dtype.type(step)
+
+
+# =============================================================================
+# MORTON ENCODING (15-bit Z-order for chunk-local coordinates)
+# =============================================================================
+#
+# Alternative to the YZX layout for spatially sorted data: interleaving the
+# coordinate bits (x in bit 0, y in bit 1, z in bit 2 of every triple) keeps
+# each aligned 2³, 4³, ... block contiguous, so sorting by Morton code groups
+# neighbors together. Chunk storage keeps the YZX layout, since dense chunks
+# and the meshers slice it as a [y, z, x] array.
+
+def _spread_bits_5(v):
+    """Move bits 0-4 of v to bits 0, 3, 6, 9, 12 (works on ints and arrays)."""
+    v = (v | (v << 8)) & 0x100F
+    v = (v | (v << 4)) & 0x10C3
+    v = (v | (v << 2)) & 0x1249
+    return v
+
+
+def _compact_bits_5(v):
+    """Inverse of _spread_bits_5: gather bits 0, 3, 6, 9, 12 into bits 0-4."""
+    v = v & 0x1249
+    v = (v | (v >> 2)) & 0x10C3
+    v = (v | (v >> 4)) & 0x100F
+    v = (v | (v >> 8)) & 0x1F
+    return v
+
+
+def encode_morton(x: int, y: int, z: int) -> int:
+    """
+    Encode 3D position as a 15-bit Morton (Z-order) code.
+
+    Example:
+        >>> encode_morton(1, 0, 0), encode_morton(0, 1, 0), encode_morton(0, 0, 1)
+        (1, 2, 4)
+        >>> encode_morton(31, 31, 31)
+        32767
+    """
+    assert not (x | y | z) & ~0x1f, f"Out of range: {(x, y, z)} (must be 0-31)"
+
+    return _spread_bits_5(x) | (_spread_bits_5(y) << 1) | (_spread_bits_5(z) << 2)
+
+
+def decode_morton(encoded: int) -> Tuple[int, int, int]:
+    """
+    Decode a 15-bit Morton code back to (x, y, z).
+
+    Example:
+        >>> decode_morton(7)
+        (1, 1, 1)
+    """
+    assert 0 <= encoded < CHUNK_VOLUME, f"Encoded value out of range: {encoded}"
+
+    return (_compact_bits_5(encoded), _compact_bits_5(encoded >> 1), _compact_bits_5(encoded >> 2))
+
+
+def encode_morton_batch(xs: np.ndarray, ys: np.ndarray, zs: np.ndarray) -> np.ndarray:
+    """
+    Vectorized encode_morton (inputs broadcast, no range checks).
+
+    Returns:
+        int32 array of Morton codes
+    """
+    return (
+        _spread_bits_5(np.asarray(xs, dtype=np.int32))
+        | (_spread_bits_5(np.asarray(ys, dtype=np.int32)) << 1)
+        | (_spread_bits_5(np.asarray(zs, dtype=np.int32)) << 2)
+    )
+
+
+def decode_morton_batch(encoded: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized decode_morton.
+
+    Returns:
+        (xs, ys, zs) arrays, same dtype as encoded
+    """
+    encoded = np.asarray(encoded)
+    return _compact_bits_5(encoded), _compact_bits_5(encoded >> 1), _compact_bits_5(encoded >> 2)
+
+
+# =============================================================================
+# CHUNK KEY MORTON ENCODING (63-bit Z-order for chunk coordinates)
+# =============================================================================
+#
+# Chunk coordinates are signed, so each axis is biased by 2^20 into 21 bits
+# before interleaving. Sorting by the code visits chunks in Z-order, and the
+# single int64 key replaces three-key lexsorts when grouping voxels by chunk.
+
+CHUNK_KEY_BIAS = 1 << 20  # Chunk coords must lie in [-2^20, 2^20)
+
+
+def _spread_bits_21(v):
+    """Move bits 0-20 of v to every third bit (works on ints and uint64 arrays)."""
+    v = (v | (v << 32)) & 0x1F00000000FFFF
+    v = (v | (v << 16)) & 0x1F0000FF0000FF
+    v = (v | (v << 8)) & 0x100F00F00F00F00F
+    v = (v | (v << 4)) & 0x10C30C30C30C30C3
+    v = (v | (v << 2)) & 0x1249249249249249
+    return v
+
+
+def encode_chunk_morton(cx: int, cy: int, cz: int) -> int:
+    """
+    Encode chunk coordinates as a 63-bit Morton code.
+
+    Example:
+        >>> encode_chunk_morton(0, 0, 0) == 7 << 60  # Bias bit of each axis
+        True
+        >>> encode_chunk_morton(-1, 0, 0) < encode_chunk_morton(0, 0, 0)
+        True
+    """
+    x, y, z = cx + CHUNK_KEY_BIAS, cy + CHUNK_KEY_BIAS, cz + CHUNK_KEY_BIAS
+    assert not (x | y | z) & ~0x1FFFFF, f"Chunk out of range: {(cx, cy, cz)}"
+
+    return _spread_bits_21(x) | (_spread_bits_21(y) << 1) | (_spread_bits_21(z) << 2)
+
+
+def encode_chunk_morton_batch(cxs: np.ndarray, cys: np.ndarray, czs: np.ndarray) -> np.ndarray:
+    """
+    Vectorized encode_chunk_morton (no range checks).
+
+    Returns:
+        int64 array of Morton codes (non-negative, order-preserving)
+    """
+    def spread(axis):
+        return _spread_bits_21(np.asarray(axis, dtype=np.int64).astype(np.uint64) + CHUNK_KEY_BIAS)
+
+    return (spread(cxs) | (spread(cys) << 1) | (spread(czs) << 2)).view(np.int64)
+
+
 # =============================================================================
 # WORLD POSITION ENCODING (30-bit for global coordinates)
 # =============================================================================
@@ -138,9 +342,7 @@ def encode_tensor_pos_32(x: int, y: int, z: int) -> int:
         1073741823
     """
     # Validate input range (10 bits = 0-1023)
-    assert 0 <= x < 1024, f"X out of range: {x} (must be 0-1023)"
-    assert 0 <= y < 1024, f"Y out of range: {y} (must be 0-1023)"
-    assert 0 <= z < 1024, f"Z out of range: {z} (must be 0-1023)"
+    assert not (x | y | z) & ~0x3ff, f"Out of range: {(x, y, z)} (must be 0-1023)"
 
     # Encode (10 bits each, YZX order)
     k_0 = (y & 0x3ff) << 20  # Y: bits 20-29
@@ -299,6 +501,9 @@ def encoding_memory_usage(num_voxels: int) -> dict:
 # DELTA ENCODING (For Massive Crowds & Dynamic Environments)
 # =============================================================================
 
+# Lookup sentinel: state values may legitimately be falsy (position 0)
+_MISSING = object()
+
 def compute_state_delta(old_state: dict, new_state: dict) -> dict:
     """
     Compute delta between two voxel/entity states.
@@ -327,25 +532,116 @@ def compute_state_delta(old_state: dict, new_state: dict) -> dict:
         {2: 50, 3: None, 4: 400}  # Only 3 entries instead of 4!
     """
     delta = {}
+    added = 0
+    old_get = old_state.get
 
-    # Check for changes and additions
+    # Check for changes and additions (one probe into old_state per entity)
     for entity_id, new_pos in new_state.items():
-        if entity_id not in old_state:
+        old_pos = old_get(entity_id, _MISSING)
+        if old_pos is _MISSING:
             # NEW entity
             delta[entity_id] = new_pos
-        elif old_state[entity_id] != new_pos:
+            added += 1
+        elif old_pos != new_pos:
             # MOVED entity (store as delta for compression)
-            delta[entity_id] = new_pos - old_state[entity_id]
-
-    # Check for removals
-    for entity_id in old_state:
-        if entity_id not in new_state:
-            # REMOVED entity
-            delta[entity_id] = None
+            delta[entity_id] = new_pos - old_pos
+
+    # Check for removals - the counts say how many old entities are gone,
+    # so the scan is skipped (or cut short) once they are all found
+    removed = len(old_state) - (len(new_state) - added)
+    if removed:
+        for entity_id in old_state:
+            if entity_id not in new_state:
+                # REMOVED entity
+                delta[entity_id] = None
+                removed -= 1
+                if not removed:
+                    break
 
     return delta
 
 
+class StateDelta(NamedTuple):
+    """
+    compute_state_delta output as typed columns (struct-of-arrays).
+
+    Every column is int64, so any entity ID, position or position delta
+    round-trips. to_bytes is the network wire format.
+    """
+    added_ids: np.ndarray
+    added_vals: np.ndarray
+    moved_ids: np.ndarray
+    moved_deltas: np.ndarray
+    removed_ids: np.ndarray
+
+    def to_dict(self) -> dict:
+        """Legacy compute_state_delta dict (for apply_state_delta)."""
+        delta = dict(zip(self.added_ids.tolist(), self.added_vals.tolist()))
+        delta.update(zip(self.moved_ids.tolist(), self.moved_deltas.tolist()))
+        delta.update(dict.fromkeys(self.removed_ids.tolist()))
+        return delta
+
+    def to_bytes(self) -> bytes:
+        """Three uint32 counts (added, moved, removed), then each column's raw bytes."""
+        counts = np.array([len(self.added_ids), len(self.moved_ids), len(self.removed_ids)], dtype=np.uint32)
+        return b''.join(column.tobytes() for column in (counts, *self))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'StateDelta':
+        """Inverse of to_bytes (columns are read-only views of data)."""
+        added, moved, removed = np.frombuffer(data, dtype=np.uint32, count=3).tolist()
+        columns = []
+        offset = 12
+        for count in (added, added, moved, moved, removed):
+            columns.append(np.frombuffer(data, dtype=np.int64, count=count, offset=offset))
+            offset += count * 8
+        return cls(*columns)
+
+
+def compute_state_delta_arrays(old_state: dict, new_state: dict) -> StateDelta:
+    """
+    compute_state_delta, packed as typed arrays instead of a dict.
+
+    Same entries as compute_state_delta, grouped by kind, so the result
+    serializes with tobytes instead of pickling boxed ints.
+
+    Example:
+        >>> old = {1: 100, 2: 200, 3: 300}
+        >>> new = {1: 100, 2: 250, 4: 400}
+        >>> compute_state_delta_arrays(old, new).to_dict()
+        {4: 400, 2: 50, 3: None}
+    """
+    added_ids, added_vals, moved_ids, moved_deltas = [], [], [], []
+    old_get = old_state.get
+
+    for entity_id, new_pos in new_state.items():
+        old_pos = old_get(entity_id, _MISSING)
+        if old_pos is _MISSING:
+            added_ids.append(entity_id)
+            added_vals.append(new_pos)
+        elif old_pos != new_pos:
+            moved_ids.append(entity_id)
+            moved_deltas.append(new_pos - old_pos)
+
+    # Same early-exit removal scan as compute_state_delta
+    removed_ids = []
+    removed = len(old_state) - (len(new_state) - len(added_ids))
+    if removed:
+        for entity_id in old_state:
+            if entity_id not in new_state:
+                removed_ids.append(entity_id)
+                if len(removed_ids) == removed:
+                    break
+
+    return StateDelta(
+        np.array(added_ids, dtype=np.int64),
+        np.array(added_vals, dtype=np.int64),
+        np.array(moved_ids, dtype=np.int64),
+        np.array(moved_deltas, dtype=np.int64),
+        np.array(removed_ids, dtype=np.int64),
+    )
+
+
 def apply_state_delta(old_state: dict, delta: dict) -> dict:
     """
     Apply delta to reconstruct new state.
@@ -388,9 +684,12 @@ def compute_voxel_delta_xor(old_voxels: dict, new_voxels: dict) -> dict:
     XOR is perfect for bit-level changes in material IDs.
     If materials are similar, XOR result is small.
 
+    Accepts sparse dicts or dense arrays indexed by encoded position
+    (e.g. VoxelChunk.dense); dense pairs are diffed with one array XOR.
+
     Args:
-        old_voxels: Dict[encoded_pos, material_id]
-        new_voxels: Dict[encoded_pos, material_id]
+        old_voxels: Dict[encoded_pos, material_id] or uint8[CHUNK_VOLUME]
+        new_voxels: Same layout as old_voxels
 
     Returns:
         Delta dict with XOR changes
@@ -401,19 +700,26 @@ def compute_voxel_delta_xor(old_voxels: dict, new_voxels: dict) -> dict:
         >>> compute_voxel_delta_xor(old, new)
         {100: 0b0010}  # XOR = 0b0001 ^ 0b0011 = 0b0010
     """
-    delta = {}
+    if isinstance(old_voxels, np.ndarray):
+        xor = old_voxels ^ new_voxels
+        changed = np.flatnonzero(xor)
+        return dict(zip(changed.tolist(), xor[changed].tolist()))
 
-    # Check all positions in new state
-    all_positions = set(old_voxels.keys()) | set(new_voxels.keys())
-
-    for pos in all_positions:
-        old_material = old_voxels.get(pos, 0)  # 0 = air
-        new_material = new_voxels.get(pos, 0)
+    delta = {}
+    old_get = old_voxels.get
 
+    # Positions in new state (one probe into old state each)
+    for pos, new_material in new_voxels.items():
+        old_material = old_get(pos, 0)  # 0 = air
         if old_material != new_material:
             # Store XOR (detects bit-level changes)
             delta[pos] = old_material ^ new_material
 
+    # Positions only in old state became air: XOR with 0 is the old material
+    for pos, old_material in old_voxels.items():
+        if old_material and pos not in new_voxels:
+            delta[pos] = old_material
+
     return delta
 
 
@@ -451,21 +757,19 @@ def example_massive_crowd_delta():
 
     Demonstrates delta encoding for Synthactor crowds.
     """
-    # Frame N: 1000 NPCs
-    old_positions = {
-        npc_id: encode_tensor_pos(
-            10 + (npc_id % 15),      # X: 10-24
-            5,                        # Y: 5 (same level)
-            10 + ((npc_id // 15) % 15)  # Z: 10-24 (wrap to stay in bounds)
-        )
-        for npc_id in range(1000)
-    }
+    # Frame N: 1000 NPCs, encoded in one batch
+    npc_ids = np.arange(1000)
+    encoded = encode_tensor_pos_batch(
+        10 + (npc_ids % 15),          # X: 10-24
+        5,                            # Y: 5 (same level)
+        10 + ((npc_ids // 15) % 15),  # Z: 10-24 (wrap to stay in bounds)
+    )
+    old_positions = dict(zip(npc_ids.tolist(), encoded.tolist()))
 
     # Frame N+1: Only 50 NPCs moved (Cloud < 50, most stationary)
-    new_positions = old_positions.copy()
-    for moving_npc in range(0, 50):
-        x, y, z = decode_tensor_pos(old_positions[moving_npc])
-        new_positions[moving_npc] = encode_tensor_pos(x + 1, y, z)  # Step forward
+    moved = encoded.copy()
+    moved[:50] = offset_tensor_pos_batch(encoded[:50], dx=1)  # Step forward
+    new_positions = dict(zip(npc_ids.tolist(), moved.tolist()))
 
     # Compute delta
     delta = compute_state_delta(old_positions, new_positions)
@@ -483,6 +787,10 @@ def example_massive_crowd_delta():
     print(f"  Compression: {compression:.1f}x")
     print(f"  Bandwidth saved: {(1 - delta_size/full_size)*100:.1f}%")
 
+    packed = compute_state_delta_arrays(old_positions, new_positions)
+    assert packed.to_dict() == delta
+    print(f"  Packed wire format: {len(packed.to_bytes())} bytes (typed arrays)")
+
     return delta
 
 
@@ -559,6 +867,18 @@ def validate_encoding_roundtrip():
 
     print(f"✓ Validated {len(test_positions)} position encodings")
 
+    xs, ys, zs = (np.array(axis) for axis in zip(*test_positions))
+    encoded = encode_tensor_pos_batch(xs, ys, zs)
+    assert encoded.tolist() == [encode_tensor_pos(*pos) for pos in test_positions]
+    assert [a.tolist() for a in decode_tensor_pos_batch(encoded)] == [xs.tolist(), ys.tolist(), zs.tolist()]
+    print(f"✓ Batch encode/decode matches scalar encoding")
+
+    inner = (xs < 31) & (ys > 0) & (zs > 1)
+    stepped = offset_tensor_pos_batch(encoded[inner], dx=1, dy=-1, dz=-2)
+    assert stepped.tolist() == [encode_tensor_pos(x + 1, y - 1, z - 2)
+                                for x, y, z in zip(xs[inner], ys[inner], zs[inner])]
+    print(f"✓ Offsetting encoded positions matches re-encoding")
+
 
 def validate_encoding_32_roundtrip():
     """
@@ -584,6 +904,86 @@ def validate_encoding_32_roundtrip():
     print(f"✓ Validated {len(test_positions)} 32-bit position encodings")
 
 
+def validate_morton_roundtrip():
+    """
+    Validate Morton encoding over every chunk-local position.
+
+    Raises:
+        AssertionError: If the codes are not a bijection onto 0-32767
+    """
+    ys, zs, xs = (axis.ravel() for axis in np.indices((CHUNK_SIZE,) * 3))
+    codes = encode_morton_batch(xs, ys, zs)
+    assert np.array_equal(np.sort(codes), np.arange(CHUNK_VOLUME))
+    assert all(np.array_equal(a, b) for a, b in zip(decode_morton_batch(codes), (xs, ys, zs)))
+
+    for x, y, z in ((0, 0, 0), (31, 31, 31), (1, 2, 3), (10, 20, 30)):
+        assert decode_morton(encode_morton(x, y, z)) == (x, y, z)
+        assert encode_morton(x, y, z) == int(codes[encode_tensor_pos(x, y, z)])
+
+    # Every aligned 4³ block is one contiguous run of 64 codes
+    block = encode_morton_batch(*np.indices((4, 4, 4)).reshape(3, -1) + 8)
+    assert block.max() - block.min() == 63
+    print(f"✓ Validated {CHUNK_VOLUME:,} Morton encodings")
+
+    # Chunk keys: batch matches scalar, distinct, and cover the signed range
+    rng = np.random.default_rng(9)
+    chunks = rng.integers(-CHUNK_KEY_BIAS, CHUNK_KEY_BIAS, size=(3, 500))
+    chunks[:, :2] = [[-CHUNK_KEY_BIAS, CHUNK_KEY_BIAS - 1]] * 3
+    keys = encode_chunk_morton_batch(*chunks)
+    assert keys.min() >= 0 and len(set(keys.tolist())) == 500
+    assert keys.tolist() == [encode_chunk_morton(*pos) for pos in chunks.T.tolist()]
+    print(f"✓ Validated 63-bit chunk Morton keys")
+
+
+def validate_voxel_delta_xor():
+    """
+    Validate sparse and dense XOR deltas agree.
+
+    Raises:
+        AssertionError: If the two layouts give different deltas
+    """
+    rng = np.random.default_rng(11)
+    old_dense = (rng.integers(1, 8, CHUNK_VOLUME) * (rng.random(CHUNK_VOLUME) < 0.1)).astype(np.uint8)
+    new_dense = old_dense.copy()
+    new_dense[rng.integers(0, CHUNK_VOLUME, 500)] = rng.integers(0, 8, 500)
+
+    def to_sparse(dense):
+        encoded = np.flatnonzero(dense)
+        return dict(zip(encoded.tolist(), dense[encoded].tolist()))
+
+    sparse_delta = compute_voxel_delta_xor(to_sparse(old_dense), to_sparse(new_dense))
+    assert sparse_delta == compute_voxel_delta_xor(old_dense, new_dense)
+    assert {pos: old_dense[pos] ^ change for pos, change in sparse_delta.items()} == \
+        {pos: new_dense[pos] for pos in sparse_delta}
+    print(f"✓ Validated XOR delta ({len(sparse_delta)} changes, sparse == dense)")
+
+
+def validate_state_delta_arrays():
+    """
+    Validate the packed delta matches the dict delta and survives the wire.
+
+    Raises:
+        AssertionError: If packing, serialization or apply disagree
+    """
+    rng = np.random.default_rng(3)
+    old = dict(zip(range(2000), rng.integers(0, CHUNK_VOLUME, 2000).tolist()))
+    new = {i: pos + (1 if i % 7 == 0 else 0) for i, pos in old.items() if i % 11}
+    new.update({5000 + i: i for i in range(30)})
+    old[9999] = 0  # Falsy position, removed
+
+    delta = compute_state_delta(old, new)
+    packed = compute_state_delta_arrays(old, new)
+    assert packed.to_dict() == delta
+    wire = packed.to_bytes()
+    unpacked = StateDelta.from_bytes(wire)
+    assert all(np.array_equal(a, b) and a.dtype == b.dtype for a, b in zip(packed, unpacked))
+    assert apply_state_delta(old, unpacked.to_dict()) == new
+    assert compute_state_delta_arrays(new, new).to_bytes() == bytes(12)
+    big = compute_state_delta_arrays({1: 0}, {1: 1 << 40, 2: -(1 << 40)})  # Beyond int32
+    assert StateDelta.from_bytes(big.to_bytes()).to_dict() == {1: 1 << 40, 2: -(1 << 40)}
+    print(f"✓ Validated packed state delta ({len(delta)} entries, {len(wire)} wire bytes)")
+
+
 # =============================================================================
 # MAIN / DEMO
 # =============================================================================
@@ -599,6 +999,9 @@ if __name__ == "__main__":
     print("Testing position encoding...")
     validate_encoding_roundtrip()
     validate_encoding_32_roundtrip()
+    validate_morton_roundtrip()
+    validate_voxel_delta_xor()
+    validate_state_delta_arrays()
     print()
 
     # Show examples
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+VoxelKernels - Compiled Inner Loops
+
+Hot integer loops for world construction and chunk scans, JIT-compiled
+with Numba when it is installed. Every kernel has a vectorized NumPy fallback with identical
+output, so callers never need to check NUMBA_AVAILABLE themselves.
+
+Kernels write into caller-provided arrays and return the number of
+entries written; the public wrappers allocate from analytic sizes.
+"""
+
+from typing import Optional, Tuple
+import sys
+
+import numpy as np
+
+sys.path.insert(0, '.')
+from voxel_encoding import CHUNK_SIZE, decode_tensor_pos_batch
+
+# Optional JIT compiler
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# =============================================================================
+# SHELL FILL (corridor / zone bootstrap)
+# =============================================================================
+
+def _shell_loop(
+    x0, length, y_floor, y_ceiling, wall_y0, wall_y1, z0, width,
+    mat_floor, mat_wall, mat_ceiling, out_xyz, out_mat,
+):
+    """Enumerate floor, side walls, then ceiling in set_voxel order."""
+    idx = 0
+    for x in range(x0, x0 + length):
+        for z in range(z0, z0 + width):
+            out_xyz[idx, 0] = x
+            out_xyz[idx, 1] = y_floor
+            out_xyz[idx, 2] = z
+            out_mat[idx] = mat_floor
+            idx += 1
+
+    for x in range(x0, x0 + length):
+        for y in range(wall_y0, wall_y1):
+            out_xyz[idx, 0] = x
+            out_xyz[idx, 1] = y
+            out_xyz[idx, 2] = z0
+            out_mat[idx] = mat_wall
+            out_xyz[idx + 1, 0] = x
+            out_xyz[idx + 1, 1] = y
+            out_xyz[idx + 1, 2] = z0 + width - 1
+            out_mat[idx + 1] = mat_wall
+            idx += 2
+
+    for x in range(x0, x0 + length):
+        for z in range(z0, z0 + width):
+            out_xyz[idx, 0] = x
+            out_xyz[idx, 1] = y_ceiling
+            out_xyz[idx, 2] = z
+            out_mat[idx] = mat_ceiling
+            idx += 1
+
+    return idx
+
+
+def _shell_numpy(
+    x0, length, y_floor, y_ceiling, wall_y0, wall_y1, z0, width,
+    mat_floor, mat_wall, mat_ceiling, out_xyz, out_mat,
+):
+    """NumPy fallback for _shell_loop (same output order)."""
+    xs = np.arange(x0, x0 + length)
+    zs = np.arange(z0, z0 + width)
+    ys = np.arange(wall_y0, wall_y1)
+    side_zs = np.array([z0, z0 + width - 1])
+
+    idx = 0
+    for gx, gy, gz, material in (
+        (*np.meshgrid(xs, y_floor, zs, indexing='ij'), mat_floor),
+        (*np.meshgrid(xs, ys, side_zs, indexing='ij'), mat_wall),
+        (*np.meshgrid(xs, y_ceiling, zs, indexing='ij'), mat_ceiling),
+    ):
+        n = gx.size
+        out_xyz[idx:idx + n, 0] = gx.ravel()
+        out_xyz[idx:idx + n, 1] = gy.ravel()
+        out_xyz[idx:idx + n, 2] = gz.ravel()
+        out_mat[idx:idx + n] = material
+        idx += n
+    return idx
+
+
+_shell_kernel = njit(cache=True, boundscheck=False)(_shell_loop) if NUMBA_AVAILABLE else _shell_numpy
+
+
+def shell_counts(length: int, width: int, wall_y0: int, wall_y1: int) -> Tuple[int, int, int]:
+    """
+    Voxel counts (floor, walls, ceiling) written by enumerate_shell.
+
+    Example:
+        >>> shell_counts(128, 10, 1, 6)
+        (1280, 1280, 1280)
+    """
+    length, width = max(length, 0), max(width, 0)
+    walls = 2 * length * max(wall_y1 - wall_y0, 0)
+    return length * width, walls, length * width
+
+
+def enumerate_shell(
+    x0: int, length: int,
+    y_floor: int, y_ceiling: int,
+    wall_y0: int, wall_y1: int,
+    z0: int, width: int,
+    mat_floor: int, mat_wall: int, mat_ceiling: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Enumerate every voxel of a box shell (floor, two side walls, ceiling).
+
+    The floor and ceiling span x in [x0, x0+length) and z in [z0, z0+width);
+    the walls sit at z0 and z0+width-1 for y in [wall_y0, wall_y1).
+    Output order matches the original nested set_voxel loops, so applying
+    it with last-write-wins gives the same world.
+
+    Returns:
+        (xyz, materials): int64[N, 3] world coordinates and uint8[N] IDs
+
+    Example:
+        >>> xyz, mats = enumerate_shell(0, 4, 0, 3, 1, 3, 0, 2, 1, 2, 3)
+        >>> xyz.shape, mats.shape
+        ((32, 3), (32,))
+    """
+    total = sum(shell_counts(length, width, wall_y0, wall_y1))
+    out_xyz = np.empty((total, 3), dtype=np.int64)
+    out_mat = np.empty(total, dtype=np.uint8)
+    if total:
+        _shell_kernel(
+            x0, length, y_floor, y_ceiling, wall_y0, wall_y1, z0, width,
+            mat_floor, mat_wall, mat_ceiling, out_xyz, out_mat,
+        )
+    return out_xyz, out_mat
+
+
+# =============================================================================
+# NON-AIR EXTRACTION (dense chunk -> voxel columns)
+# =============================================================================
+
+def _nonair_loop(dense, out_x, out_y, out_z, out_mat):
+    """Decode every non-air voxel of a flat dense chunk in encoded order."""
+    idx = 0
+    for encoded in range(dense.shape[0]):
+        material = dense[encoded]
+        if material != 0:
+            out_x[idx] = encoded & 0x1f          # voxel_encoding YZX layout
+            out_y[idx] = encoded >> 10
+            out_z[idx] = (encoded >> 5) & 0x1f
+            out_mat[idx] = material
+            idx += 1
+    return idx
+
+
+_nonair_kernel = njit(cache=True, boundscheck=False)(_nonair_loop) if NUMBA_AVAILABLE else None
+
+
+def nonair_columns(
+    dense: np.ndarray, count: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Non-air voxels of a flat uint8[CHUNK_VOLUME] chunk as columns.
+
+    One pass over the chunk when compiled, instead of the nonzero scan,
+    gather and three decode passes of the NumPy fallback.
+
+    Args:
+        dense: Flat chunk indexed by encoded position
+        count: Number of non-air voxels, if already known
+
+    Returns:
+        (xs, ys, zs, materials): int32 local coords and uint8 IDs
+
+    Example:
+        >>> dense = np.zeros(32768, dtype=np.uint8)
+        >>> dense[1025] = 7
+        >>> [a.tolist() for a in nonair_columns(dense)]
+        [[1], [1], [0], [7]]
+    """
+    if _nonair_kernel is None:
+        encoded = np.flatnonzero(dense).astype(np.int32)
+        return (*decode_tensor_pos_batch(encoded), dense[encoded])
+
+    if count is None:
+        count = int(np.count_nonzero(dense))
+    out_x = np.empty(count, dtype=np.int32)
+    out_y = np.empty(count, dtype=np.int32)
+    out_z = np.empty(count, dtype=np.int32)
+    out_mat = np.empty(count, dtype=np.uint8)
+    if count:
+        _nonair_kernel(dense, out_x, out_y, out_z, out_mat)
+    return out_x, out_y, out_z, out_mat
+
+
+def _region_loop(dense, x_min, x_max, y_min, y_max, z_min, z_max, out_x, out_y, out_z, out_mat):
+    """Decode the non-air voxels of a local box in [y, z, x] order."""
+    idx = 0
+    for y in range(y_min, y_max + 1):
+        for z in range(z_min, z_max + 1):
+            row = (y << 10) | (z << 5)
+            for x in range(x_min, x_max + 1):
+                material = dense[row | x]
+                if material != 0:
+                    out_x[idx] = x
+                    out_y[idx] = y
+                    out_z[idx] = z
+                    out_mat[idx] = material
+                    idx += 1
+    return idx
+
+
+_region_kernel = njit(cache=True, boundscheck=False)(_region_loop) if NUMBA_AVAILABLE else None
+
+
+def region_columns(
+    dense: np.ndarray,
+    x_min: int, x_max: int,
+    y_min: int, y_max: int,
+    z_min: int, z_max: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Non-air voxels of a local box in a flat dense chunk as columns.
+
+    Compiled, the box walk, air test and coordinate decode are one loop;
+    the NumPy fallback slices the box and runs nonzero plus a gather.
+
+    Args:
+        dense: Flat chunk indexed by encoded position
+        x_min, x_max, y_min, y_max, z_min, z_max: Local bounds (inclusive, 0-31)
+
+    Returns:
+        (xs, ys, zs, materials): int32 local coords and uint8 IDs
+
+    Example:
+        >>> dense = np.zeros(32768, dtype=np.uint8)
+        >>> dense[[1025, 1026]] = 7
+        >>> [a.tolist() for a in region_columns(dense, 2, 31, 0, 31, 0, 31)]
+        [[2], [1], [0], [7]]
+    """
+    if _region_kernel is None:
+        box = dense.reshape(CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE)[
+            y_min:y_max + 1, z_min:z_max + 1, x_min:x_max + 1
+        ]
+        ys, zs, xs = np.nonzero(box)
+        return (
+            (xs + x_min).astype(np.int32),
+            (ys + y_min).astype(np.int32),
+            (zs + z_min).astype(np.int32),
+            box[ys, zs, xs],
+        )
+
+    volume = max(x_max - x_min + 1, 0) * max(y_max - y_min + 1, 0) * max(z_max - z_min + 1, 0)
+    out_x = np.empty(volume, dtype=np.int32)
+    out_y = np.empty(volume, dtype=np.int32)
+    out_z = np.empty(volume, dtype=np.int32)
+    out_mat = np.empty(volume, dtype=np.uint8)
+    n = _region_kernel(dense, x_min, x_max, y_min, y_max, z_min, z_max, out_x, out_y, out_z, out_mat) if volume else 0
+    return out_x[:n], out_y[:n], out_z[:n], out_mat[:n]
+
+
+# =============================================================================
+# VALIDATION
+# =============================================================================
+
+def validate_shell_kernel():
+    """Check the active kernel against the pure-Python loop."""
+    print("Validating shell kernel...")
+
+    cases = [
+        (0, 128, 0, 5, 1, 6, 0, 10),
+        (-7, 33, 4, 12, 5, 12, -40, 3),
+        (10, 5, 0, 1, 1, 1, 0, 1),
+    ]
+    for case in cases:
+        xyz, mats = enumerate_shell(*case, 1, 2, 3)
+        ref_xyz = np.empty_like(xyz)
+        ref_mat = np.empty_like(mats)
+        n = _shell_loop(*case, 1, 2, 3, ref_xyz, ref_mat)
+        assert n == len(xyz)
+        assert np.array_equal(xyz, ref_xyz) and np.array_equal(mats, ref_mat)
+        print(f"  ✓ {case}: {n} voxels")
+
+    print(f"  ✓ Backend: {'Numba' if NUMBA_AVAILABLE else 'NumPy'}")
+
+
+def validate_nonair_kernel():
+    """Check the active extraction kernel against the pure-Python loop."""
+    print("Validating non-air kernel...")
+
+    rng = np.random.default_rng(3)
+    for fill in (0.0, 0.01, 0.5, 1.0):
+        dense = np.where(rng.random(32768) < fill, rng.integers(1, 256, 32768), 0).astype(np.uint8)
+        columns = nonair_columns(dense)
+        reference = [np.empty_like(column, shape=32768) for column in columns]
+        n = _nonair_loop(dense, *reference)
+        assert all(np.array_equal(a, b[:n]) for a, b in zip(columns, reference))
+        assert all(np.array_equal(a, b) for a, b in zip(columns, nonair_columns(dense, count=n)))
+        print(f"  ✓ fill {fill:.0%}: {n} voxels")
+
+    print(f"  ✓ Backend: {'Numba' if NUMBA_AVAILABLE else 'NumPy'}")
+
+
+def validate_region_kernel():
+    """Check the active box-scan kernel against the pure-Python loop."""
+    print("Validating region kernel...")
+
+    rng = np.random.default_rng(4)
+    dense = np.where(rng.random(32768) < 0.3, rng.integers(1, 256, 32768), 0).astype(np.uint8)
+    for box in ((0, 31, 0, 31, 0, 31), (3, 20, 5, 9, 0, 31), (7, 7, 0, 31, 12, 12), (5, 4, 0, 31, 0, 31)):
+        columns = region_columns(dense, *box)
+        reference = [np.empty_like(column, shape=32768) for column in columns]
+        n = _region_loop(dense, *box, *reference)
+        assert all(np.array_equal(a, b[:n]) for a, b in zip(columns, reference))
+        print(f"  ✓ box {box}: {n} voxels")
+
+    print(f"  ✓ Backend: {'Numba' if NUMBA_AVAILABLE else 'NumPy'}")
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("VOXEL KERNELS")
+    print("=" * 80)
+    print()
+    validate_shell_kernel()
+    print()
+    validate_nonair_kernel()
+    print()
+    validate_region_kernel()
+    print()
+    print("=" * 80)
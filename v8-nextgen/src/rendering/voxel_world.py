@@ -12,17 +12,136 @@ Reference:
 
 from typing import Dict, Optional, Tuple, Iterator, List
 from dataclasses import dataclass
+from itertools import chain, compress
 import sys
 
+import numpy as np
+
 # Import chunk and encoding
 sys.path.insert(0, '.')
-from voxel_chunk import VoxelChunk
+from voxel_chunk import MAX_MATERIAL, POSITION_BYTES, SPARSE_ENTRY_BYTES, VoxelChunk
 from voxel_encoding import (
     CHUNK_SIZE,
+    CHUNK_SHIFT,
+    CHUNK_VOLUME,
+    encode_tensor_pos_batch,
+    decode_tensor_pos_batch,
+    encode_chunk_morton_batch,
     world_to_chunk,
-    world_to_local,
 )
 
+# Wire record for voxel replication (snapshot_bytes / apply_bytes):
+# little-endian int32 world coords plus the material byte, 13 bytes packed
+VOXEL_RECORD_DTYPE = np.dtype([('x', '<i4'), ('y', '<i4'), ('z', '<i4'), ('material', 'u1')])
+
+# Per-chunk header of a world snapshot (snapshot / load_snapshot): chunk
+# coords plus the byte length of the pack_rle payload that follows
+SNAPSHOT_HEADER_DTYPE = np.dtype([('cx', '<i4'), ('cy', '<i4'), ('cz', '<i4'), ('size', '<u4')])
+
+# Deltas smaller than this go through set_voxel one by one; below it the
+# fixed cost of grouping by chunk with array ops outweighs the per-call cost
+BULK_DELTA_MIN = 128
+
+# Unloaded chunks kept for reuse, so churny edits (footprints, sand) that
+# empty and refill chunks don't reallocate them
+CHUNK_POOL_SIZE = 256
+
+# LOD downsampling: a 2x2x2 block stays solid when at least this many of
+# its 8 voxels are (so single stray voxels vanish at distance)
+LOD_SOLID_MIN = 2
+
+
+def pack_voxel_records(xs, ys, zs, materials) -> bytes:
+    """
+    Pack world-space voxel writes into VOXEL_RECORD_DTYPE bytes.
+
+    Args:
+        xs, ys, zs: Equal-length integer arrays of world coordinates
+        materials: Material ID, or array of IDs matching xs (0 = air)
+
+    Returns:
+        13 bytes per voxel, ready for ChunkedVoxelWorld.apply_bytes
+
+    Example:
+        >>> len(pack_voxel_records(np.arange(4), np.zeros(4), np.zeros(4), 1))
+        52
+    """
+    xs = np.asarray(xs)
+    records = np.empty(xs.size, dtype=VOXEL_RECORD_DTYPE)
+    records['x'], records['y'], records['z'] = xs.ravel(), np.ravel(ys), np.ravel(zs)
+    records['material'] = np.ravel(materials) if np.ndim(materials) else materials
+    return records.tobytes()
+
+
+def pack_snapshot(payloads: Dict[Tuple[int, int, int], bytes]) -> bytes:
+    """
+    Concatenate per-chunk pack_rle payloads into one snapshot blob.
+
+    Args:
+        payloads: {(cx, cy, cz): pack_rle bytes}
+
+    Returns:
+        SNAPSHOT_HEADER_DTYPE header + payload per chunk
+
+    Example:
+        >>> len(pack_snapshot({(0, 0, 0): VoxelChunk((0, 0, 0)).pack_rle()}))
+        21
+    """
+    parts = []
+    for (cx, cy, cz), payload in payloads.items():
+        parts.append(np.array((cx, cy, cz, len(payload)), dtype=SNAPSHOT_HEADER_DTYPE).tobytes())
+        parts.append(payload)
+    return b''.join(parts)
+
+
+def unpack_snapshot(data: bytes) -> Dict[Tuple[int, int, int], bytes]:
+    """
+    Split a pack_snapshot blob back into per-chunk payloads.
+
+    Raises:
+        ValueError: If a header or payload runs past the end of data
+    """
+    payloads = {}
+    offset, header_size = 0, SNAPSHOT_HEADER_DTYPE.itemsize
+    while offset < len(data):
+        if offset + header_size > len(data):
+            raise ValueError(f"Snapshot truncated in chunk header at byte {offset}")
+        cx, cy, cz, size = np.frombuffer(data, dtype=SNAPSHOT_HEADER_DTYPE, count=1, offset=offset)[0].tolist()
+        offset += header_size
+        if offset + size > len(data):
+            raise ValueError(f"Snapshot truncated in chunk ({cx}, {cy}, {cz}) payload")
+        payloads[(cx, cy, cz)] = data[offset:offset + size]
+        offset += size
+    return payloads
+
+
+def downsample_dense(dense: np.ndarray) -> np.ndarray:
+    """
+    Halve a chunk's resolution: one voxel per 2x2x2 block.
+
+    A block is solid when at least LOD_SOLID_MIN of its voxels are, and
+    takes its most common solid material (the first one on ties).
+
+    Args:
+        dense: uint8[CHUNK_VOLUME] indexed by encoded position
+
+    Returns:
+        uint8[16, 16, 16] indexed [y, z, x]
+
+    Example:
+        >>> dense = np.zeros(CHUNK_VOLUME, dtype=np.uint8)
+        >>> dense[[0, 1, 2]] = [4, 4, 7]  # Two voxels in block 0, one in block 1
+        >>> downsample_dense(dense)[0, 0, :2].tolist()
+        [4, 0]
+    """
+    half = CHUNK_SIZE // 2
+    samples = dense.reshape(half, 2, half, 2, half, 2).transpose(0, 2, 4, 1, 3, 5).reshape(-1, 8)
+    votes = (samples[:, :, None] == samples[:, None, :]).sum(axis=2)
+    votes[samples == 0] = 0  # Air never wins the vote
+    winner = samples[np.arange(len(samples)), votes.argmax(axis=1)]
+    solid = np.count_nonzero(samples, axis=1) >= LOD_SOLID_MIN
+    return np.where(solid, winner, 0).astype(np.uint8).reshape(half, half, half)
+
 
 # =============================================================================
 # CHUNKED VOXEL WORLD (Stage 3: World Manager)
@@ -41,6 +160,15 @@ class ChunkedVoxelWorld:
     Attributes:
         chunks: Dict of {(cx, cy, cz): VoxelChunk}
         dirty_chunks: Set of chunk coords that need re-meshing
+        dirty_bounds: {(cx, cy, cz): [x0, y0, z0, x1, y1, z1]} local AABB
+                      (inclusive) of the voxels changed since last clear
+        edit_counts: {(cx, cy, cz): n} edits made to each loaded chunk; unlike
+                     dirty state this is never cleared, so caches can spot
+                     edits another consumer already drained
+        dirty_since: {(cx, cy, cz): n} edit count of the first edit covered
+                     by dirty_bounds (cleared with it)
+        lod: {level: {(cx, cy, cz): uint8[CHUNK_VOLUME]}} downsampled
+             summaries; a level-L node covers 2^L chunks per axis
 
     Example:
         >>> world = ChunkedVoxelWorld()
@@ -53,10 +181,62 @@ class ChunkedVoxelWorld:
         [(3, 6, 1)]
     """
 
-    def __init__(self):
-        """Initialize empty world."""
+    def __init__(self, lod_levels: int = 0):
+        """
+        Initialize empty world.
+
+        Args:
+            lod_levels: Number of coarse LOD levels to maintain (0 = none)
+        """
         self.chunks: Dict[Tuple[int, int, int], VoxelChunk] = {}
         self.dirty_chunks: set = set()  # Chunks needing re-mesh
+        self.dirty_bounds: Dict[Tuple[int, int, int], List[int]] = {}  # Changed local AABB per dirty chunk
+        self.edit_counts: Dict[Tuple[int, int, int], int] = {}  # Edits per loaded chunk (never drained)
+        self.dirty_since: Dict[Tuple[int, int, int], int] = {}  # edit_counts value of first edit in dirty_bounds
+        self._chunk_pool: List[VoxelChunk] = []  # Unloaded chunks kept for reuse
+        # One-entry lookup cache for set_voxel/get_voxel: neighbouring writes
+        # and ray steps mostly land in the chunk of the previous call.
+        # Only loaded chunks are cached; dropping any chunk clears it.
+        self._last_chunk_pos: Optional[Tuple[int, int, int]] = None
+        self._last_chunk: Optional[VoxelChunk] = None
+        # Loaded chunk keys as an (N, 3) array for vectorized distance tests;
+        # rebuilt lazily after any chunk is loaded or unloaded
+        self._chunk_keys: Optional[np.ndarray] = None
+        self._gpu_payloads: Dict[Tuple[int, int, int], np.ndarray] = {}  # pack_for_gpu of clean chunks
+        self.lod_levels = lod_levels
+        self.lod: Dict[int, Dict[Tuple[int, int, int], np.ndarray]] = {
+            level: {} for level in range(1, lod_levels + 1)
+        }
+
+    def _new_chunk(self, chunk_pos: Tuple[int, int, int]) -> VoxelChunk:
+        """Load an empty chunk at chunk_pos, recycling a pooled one if available."""
+        if self._chunk_pool:
+            chunk = self._chunk_pool.pop()
+            chunk.reset(chunk_pos)
+        else:
+            chunk = VoxelChunk(position=chunk_pos)
+        self.chunks[chunk_pos] = chunk
+        self._chunk_keys = None
+        return chunk
+
+    def _drop_chunk(self, chunk_pos: Tuple[int, int, int]) -> bool:
+        """Unload a chunk, forget its dirty state and pool it for reuse."""
+        chunk = self.chunks.get(chunk_pos)
+        if chunk is None:
+            return False
+        if self.lod_levels and chunk_pos in self.dirty_chunks:
+            self._refresh_lod((chunk_pos,))  # Flush edits the LOD hasn't seen yet
+        del self.chunks[chunk_pos]
+        self._last_chunk_pos = self._last_chunk = None
+        self._chunk_keys = None
+        self._gpu_payloads.pop(chunk_pos, None)
+        self.dirty_chunks.discard(chunk_pos)
+        self.dirty_bounds.pop(chunk_pos, None)
+        self.dirty_since.pop(chunk_pos, None)
+        self.edit_counts.pop(chunk_pos, None)
+        if len(self._chunk_pool) < CHUNK_POOL_SIZE:
+            self._chunk_pool.append(chunk)
+        return True
 
     # =========================================================================
     # CORE VOXEL ACCESS (World Space)
@@ -80,27 +260,107 @@ class ChunkedVoxelWorld:
             >>> world.is_chunk_dirty(3, 6, 1)
             True
         """
-        # Convert world → chunk + local
-        chunk_pos = world_to_chunk(world_x, world_y, world_z)
-        local_x, local_y, local_z = world_to_local(world_x, world_y, world_z)
-
-        # Get or create chunk
-        if chunk_pos not in self.chunks:
-            if material == 0:
-                return  # Don't create chunk just to set air
-            self.chunks[chunk_pos] = VoxelChunk(position=chunk_pos)
+        assert not material & ~MAX_MATERIAL, f"Material {material} out of range (must be 0-{MAX_MATERIAL})"
+
+        # Convert world → chunk + local (inline world_to_chunk/world_to_local:
+        # arithmetic shift floors like //, & 31 wraps like %)
+        chunk_pos = (world_x >> CHUNK_SHIFT, world_y >> CHUNK_SHIFT, world_z >> CHUNK_SHIFT)
+        local_x, local_y, local_z = world_x & 31, world_y & 31, world_z & 31
+
+        # Get or create chunk (same chunk as last call skips the dict probe)
+        if chunk_pos == self._last_chunk_pos:
+            chunk = self._last_chunk
+        else:
+            chunk = self.chunks.get(chunk_pos)
+            if chunk is None:
+                if material == 0:
+                    return  # Don't create chunk just to set air
+                chunk = self._new_chunk(chunk_pos)
+            self._last_chunk_pos, self._last_chunk = chunk_pos, chunk
 
         # Set voxel in chunk
-        chunk = self.chunks[chunk_pos]
-        chunk.set_voxel(local_x, local_y, local_z, material)
+        chunk.set_voxel_unchecked((local_y << 10) | (local_z << 5) | local_x, material)  # Local coords are in range
 
         # Mark chunk dirty (needs re-mesh)
         self.dirty_chunks.add(chunk_pos)
+        self._grow_dirty_bounds(chunk_pos, local_x, local_y, local_z, local_x, local_y, local_z)
+
+        # Remove empty chunks to save memory (only an air write can empty one)
+        if material == 0 and chunk.is_empty():
+            self._drop_chunk(chunk_pos)
 
-        # Remove empty chunks to save memory
-        if chunk.is_empty():
-            del self.chunks[chunk_pos]
-            self.dirty_chunks.discard(chunk_pos)  # No longer dirty if deleted
+    def set_voxels_bulk(self, xs: np.ndarray, ys: np.ndarray, zs: np.ndarray, materials) -> int:
+        """
+        Set many voxels at world coordinates in one call.
+
+        Coordinates are split into chunk + local with array ops and each
+        touched chunk receives a single batched write, so there is no
+        per-voxel Python dispatch. Same semantics as calling set_voxel
+        in array order.
+
+        Args:
+            xs, ys, zs: Equal-length integer arrays of world coordinates
+            materials: Material ID, or array of IDs matching xs
+
+        Returns:
+            Number of voxels written
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> xs, zs = np.meshgrid(np.arange(64), np.arange(4), indexing='ij')
+            >>> world.set_voxels_bulk(xs.ravel(), np.zeros(xs.size, int), zs.ravel(), 1)
+            256
+            >>> world.chunk_count()
+            2
+        """
+        xs = np.asarray(xs, dtype=np.int64).ravel()
+        ys = np.asarray(ys, dtype=np.int64).ravel()
+        zs = np.asarray(zs, dtype=np.int64).ravel()
+        per_voxel = np.ndim(materials) != 0
+        if per_voxel:
+            materials = np.asarray(materials).ravel()
+        if xs.size == 0:
+            return 0
+
+        # World → chunk + local (same floor semantics as world_to_chunk)
+        cx, lx = np.divmod(xs, CHUNK_SIZE)
+        cy, ly = np.divmod(ys, CHUNK_SIZE)
+        cz, lz = np.divmod(zs, CHUNK_SIZE)
+        encoded = encode_tensor_pos_batch(lx, ly, lz)
+
+        # Group by chunk on one Morton key (chunks visited in Z-order); the
+        # sort is stable so last write still wins
+        keys = encode_chunk_morton_batch(cx, cy, cz)
+        order = np.argsort(keys, kind='stable')
+        keys, cx, cy, cz, encoded = keys[order], cx[order], cy[order], cz[order], encoded[order]
+        if per_voxel:
+            materials = materials[order]
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        ends = np.append(starts[1:], xs.size)
+
+        # Per-chunk dirty AABBs in one segmented reduction per axis
+        local = decode_tensor_pos_batch(encoded)
+        lows = zip(*(np.minimum.reduceat(axis, starts).tolist() for axis in local))
+        highs = zip(*(np.maximum.reduceat(axis, starts).tolist() for axis in local))
+        positions = zip(cx[starts].tolist(), cy[starts].tolist(), cz[starts].tolist())
+
+        for start, end, chunk_pos, low, high in zip(starts.tolist(), ends.tolist(), positions, lows, highs):
+            chunk_materials = materials[start:end] if per_voxel else materials
+
+            chunk = self.chunks.get(chunk_pos)
+            if chunk is None:
+                if not np.any(chunk_materials):
+                    continue  # Don't create chunk just to set air
+                chunk = self._new_chunk(chunk_pos)
+
+            chunk.set_voxels_encoded(encoded[start:end], chunk_materials)
+            self.dirty_chunks.add(chunk_pos)
+            self._grow_dirty_bounds(chunk_pos, *low, *high)
+
+            if chunk.is_empty():
+                self._drop_chunk(chunk_pos)
+
+        return int(xs.size)
 
     def get_voxel(self, world_x: int, world_y: int, world_z: int) -> int:
         """
@@ -120,15 +380,19 @@ class ChunkedVoxelWorld:
             >>> world.get_voxel(0, 0, 0)  # Unloaded chunk = air
             0
         """
-        # Convert world → chunk + local
-        chunk_pos = world_to_chunk(world_x, world_y, world_z)
+        # Convert world → chunk (inline world_to_chunk)
+        chunk_pos = (world_x >> CHUNK_SHIFT, world_y >> CHUNK_SHIFT, world_z >> CHUNK_SHIFT)
+        if chunk_pos == self._last_chunk_pos:
+            chunk = self._last_chunk
+        else:
+            chunk = self.chunks.get(chunk_pos)
 
-        # Return air if chunk not loaded
-        if chunk_pos not in self.chunks:
-            return 0
+            # Return air if chunk not loaded
+            if chunk is None:
+                return 0
+            self._last_chunk_pos, self._last_chunk = chunk_pos, chunk
 
-        local_x, local_y, local_z = world_to_local(world_x, world_y, world_z)
-        return self.chunks[chunk_pos].get_voxel(local_x, local_y, local_z)
+        return chunk.get_voxel_unchecked(((world_y & 31) << 10) | ((world_z & 31) << 5) | (world_x & 31))
 
     # =========================================================================
     # CHUNK MANAGEMENT
@@ -170,14 +434,18 @@ class ChunkedVoxelWorld:
             (0, 0, 0)
         """
         chunk_pos = (cx, cy, cz)
-        if chunk_pos not in self.chunks:
-            self.chunks[chunk_pos] = VoxelChunk(position=chunk_pos)
-        return self.chunks[chunk_pos]
+        chunk = self.chunks.get(chunk_pos)
+        if chunk is None:
+            chunk = self._new_chunk(chunk_pos)
+        return chunk
 
     def unload_chunk(self, cx: int, cy: int, cz: int) -> bool:
         """
         Unload chunk at coordinates.
 
+        The chunk object goes back to the world's pool and is reused by
+        later loads, so don't keep references to it past this call.
+
         Args:
             cx, cy, cz: Chunk coordinates
 
@@ -192,12 +460,89 @@ class ChunkedVoxelWorld:
             >>> world.get_voxel(100, 200, 50)  # Now returns air
             0
         """
+        return self._drop_chunk((cx, cy, cz))
+
+    def put_chunk(self, chunk: VoxelChunk) -> None:
+        """
+        Store a chunk at its position, replacing any loaded one, and mark it dirty.
+
+        Use this instead of assigning into world.chunks directly so the
+        set_voxel/get_voxel lookup cache never returns the replaced chunk.
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> chunk = VoxelChunk(position=(1, 0, 0))
+            >>> chunk.set_voxel(0, 0, 0, 4)
+            >>> world.put_chunk(chunk)
+            >>> world.get_voxel(32, 0, 0)
+            4
+        """
+        chunk_pos = chunk.position
+        self.chunks[chunk_pos] = chunk
+        self._chunk_keys = None
+        if chunk_pos == self._last_chunk_pos:
+            self._last_chunk = chunk
+        self.mark_chunk_dirty(*chunk_pos)
+
+    def pack_chunk_for_gpu(self, cx: int, cy: int, cz: int) -> Optional[np.ndarray]:
+        """
+        VoxelChunk.pack_for_gpu buffer of a loaded chunk, cached while clean.
+
+        A clean chunk's buffer is built once and returned by reference
+        (read-only) until the chunk is edited. Dirty chunks are repacked
+        on every call; clear_dirty_chunks drops their stale buffers.
+
+        Args:
+            cx, cy, cz: Chunk coordinates
+
+        Returns:
+            uint32 buffer (see VoxelChunk.pack_for_gpu), or None if not loaded
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.set_voxel(37, 10, 15, 1)
+            >>> world.clear_dirty_chunks()
+            1
+            >>> world.pack_chunk_for_gpu(1, 0, 0) is world.pack_chunk_for_gpu(1, 0, 0)
+            True
+        """
         chunk_pos = (cx, cy, cz)
-        if chunk_pos in self.chunks:
-            del self.chunks[chunk_pos]
-            self.dirty_chunks.discard(chunk_pos)  # Clean up dirty tracking
-            return True
-        return False
+        dirty = chunk_pos in self.dirty_chunks
+        packed = self._gpu_payloads.get(chunk_pos)
+        if packed is not None and not dirty:
+            return packed
+
+        chunk = self.chunks.get(chunk_pos)
+        if chunk is None:
+            return None
+        packed = chunk.pack_for_gpu()
+        packed.flags.writeable = False
+        if not dirty:
+            self._gpu_payloads[chunk_pos] = packed
+        return packed
+
+    def chunk_positions(self) -> np.ndarray:
+        """
+        Loaded chunk coordinates as a read-only int64[N, 3] array.
+
+        Rows follow self.chunks order. The array is cached until a chunk is
+        loaded or unloaded, so repeated distance or culling tests between
+        streaming steps skip rebuilding it from the dict keys.
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.set_voxel(0, 0, 0, 1)
+            >>> world.set_voxel(-40, 70, 5, 1)
+            >>> world.chunk_positions().tolist()
+            [[0, 0, 0], [-2, 2, 0]]
+        """
+        keys = self._chunk_keys
+        if keys is None or len(keys) != len(self.chunks):
+            count = len(self.chunks)
+            keys = np.fromiter(chain.from_iterable(self.chunks), dtype=np.int64, count=3 * count).reshape(count, 3)
+            keys.flags.writeable = False
+            self._chunk_keys = keys
+        return keys
 
     def chunk_count(self) -> int:
         """
@@ -225,6 +570,9 @@ class ChunkedVoxelWorld:
         """
         Get list of chunks that need re-meshing.
 
+        Copies the dirty set; per-frame consumers that clear it anyway
+        should use take_dirty_chunks instead.
+
         Returns:
             List of dirty chunk coordinates
 
@@ -253,9 +601,37 @@ class ChunkedVoxelWorld:
             >>> world.get_dirty_chunks()
             []
         """
-        count = len(self.dirty_chunks)
-        self.dirty_chunks.clear()
-        return count
+        return len(self.take_dirty_chunks())
+
+    def take_dirty_chunks(self) -> set:
+        """
+        Hand over the dirty set and start a fresh one.
+
+        Same effect as get_dirty_chunks + clear_dirty_chunks, but the set
+        itself is returned instead of copied, so the cost does not grow
+        with the number of dirty chunks. dirty_bounds is reset too.
+
+        Returns:
+            Set of chunk coordinates that were dirty (now owned by the caller)
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.set_voxel(100, 200, 50, 1)
+            >>> world.take_dirty_chunks()
+            {(3, 6, 1)}
+            >>> world.get_dirty_chunks()
+            []
+        """
+        dirty = self.dirty_chunks
+        if self.lod_levels:
+            self._refresh_lod(dirty)
+        if self._gpu_payloads:
+            for chunk_pos in dirty:
+                self._gpu_payloads.pop(chunk_pos, None)
+        self.dirty_chunks = set()
+        self.dirty_bounds = {}
+        self.dirty_since = {}
+        return dirty
 
     def is_chunk_dirty(self, cx: int, cy: int, cz: int) -> bool:
         """
@@ -291,6 +667,24 @@ class ChunkedVoxelWorld:
         """
         if (cx, cy, cz) in self.chunks:
             self.dirty_chunks.add((cx, cy, cz))
+            # Unknown change - treat the whole chunk as touched
+            last = CHUNK_SIZE - 1
+            self._grow_dirty_bounds((cx, cy, cz), 0, 0, 0, last, last, last)
+
+    def _grow_dirty_bounds(self, chunk_pos: Tuple[int, int, int], x0: int, y0: int, z0: int, x1: int, y1: int, z1: int) -> None:
+        """Union a local AABB (inclusive) into the chunk's dirty bounds and count the edit."""
+        edits = self.edit_counts[chunk_pos] = self.edit_counts.get(chunk_pos, 0) + 1
+        bounds = self.dirty_bounds.get(chunk_pos)
+        if bounds is None:
+            self.dirty_bounds[chunk_pos] = [x0, y0, z0, x1, y1, z1]
+            self.dirty_since[chunk_pos] = edits
+            return
+        if x0 < bounds[0]: bounds[0] = x0
+        if y0 < bounds[1]: bounds[1] = y0
+        if z0 < bounds[2]: bounds[2] = z0
+        if x1 > bounds[3]: bounds[3] = x1
+        if y1 > bounds[4]: bounds[4] = y1
+        if z1 > bounds[5]: bounds[5] = z1
 
     # =========================================================================
     # CHUNK LIFETIME MANAGEMENT (Responsibility #4)
@@ -318,22 +712,41 @@ class ChunkedVoxelWorld:
             1
         """
         center_chunk = world_to_chunk(center_x, center_y, center_z)
-        cx_center, cy_center, cz_center = center_chunk
+        if not self.chunks:
+            return 0
 
-        to_unload = []
-        for chunk_pos in list(self.chunks.keys()):
-            cx, cy, cz = chunk_pos
-            # Chebyshev distance (max of absolute differences)
-            distance = max(abs(cx - cx_center), abs(cy - cy_center), abs(cz - cz_center))
-            if distance > max_distance:
-                to_unload.append(chunk_pos)
+        # Chebyshev distance (max of absolute differences) over all chunk
+        # keys at once; far rows are picked from the keys in dict order
+        far = (np.abs(self.chunk_positions() - center_chunk) > max_distance).any(axis=1)
+        to_unload = list(compress(self.chunks, far.tolist()))
 
         for chunk_pos in to_unload:
-            del self.chunks[chunk_pos]
-            self.dirty_chunks.discard(chunk_pos)
+            self._drop_chunk(chunk_pos)
 
         return len(to_unload)
 
+    def prune_empty_chunks(self) -> int:
+        """
+        Unload every chunk that holds only air, in one sweep.
+
+        World writes drop chunks they empty, but chunks created by
+        load_chunk or edited through get_chunk() can be left empty; run
+        this after such bulk edits.
+
+        Returns:
+            Number of chunks unloaded
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.load_chunk(0, 0, 0)
+            >>> world.prune_empty_chunks()
+            1
+        """
+        empty = [chunk_pos for chunk_pos, chunk in self.chunks.items() if chunk.is_empty()]
+        for chunk_pos in empty:
+            self._drop_chunk(chunk_pos)
+        return len(empty)
+
     # =========================================================================
     # DELTABUS INTEGRATION (Responsibility #6)
     # =========================================================================
@@ -342,6 +755,10 @@ class ChunkedVoxelWorld:
         """
         Apply voxel changes from DeltaBus event.
 
+        Large deltas are written through set_voxels_bulk (one batched
+        write per touched chunk); either way the result matches
+        set_voxel calls in dict order.
+
         Args:
             delta_dict: {(world_x, world_y, world_z): material_id}
 
@@ -356,11 +773,53 @@ class ChunkedVoxelWorld:
             >>> world.voxel_count()
             3
         """
-        count = 0
-        for (x, y, z), material in delta_dict.items():
-            self.set_voxel(x, y, z, material)
-            count += 1
-        return count
+        count = len(delta_dict)
+        if count < BULK_DELTA_MIN:
+            for (x, y, z), material in delta_dict.items():
+                self.set_voxel(x, y, z, material)
+            return count
+
+        # Large deltas: unpack keys and values into arrays, one write per chunk
+        coords = np.fromiter(chain.from_iterable(delta_dict), dtype=np.int64, count=3 * count).reshape(count, 3)
+        materials = np.fromiter(delta_dict.values(), dtype=np.int64, count=count)
+        assert not (materials & ~MAX_MATERIAL).any(), f"Material out of range (must be 0-{MAX_MATERIAL})"
+        return self.set_voxels_bulk(coords[:, 0], coords[:, 1], coords[:, 2], materials.astype(np.uint8))
+
+    def apply_bytes(self, data: bytes) -> int:
+        """
+        Apply voxel records packed by pack_voxel_records or snapshot_bytes.
+
+        Records are written in order through set_voxels_bulk, so air
+        records carve and the last record for a position wins.
+
+        Args:
+            data: Concatenated VOXEL_RECORD_DTYPE records
+
+        Returns:
+            Number of voxels written
+
+        Raises:
+            ValueError: If data is not a whole number of records
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.apply_bytes(pack_voxel_records([0, 100], [0, 200], [0, 50], [1, 2]))
+            2
+        """
+        records = np.frombuffer(data, dtype=VOXEL_RECORD_DTYPE)
+        return self.set_voxels_bulk(records['x'], records['y'], records['z'], records['material'])
+
+    def snapshot_bytes(self) -> bytes:
+        """
+        Every non-air voxel as packed VOXEL_RECORD_DTYPE records.
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.set_voxel(5, 10, 15, 1)
+            >>> len(world.snapshot_bytes())
+            13
+        """
+        return pack_voxel_records(*self.iter_voxels_soa())
 
     def apply_region_change(
         self,
@@ -407,6 +866,10 @@ class ChunkedVoxelWorld:
         """
         Fill a box region in world space.
 
+        Splits the box into chunk tiles and writes each with one slice
+        assignment (see fill_aabb); the result and dirty tracking match
+        per-voxel set_voxel calls.
+
         Args:
             x_min, x_max: X range (inclusive, world coords)
             y_min, y_max: Y range (inclusive, world coords)
@@ -421,12 +884,88 @@ class ChunkedVoxelWorld:
             >>> world.fill_box(0, 63, 0, 63, 0, 31, material=1)
             131072  # 64x64x32 = 131,072 voxels
         """
+        return self.fill_aabb(x_min, x_max, y_min, y_max, z_min, z_max, material)
+
+    def iter_chunk_tiles(
+        self,
+        x_min: int, x_max: int,
+        y_min: int, y_max: int,
+        z_min: int, z_max: int
+    ) -> Iterator[Tuple[Tuple[int, int, int], Tuple[int, int, int, int, int, int]]]:
+        """
+        Split a world box into per-chunk pieces (loaded or not).
+
+        Args:
+            x_min, x_max, y_min, y_max, z_min, z_max: World bounds (inclusive)
+
+        Yields:
+            (chunk_pos, (lx_min, lx_max, ly_min, ly_max, lz_min, lz_max)) in local coords
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> [pos for pos, _ in world.iter_chunk_tiles(0, 40, 0, 0, 0, 0)]
+            [(0, 0, 0), (1, 0, 0)]
+        """
+        if x_min > x_max or y_min > y_max or z_min > z_max:
+            return
+
+        # Chunk range and origins by shifts; tiles are clamped by subtraction only
+        last = CHUNK_SIZE - 1
+        for cx in range(x_min >> CHUNK_SHIFT, (x_max >> CHUNK_SHIFT) + 1):
+            bx = cx << CHUNK_SHIFT
+            for cy in range(y_min >> CHUNK_SHIFT, (y_max >> CHUNK_SHIFT) + 1):
+                by = cy << CHUNK_SHIFT
+                for cz in range(z_min >> CHUNK_SHIFT, (z_max >> CHUNK_SHIFT) + 1):
+                    bz = cz << CHUNK_SHIFT
+                    yield (cx, cy, cz), (
+                        max(x_min - bx, 0), min(x_max - bx, last),
+                        max(y_min - by, 0), min(y_max - by, last),
+                        max(z_min - bz, 0), min(z_max - bz, last),
+                    )
+
+    def fill_aabb(
+        self,
+        x_min: int, x_max: int,
+        y_min: int, y_max: int,
+        z_min: int, z_max: int,
+        material: int
+    ) -> int:
+        """
+        Fill a world box with one slice write per chunk it touches.
+
+        Same result as per-voxel set_voxel calls over the box, but each
+        chunk tile goes through VoxelChunk.fill_aabb.
+
+        Args:
+            x_min, x_max, y_min, y_max, z_min, z_max: World bounds (inclusive)
+            material: Material ID to fill with
+
+        Returns:
+            Number of voxels set
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.fill_aabb(0, 127, 0, 0, 0, 9, material=1)
+            1280
+        """
         count = 0
-        for x in range(x_min, x_max + 1):
-            for y in range(y_min, y_max + 1):
-                for z in range(z_min, z_max + 1):
-                    self.set_voxel(x, y, z, material)
-                    count += 1
+        for chunk_pos, local in self.iter_chunk_tiles(x_min, x_max, y_min, y_max, z_min, z_max):
+            lx0, lx1, ly0, ly1, lz0, lz1 = local
+            count += (lx1 - lx0 + 1) * (ly1 - ly0 + 1) * (lz1 - lz0 + 1)
+
+            chunk = self.chunks.get(chunk_pos)
+            if chunk is None:
+                if material == 0:
+                    continue  # Don't create chunk just to set air
+                chunk = self._new_chunk(chunk_pos)
+
+            chunk.fill_aabb(*local, material)
+            self.dirty_chunks.add(chunk_pos)
+            self._grow_dirty_bounds(chunk_pos, lx0, ly0, lz0, lx1, ly1, lz1)
+
+            if material == 0 and chunk.is_empty():
+                self._drop_chunk(chunk_pos)
+
         return count
 
     def clear_all(self) -> None:
@@ -442,6 +981,95 @@ class ChunkedVoxelWorld:
             0
         """
         self.chunks.clear()
+        self.dirty_chunks.clear()
+        self.dirty_bounds.clear()
+        self.dirty_since.clear()
+        self.edit_counts.clear()
+        self._last_chunk_pos = self._last_chunk = None
+        self._chunk_keys = None
+        self._gpu_payloads.clear()
+        for nodes in self.lod.values():
+            nodes.clear()
+
+    # =========================================================================
+    # LEVEL OF DETAIL
+    # =========================================================================
+
+    def _refresh_lod(self, chunk_positions) -> None:
+        """
+        Rewrite the LOD octants covering the given LOD0 chunks, level by level.
+
+        Only the octants of changed children are rewritten, so summaries of
+        chunks unloaded by unload_far_chunks stay in their parent nodes.
+        """
+        half = CHUNK_SIZE // 2
+        changed = set(chunk_positions)
+        for level in range(1, self.lod_levels + 1):
+            children = self.chunks if level == 1 else self.lod[level - 1]
+            nodes = self.lod[level]
+            parents = set()
+            for cx, cy, cz in changed:
+                parent_pos = (cx >> 1, cy >> 1, cz >> 1)
+                child = children.get((cx, cy, cz))
+                node = nodes.get(parent_pos)
+                if node is None:
+                    if child is None:
+                        continue
+                    node = nodes[parent_pos] = np.zeros(CHUNK_VOLUME, dtype=np.uint8)
+                oy, oz, ox = (cy & 1) * half, (cz & 1) * half, (cx & 1) * half
+                octant = node.reshape(CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE)[oy:oy + half, oz:oz + half, ox:ox + half]
+                if child is None:
+                    octant[...] = 0
+                elif level > 1:
+                    octant[...] = downsample_dense(child)
+                elif child.dense is not None:
+                    octant[...] = downsample_dense(child.dense)
+                else:
+                    dense = np.zeros(CHUNK_VOLUME, dtype=np.uint8)
+                    count = len(child.data)
+                    dense[np.fromiter(child.data.keys(), dtype=np.int64, count=count)] = \
+                        np.fromiter(child.data.values(), dtype=np.uint8, count=count)
+                    octant[...] = downsample_dense(dense)
+                parents.add(parent_pos)
+            for parent_pos in parents:
+                if not nodes[parent_pos].any():
+                    del nodes[parent_pos]
+            changed = parents
+
+    def get_voxel_lod(self, world_x: int, world_y: int, world_z: int, lod: int) -> int:
+        """
+        Get the summarized material at world coordinates from an LOD level.
+
+        Level L answers for 2^L-voxel cells. LOD levels are refreshed from
+        dirty chunks in clear_dirty_chunks (and before a dirty chunk is
+        unloaded), so they lag LOD0 by at most one re-mesh.
+
+        Args:
+            world_x, world_y, world_z: World coordinates
+            lod: 0 for full-resolution voxels, 1..lod_levels for summaries
+
+        Returns:
+            Material ID (0 = air or no summary)
+
+        Example:
+            >>> world = ChunkedVoxelWorld(lod_levels=1)
+            >>> world.fill_box(0, 63, 0, 1, 0, 63, material=2)
+            8192
+            >>> world.clear_dirty_chunks()
+            4
+            >>> world.unload_far_chunks(1000, 0, 0, max_distance=2)
+            4
+            >>> world.get_voxel_lod(10, 0, 10, lod=1)  # Still answers after unload
+            2
+        """
+        if lod == 0:
+            return self.get_voxel(world_x, world_y, world_z)
+        shift = CHUNK_SHIFT + lod
+        node = self.lod[lod].get((world_x >> shift, world_y >> shift, world_z >> shift))
+        if node is None:
+            return 0
+        lx, ly, lz = (world_x >> lod) & 31, (world_y >> lod) & 31, (world_z >> lod) & 31
+        return int(node[(ly << 10) | (lz << 5) | lx])
 
     # =========================================================================
     # STATS & ITERATION
@@ -461,7 +1089,86 @@ class ChunkedVoxelWorld:
             >>> world.voxel_count()
             2
         """
-        return sum(chunk.voxel_count() for chunk in self.chunks.values())
+        sparse_voxels, dense_chunks, dense_air = self._storage_totals()
+        return sparse_voxels + dense_chunks * CHUNK_VOLUME - dense_air
+
+    def get_bounds(self) -> Optional[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]:
+        """
+        Get world-space bounding box of all non-air voxels.
+
+        Only chunks on the outer faces of the loaded chunk grid can hold
+        an extreme voxel, so just those are scanned (VoxelChunk.get_bounds);
+        if one of them is empty, every chunk is scanned instead.
+
+        Returns:
+            ((x_min, y_min, z_min), (x_max, y_max, z_max)) or None if empty
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.set_voxel(5, 10, 15, 1)
+            >>> world.set_voxel(-40, 200, 50, 2)
+            >>> world.get_bounds()
+            ((-40, 10, 15), (5, 200, 50))
+        """
+        if not self.chunks:
+            return None
+        keys = self.chunk_positions()
+        on_hull = ((keys == keys.min(axis=0)) | (keys == keys.max(axis=0))).any(axis=1)
+        candidates = list(compress(self.chunks.values(), on_hull.tolist()))
+        if any(chunk.is_empty() for chunk in candidates):
+            candidates = self.chunks.values()
+
+        lo = hi = None
+        for chunk in candidates:
+            bounds = chunk.get_bounds()
+            if bounds is None:
+                continue
+            base = [c << CHUNK_SHIFT for c in chunk.position]
+            chunk_lo = [b + c for b, c in zip(base, bounds[0])]
+            chunk_hi = [b + c for b, c in zip(base, bounds[1])]
+            lo = chunk_lo if lo is None else list(map(min, lo, chunk_lo))
+            hi = chunk_hi if hi is None else list(map(max, hi, chunk_hi))
+        if lo is None:
+            return None
+        return tuple(lo), tuple(hi)
+
+    def _storage_totals(self) -> Tuple[int, int, int]:
+        """
+        One pass over chunk storage: (sparse voxels, dense chunks, dense air).
+
+        Reads storage directly rather than calling voxel_count() and
+        total_bytes() per chunk; the stats calls run every frame.
+        """
+        sparse_voxels = dense_chunks = dense_air = 0
+        for chunk in self.chunks.values():
+            if chunk.dense is None:
+                sparse_voxels += len(chunk.data)
+            else:
+                dense_chunks += 1
+                dense_air += int(chunk.material_counts[0])
+        return sparse_voxels, dense_chunks, dense_air
+
+    def count_material(self, material: int) -> int:
+        """
+        Count voxels of a material across all chunks.
+
+        Reads each chunk's material histogram, so the cost is per chunk,
+        not per voxel.
+
+        Args:
+            material: Material ID to count
+
+        Returns:
+            Number of voxels with that material
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.fill_box(0, 63, 0, 0, 0, 9, 4)
+            640
+            >>> world.count_material(4)
+            640
+        """
+        return sum(chunk.count_material(material) for chunk in self.chunks.values())
 
     def memory_usage(self) -> Dict[str, int]:
         """
@@ -478,13 +1185,11 @@ class ChunkedVoxelWorld:
             >>> stats['voxel_count']
             131072
         """
-        total_voxels = 0
-        total_bytes = 0
-
-        for chunk in self.chunks.values():
-            chunk_stats = chunk.memory_usage()
-            total_voxels += chunk_stats['voxel_count']
-            total_bytes += chunk_stats['total_bytes']
+        # Same totals as summing voxel_count() and total_bytes() per chunk
+        sparse_voxels, dense_chunks, dense_air = self._storage_totals()
+        total_voxels = sparse_voxels + dense_chunks * CHUNK_VOLUME - dense_air
+        total_bytes = (sparse_voxels * SPARSE_ENTRY_BYTES + dense_chunks * CHUNK_VOLUME
+                       + len(self.chunks) * POSITION_BYTES)
 
         return {
             'chunk_count': len(self.chunks),
@@ -494,6 +1199,87 @@ class ChunkedVoxelWorld:
             'bytes_per_chunk': total_bytes / len(self.chunks) if self.chunks else 0,
         }
 
+    def snapshot_rle(self) -> Dict[Tuple[int, int, int], bytes]:
+        """
+        Run-length pack every loaded chunk (see VoxelChunk.pack_rle).
+
+        Returns:
+            Dict mapping chunk coordinates to packed bytes
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.fill_box(0, 63, 0, 63, 0, 31, 1)
+            131072
+            >>> sum(len(packed) for packed in world.snapshot_rle().values())
+            20
+        """
+        return {pos: chunk.pack_rle() for pos, chunk in self.chunks.items()}
+
+    def snapshot(self) -> bytes:
+        """
+        Whole-world save blob: every loaded chunk, run-length packed.
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.fill_box(0, 63, 0, 63, 0, 31, 1)
+            131072
+            >>> len(world.snapshot())  # 4 x (16-byte header + 5-byte payload)
+            84
+        """
+        return pack_snapshot(self.snapshot_rle())
+
+    def snapshot_diff(self, previous: bytes) -> bytes:
+        """
+        Snapshot of only the chunks that changed since a previous snapshot.
+
+        Chunks whose packed bytes differ are included; chunks that have
+        since been unloaded are written as all-air, so load_snapshot on a
+        world holding the previous state reproduces this one.
+
+        Args:
+            previous: Earlier snapshot() output to diff against
+
+        Returns:
+            Snapshot blob (same format as snapshot())
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.fill_box(0, 63, 0, 63, 0, 31, 1)
+            131072
+            >>> base = world.snapshot()
+            >>> world.set_voxel(5, 5, 5, 2)
+            >>> list(unpack_snapshot(world.snapshot_diff(base)))
+            [(0, 0, 0)]
+        """
+        old = unpack_snapshot(previous)
+        changed = {pos: packed for pos, packed in self.snapshot_rle().items() if old.get(pos) != packed}
+        for pos in old.keys() - self.chunks.keys():
+            changed[pos] = VoxelChunk(position=pos).pack_rle()
+        return pack_snapshot(changed)
+
+    def load_snapshot(self, data: bytes) -> int:
+        """
+        Load chunks from a snapshot() or snapshot_diff() blob.
+
+        Each listed chunk replaces the loaded one (and is marked dirty);
+        all-air chunks are unloaded. Unlisted chunks are left alone, so
+        call clear_all() first to restore a full snapshot exactly.
+
+        Returns:
+            Number of chunks loaded or unloaded
+
+        Raises:
+            ValueError: If the blob or a chunk payload is malformed
+        """
+        payloads = unpack_snapshot(data)
+        for pos, packed in payloads.items():
+            chunk = VoxelChunk.unpack_rle(pos, packed)
+            if chunk.is_empty():
+                self.unload_chunk(*pos)
+            else:
+                self.put_chunk(chunk)
+        return len(payloads)
+
     def iter_chunks(self) -> Iterator[VoxelChunk]:
         """
         Iterate over all loaded chunks.
@@ -516,6 +1302,8 @@ class ChunkedVoxelWorld:
         """
         Iterate over all non-air voxels in world space.
 
+        Legacy per-voxel view; bulk consumers should use iter_voxels_soa.
+
         Yields:
             Tuples of (world_x, world_y, world_z, material_id)
 
@@ -528,15 +1316,45 @@ class ChunkedVoxelWorld:
         """
         for chunk in self.chunks.values():
             cx, cy, cz = chunk.position
-            chunk_base_x = cx * CHUNK_SIZE
-            chunk_base_y = cy * CHUNK_SIZE
-            chunk_base_z = cz * CHUNK_SIZE
+            xs, ys, zs, materials = chunk.iter_voxels_soa()
+
+            # Offset whole columns to world space, then hand out Python ints
+            yield from zip(
+                (xs + (cx << CHUNK_SHIFT)).tolist(),
+                (ys + (cy << CHUNK_SHIFT)).tolist(),
+                (zs + (cz << CHUNK_SHIFT)).tolist(),
+                materials.tolist(),
+            )
+
+    def iter_voxels_soa(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        All non-air voxels in world space as columns (struct-of-arrays).
+
+        Same voxels and order as iter_voxels, without per-voxel tuples.
+
+        Returns:
+            (xs, ys, zs, materials): int32 world coords and uint8 materials
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.set_voxel(5, 10, 15, 1)
+            >>> world.set_voxel(100, 200, 50, 2)
+            >>> [a.tolist() for a in world.iter_voxels_soa()]
+            [[5, 100], [10, 200], [15, 50], [1, 2]]
+        """
+        columns = ([], [], [], [])
+        for chunk in self.chunks.values():
+            cx, cy, cz = chunk.position
+            xs, ys, zs, materials = chunk.iter_voxels_soa()
+            columns[0].append(xs + (cx << CHUNK_SHIFT))
+            columns[1].append(ys + (cy << CHUNK_SHIFT))
+            columns[2].append(zs + (cz << CHUNK_SHIFT))
+            columns[3].append(materials)
 
-            for local_x, local_y, local_z, material in chunk.iter_voxels():
-                world_x = chunk_base_x + local_x
-                world_y = chunk_base_y + local_y
-                world_z = chunk_base_z + local_z
-                yield (world_x, world_y, world_z, material)
+        if not columns[3]:
+            empty = np.empty(0, dtype=np.int32)
+            return empty, empty.copy(), empty.copy(), np.empty(0, dtype=np.uint8)
+        return tuple(np.concatenate(column) for column in columns)
 
     def iter_region(
         self,
@@ -559,6 +1377,10 @@ class ChunkedVoxelWorld:
             y_min, y_max: Y range (inclusive, world coords)
             z_min, z_max: Z range (inclusive, world coords)
 
+        Only chunks overlapping the region are visited, so the cost scales
+        with the region, not the world. Order is per chunk, encoded order
+        within dense chunks.
+
         Yields:
             Tuples of (world_x, world_y, world_z, material_id)
 
@@ -570,11 +1392,128 @@ class ChunkedVoxelWorld:
             >>> list(world.iter_region(0, 10, 0, 15, 0, 20))
             [(5, 10, 15, 1)]
         """
-        for world_x, world_y, world_z, material in self.iter_voxels():
-            if (x_min <= world_x <= x_max and
-                y_min <= world_y <= y_max and
-                z_min <= world_z <= z_max):
-                yield (world_x, world_y, world_z, material)
+        # Only chunks overlapping the box; each is clipped to its local
+        # overlap in one array op, then handed out as Python ints
+        for chunk, (bx, by, bz), local in self._chunks_in_region(x_min, x_max, y_min, y_max, z_min, z_max):
+            xs, ys, zs, materials = chunk.region_arrays(*local)
+            yield from zip((xs + bx).tolist(), (ys + by).tolist(), (zs + bz).tolist(), materials.tolist())
+
+    def _chunks_in_region(
+        self,
+        x_min: int, x_max: int,
+        y_min: int, y_max: int,
+        z_min: int, z_max: int
+    ) -> Iterator[Tuple[VoxelChunk, Tuple[int, int, int], Tuple[int, int, int, int, int, int]]]:
+        """
+        Loaded chunks overlapping a world box, with the overlap in local coords.
+
+        Probes the chunk grid covered by the box, or filters the loaded chunks
+        when that is fewer lookups.
+
+        Yields:
+            (chunk, chunk world origin, (lx_min, lx_max, ly_min, ly_max, lz_min, lz_max))
+        """
+        if x_min > x_max or y_min > y_max or z_min > z_max:
+            return
+
+        cx0, cy0, cz0 = world_to_chunk(x_min, y_min, z_min)
+        cx1, cy1, cz1 = world_to_chunk(x_max, y_max, z_max)
+        span = (cx1 - cx0 + 1) * (cy1 - cy0 + 1) * (cz1 - cz0 + 1)
+
+        if span <= len(self.chunks):
+            candidates = (
+                (cx, cy, cz)
+                for cx in range(cx0, cx1 + 1)
+                for cy in range(cy0, cy1 + 1)
+                for cz in range(cz0, cz1 + 1)
+            )
+        else:
+            candidates = [
+                pos for pos in self.chunks
+                if cx0 <= pos[0] <= cx1 and cy0 <= pos[1] <= cy1 and cz0 <= pos[2] <= cz1
+            ]
+
+        last = CHUNK_SIZE - 1
+        for chunk_pos in candidates:
+            chunk = self.chunks.get(chunk_pos)
+            if chunk is None:
+                continue
+            bx, by, bz = (c * CHUNK_SIZE for c in chunk_pos)
+            yield chunk, (bx, by, bz), (
+                max(x_min - bx, 0), min(x_max - bx, last),
+                max(y_min - by, 0), min(y_max - by, last),
+                max(z_min - bz, 0), min(z_max - bz, last),
+            )
+
+    def region_arrays(
+        self,
+        x_min: int, x_max: int,
+        y_min: int, y_max: int,
+        z_min: int, z_max: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Non-air voxels in a world box as columns (struct-of-arrays).
+
+        Same voxels and order as iter_region, without per-voxel tuples.
+
+        Args:
+            x_min, x_max, y_min, y_max, z_min, z_max: Region bounds (inclusive, world coords)
+
+        Returns:
+            (xs, ys, zs, materials): int32 world coords and uint8 materials
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.set_voxel(5, 10, 15, 1)
+            >>> world.set_voxel(100, 200, 50, 2)
+            >>> xs, ys, zs, mats = world.region_arrays(0, 10, 0, 15, 0, 20)
+            >>> xs.tolist(), mats.tolist()
+            ([5], [1])
+        """
+        columns = ([], [], [], [])
+        for chunk, (bx, by, bz), local in self._chunks_in_region(x_min, x_max, y_min, y_max, z_min, z_max):
+            xs, ys, zs, materials = chunk.region_arrays(*local)
+            columns[0].append(xs + bx)
+            columns[1].append(ys + by)
+            columns[2].append(zs + bz)
+            columns[3].append(materials)
+
+        if not columns[3]:
+            empty = np.empty(0, dtype=np.int32)
+            return empty, empty.copy(), empty.copy(), np.empty(0, dtype=np.uint8)
+        return tuple(np.concatenate(column) for column in columns)
+
+    def count_material_in_region(
+        self,
+        x_min: int, x_max: int,
+        y_min: int, y_max: int,
+        z_min: int, z_max: int,
+        material: int
+    ) -> int:
+        """
+        Count voxels of a material in a world box.
+
+        Chunks without the material are skipped via their histogram, and
+        fully covered chunks are answered from it without a voxel scan.
+
+        Args:
+            x_min, x_max, y_min, y_max, z_min, z_max: Region bounds (inclusive, world coords)
+            material: Material ID to count
+
+        Returns:
+            Count of matching voxels
+
+        Example:
+            >>> world = ChunkedVoxelWorld()
+            >>> world.fill_box(0, 9, 0, 0, 0, 9, 4)
+            100
+            >>> world.count_material_in_region(0, 4, 0, 0, 0, 9, 4)
+            50
+        """
+        return sum(
+            chunk.count_material_in_aabb(material, local)
+            for chunk, _, local in self._chunks_in_region(x_min, x_max, y_min, y_max, z_min, z_max)
+        )
 
     # =========================================================================
     # REPR
@@ -645,6 +1584,32 @@ def test_world_operations():
     assert world.chunk_count() == 4  # 2x2x1 chunks (X:0-1, Y:0-1, Z:0)
     print(f"  ✓ Fill box: {count:,} voxels across {world.chunk_count()} chunks")
 
+    # RLE snapshot round-trips every chunk
+    world.set_voxel(5, 5, 5, 2)
+    snapshot = world.snapshot_rle()
+    assert snapshot.keys() == world.chunks.keys()
+    for pos, packed in snapshot.items():
+        assert sorted(VoxelChunk.unpack_rle(pos, packed).iter_voxels()) == sorted(world.chunks[pos].iter_voxels())
+    print(f"  ✓ RLE snapshot: {sum(map(len, snapshot.values()))} bytes for {world.voxel_count():,} voxels")
+
+    # Save blob + diffs: base + diff reproduces the edited world
+    base = world.snapshot()
+    restored = ChunkedVoxelWorld()
+    assert restored.load_snapshot(base) == 4 and restored.snapshot() == base
+    world.fill_box(0, 31, 0, 31, 32, 63, 3)        # New chunk
+    world.fill_box(32, 63, 32, 63, 0, 31, 0)       # Carves chunk (1, 1, 0) away
+    world.set_voxel(40, 0, 0, 0)                   # Edits chunk (1, 0, 0)
+    diff = world.snapshot_diff(base)
+    assert sorted(unpack_snapshot(diff)) == [(0, 0, 1), (1, 0, 0), (1, 1, 0)]
+    assert restored.load_snapshot(diff) == 3 and restored.snapshot_rle() == world.snapshot_rle()
+    assert world.snapshot_diff(world.snapshot()) == b''
+    try:
+        restored.load_snapshot(base[:-1])
+        assert False, "truncated snapshot accepted"
+    except ValueError:
+        pass
+    print(f"  ✓ snapshot/snapshot_diff: {len(base)} byte base, {len(diff)} byte diff")
+
     # Unload chunk
     world.unload_chunk(0, 0, 0)
     assert world.chunk_count() == 3  # 4 - 1 = 3 chunks remaining
@@ -675,6 +1640,7 @@ def test_dirty_tracking():
     # Multiple changes to same chunk
     world.set_voxel(10, 10, 10, 2)
     assert len(world.get_dirty_chunks()) == 1  # Still only 1 chunk
+    assert world.dirty_bounds[(0, 0, 0)] == [0, 0, 0, 10, 10, 10]
     print(f"  ✓ Multiple changes to same chunk tracked")
 
     # Clear dirty chunks
@@ -684,11 +1650,41 @@ def test_dirty_tracking():
     assert not world.is_chunk_dirty(0, 0, 0)
     print(f"  ✓ clear_dirty_chunks works")
 
+    # take_dirty_chunks hands the set over instead of copying it
+    world.set_voxel(200, 0, 0, 1)
+    dirty_set = world.dirty_chunks
+    assert world.take_dirty_chunks() is dirty_set and dirty_set == {(6, 0, 0)}
+    assert not world.dirty_chunks and not world.dirty_bounds
+    world.set_voxel(201, 0, 0, 1)
+    assert dirty_set == {(6, 0, 0)} and world.get_dirty_chunks() == [(6, 0, 0)]
+    assert world.dirty_since == {(6, 0, 0): 2}  # Bounds only cover the second edit
+    world.clear_dirty_chunks()
+    assert world.edit_counts[(6, 0, 0)] == 2 and not world.dirty_since  # Edit count outlives dirty state
+    print(f"  ✓ take_dirty_chunks: set handed over, fresh one started")
+
+    # Bulk writes grow the same bounds
+    world.set_voxels_bulk(np.array([40, 35]), np.array([3, 9]), np.array([7, 1]), 1)
+    assert world.dirty_bounds[(1, 0, 0)] == [3, 3, 1, 8, 9, 7]
+
     # Manual marking
     world.mark_chunk_dirty(0, 0, 0)
     assert world.is_chunk_dirty(0, 0, 0)
+    assert world.dirty_bounds[(0, 0, 0)] == [0, 0, 0, 31, 31, 31]
     print(f"  ✓ mark_chunk_dirty works")
 
+    # GPU buffers: reused while clean, rebuilt after an edit
+    world.clear_dirty_chunks()
+    packed = world.pack_chunk_for_gpu(1, 0, 0)
+    assert world.pack_chunk_for_gpu(1, 0, 0) is packed and not packed.flags.writeable
+    assert packed.tolist() == [(x << 24) | (y << 16) | (z << 8) | m
+                               for x, y, z, m in world.chunks[(1, 0, 0)].iter_voxels()]
+    world.set_voxel(40, 0, 0, 9)
+    assert len(world.pack_chunk_for_gpu(1, 0, 0)) == len(packed) + 1
+    world.clear_dirty_chunks()
+    assert (1, 0, 0) not in world._gpu_payloads
+    assert world.pack_chunk_for_gpu(5, 5, 5) is None
+    print(f"  ✓ pack_chunk_for_gpu: cached while clean, repacked after edits")
+
     print(f"  ✓ Dirty tracking complete!")
 
 
@@ -713,6 +1709,49 @@ def test_distance_unloading():
     assert world.get_voxel(0, 0, 0) == 1  # Near chunk still loaded
     print(f"  ✓ unload_far_chunks: {unloaded} chunk unloaded")
 
+    # Key array is reused until the chunk set changes
+    keys = world.chunk_positions()
+    assert keys.tolist() == [list(pos) for pos in world.chunks]
+    assert world.unload_far_chunks(0, 0, 0, max_distance=5) == 0 and world.chunk_positions() is keys
+    world.set_voxel(-33, 0, 0, 1)
+    assert world.chunk_positions().tolist() == [list(pos) for pos in world.chunks]
+    world.set_voxel(-33, 0, 0, 0)
+    assert len(world.chunk_positions()) == 2
+    print(f"  ✓ chunk_positions: cached between loads/unloads")
+
+    world.load_chunk(5, 0, 0)                       # Created empty
+    world.get_chunk(2, 2, 2).set_voxel(0, 0, 0, 0)  # Emptied behind the world's back
+    world.mark_chunk_dirty(2, 2, 2)
+    assert world.prune_empty_chunks() == 2
+    assert set(world.chunks) == {(0, 0, 0)} and not world.is_chunk_dirty(2, 2, 2)
+    print(f"  ✓ prune_empty_chunks: swept 2 empty chunks")
+
+    # Churn: emptied chunks are recycled, fully reset, at their new position
+    pooled = world._chunk_pool[-1]
+    world.set_voxel(-100, 7, 3, 5)
+    recycled = world.get_chunk(-4, 0, 0)
+    assert recycled is pooled and recycled.position == (-4, 0, 0)
+    assert list(world.iter_voxels())[-1] == (-100, 7, 3, 5) and recycled.voxel_count() == 1
+    assert recycled.material_counts[0] == recycled.material_counts.sum() - 1
+    world.set_voxel(-100, 7, 3, 0)
+    assert world.get_chunk(-4, 0, 0) is None and world._chunk_pool[-1] is recycled
+    print(f"  ✓ Chunk pool: unloaded chunks reused ({len(world._chunk_pool)} pooled)")
+
+    # Lookup cache never outlives the chunk: the pooled object moves to a new
+    # position, a replaced chunk is seen at once, and clear_all forgets it
+    world.set_voxel(40, 0, 0, 6)
+    world.unload_chunk(1, 0, 0)
+    world.set_voxel(-60, 0, 0, 7)  # Recycles the chunk just unloaded
+    assert world.get_voxel(40, 0, 0) == 0 and world.get_voxel(-60, 0, 0) == 7
+    replacement = VoxelChunk(position=(-2, 0, 0))
+    replacement.set_voxel(4, 0, 0, 8)
+    world.put_chunk(replacement)
+    assert world.get_voxel(-60, 0, 0) == 8 and world.is_chunk_dirty(-2, 0, 0)
+    world.clear_all()
+    assert world.get_voxel(-60, 0, 0) == 0 and world.chunk_count() == 0
+    assert not world.dirty_chunks and not world.dirty_bounds
+    print(f"  ✓ Last-chunk cache invalidated on unload, replace and clear")
+
     print(f"  ✓ Distance unloading complete!")
 
 
@@ -738,6 +1777,30 @@ def test_deltabus_integration():
     assert changed == 9  # 3x3 area
     print(f"  ✓ apply_region_change: {changed} voxels (footprint)")
 
+    # Large deltas take the bulk path and match per-voxel writes
+    rng = np.random.default_rng(4)
+    coords = rng.integers(-70, 70, size=(3 * BULK_DELTA_MIN, 3)).tolist()
+    big = {tuple(pos): int(m) for pos, m in zip(coords, rng.integers(0, 4, size=len(coords)))}
+    bulk, reference = ChunkedVoxelWorld(), ChunkedVoxelWorld()
+    for target in (bulk, reference):
+        target.fill_box(-40, 40, -5, 5, -40, 40, 1)
+    assert bulk.apply_voxel_delta(big) == len(big)
+    for (x, y, z), material in big.items():
+        reference.set_voxel(x, y, z, material)
+    assert sorted(bulk.iter_voxels()) == sorted(reference.iter_voxels())
+    assert bulk.dirty_chunks == reference.dirty_chunks
+    print(f"  ✓ apply_voxel_delta (bulk): {len(big)} voxels match set_voxel")
+
+    # Byte replication: full snapshot, then a packed delta with carves
+    replica = ChunkedVoxelWorld()
+    assert replica.apply_bytes(world.snapshot_bytes()) == world.voxel_count()
+    moves = pack_voxel_records([100, 6, 101, 6], [200, 0, 200, 0], [50, 6, 50, 6], [0, 0, 3, 4])
+    for target in (world, replica):
+        assert target.apply_bytes(moves) == 4
+    assert list(replica.iter_voxels()) == list(world.iter_voxels())
+    assert world.get_voxel(101, 200, 50) == 3 and world.get_voxel(6, 0, 6) == 4
+    print(f"  ✓ snapshot_bytes/apply_bytes: {len(world.snapshot_bytes())} bytes for {world.voxel_count()} voxels")
+
     print(f"  ✓ DeltaBus integration complete!")
 
 
@@ -760,11 +1823,132 @@ def test_region_queries():
     # Full iteration still sees all
     all_voxels = list(world.iter_voxels())
     assert len(all_voxels) == 3
+    assert list(zip(*(column.tolist() for column in world.iter_voxels_soa()))) == all_voxels
     print(f"  ✓ iter_voxels: {len(all_voxels)} total voxels")
 
+    # Columnar query returns the same voxels as iter_region
+    world.fill_box(-40, 40, 0, 9, -5, 10, 4)  # Spans chunks, promotes some to dense
+    assert any(chunk.dense is not None for chunk in world.iter_chunks())
+    for bounds in ((50, 40, 0, 0, 0, 0), (0, 10, 0, 15, 0, 20), (-35, 33, 1, 12, -2, 40)):
+        x_min, x_max, y_min, y_max, z_min, z_max = bounds
+        expected = sorted(v for v in world.iter_voxels()
+                          if x_min <= v[0] <= x_max and y_min <= v[1] <= y_max and z_min <= v[2] <= z_max)
+        xs, ys, zs, mats = world.region_arrays(*bounds)
+        columns = list(zip(xs.tolist(), ys.tolist(), zs.tolist(), mats.tolist()))
+        assert columns == list(world.iter_region(*bounds))
+        assert sorted(columns) == expected
+    print(f"  ✓ iter_region/region_arrays: match a full scan ({len(columns)} voxels in last box)")
+
+    for material in (1, 3, 4):
+        expected = sum(1 for *_, m in world.iter_region(-35, 33, 1, 12, -2, 40) if m == material)
+        assert world.count_material_in_region(-35, 33, 1, 12, -2, 40, material) == expected
+    assert world.count_material_in_region(-64, 63, -32, 31, -32, 31, 4) == 81 * 10 * 16
+    assert world.count_material(4) == sum(1 for _, _, _, m in world.iter_voxels() if m == 4)
+    print(f"  ✓ count_material_in_region: histogram-pruned counts match")
+
     print(f"  ✓ Region queries complete!")
 
 
+def test_bulk_set():
+    """Test vectorized bulk writes match per-voxel set_voxel."""
+    print("\nTesting Bulk Set...")
+
+    rng = np.random.default_rng(7)
+    xs, ys, zs = rng.integers(-40, 40, size=(3, 500))
+    materials = rng.integers(0, 4, size=500)
+
+    bulk = ChunkedVoxelWorld()
+    reference = ChunkedVoxelWorld()
+    for x, y, z, m in zip(xs.tolist(), ys.tolist(), zs.tolist(), materials.tolist()):
+        reference.set_voxel(x, y, z, m)
+    assert bulk.set_voxels_bulk(xs, ys, zs, materials) == 500
+
+    assert sorted(bulk.iter_voxels()) == sorted(reference.iter_voxels())
+    assert set(bulk.chunks) == set(reference.chunks)
+    assert bulk.dirty_chunks == reference.dirty_chunks
+    print(f"  ✓ set_voxels_bulk: {bulk.voxel_count()} voxels across {bulk.chunk_count()} chunks")
+
+    # Scalar air clears and drops emptied chunks
+    bulk.set_voxels_bulk(xs, ys, zs, 0)
+    assert bulk.chunk_count() == 0
+    print(f"  ✓ Bulk air write removes empty chunks")
+
+    # Tiled box fills match per-voxel set_voxel, including dirty bounds
+    tiled = ChunkedVoxelWorld()
+    reference = ChunkedVoxelWorld()
+    for box, material in (((-20, 50, -3, 2, 5, 40), 2), ((-5, 10, 0, 0, 0, 70), 3), ((0, 40, -3, 2, 30, 33), 0)):
+        x_min, x_max, y_min, y_max, z_min, z_max = box
+        for x in range(x_min, x_max + 1):
+            for y in range(y_min, y_max + 1):
+                for z in range(z_min, z_max + 1):
+                    reference.set_voxel(x, y, z, material)
+        volume = (x_max - x_min + 1) * (y_max - y_min + 1) * (z_max - z_min + 1)
+        assert tiled.fill_box(*box, material) == volume
+    assert sorted(tiled.iter_voxels()) == sorted(reference.iter_voxels())
+    assert tiled.dirty_bounds == reference.dirty_bounds
+    assert all(np.array_equal(c.material_counts, reference.chunks[pos].material_counts)
+               for pos, c in tiled.chunks.items())
+    print(f"  ✓ fill_box: {tiled.voxel_count()} voxels across {tiled.chunk_count()} chunks")
+
+    stats = tiled.memory_usage()
+    assert any(c.dense is None for c in tiled.chunks.values()) and any(c.dense is not None for c in tiled.chunks.values())
+    assert stats['voxel_count'] == tiled.voxel_count() == sum(c.voxel_count() for c in tiled.chunks.values())
+    assert stats['total_bytes'] == sum(c.total_bytes() for c in tiled.chunks.values())
+    print(f"  ✓ memory_usage matches per-chunk totals: {stats['total_bytes']:,} bytes")
+
+    xs, ys, zs, _ = tiled.iter_voxels_soa()
+    expected = ((int(xs.min()), int(ys.min()), int(zs.min())), (int(xs.max()), int(ys.max()), int(zs.max())))
+    assert tiled.get_bounds() == expected
+    tiled.load_chunk(-9, 0, 0)  # Empty chunk on the hull: falls back to a full scan
+    assert tiled.get_bounds() == expected and ChunkedVoxelWorld().get_bounds() is None
+    print(f"  ✓ get_bounds: {expected}")
+
+
+def test_lod_layer():
+    """Test downsampled LOD summaries kept in sync with edits."""
+    print("\nTesting LOD Layer...")
+
+    world = ChunkedVoxelWorld(lod_levels=2)
+    world.fill_box(0, 127, 0, 3, 0, 127, 1)     # Floor across 4x4 chunks
+    world.fill_box(40, 41, 0, 40, 40, 41, 2)    # 2x2 pillar
+    world.set_voxel(90, 10, 90, 3)              # Lone voxel: below LOD_SOLID_MIN
+    world.set_voxel(-5, 0, 0, 4)                # Sparse chunk at negative coords
+    world.set_voxel(-6, 0, 0, 4)
+    world.clear_dirty_chunks()
+
+    assert world.get_voxel_lod(100, 2, 7, 1) == 1 and world.get_voxel_lod(100, 2, 7, 2) == 1
+    assert world.get_voxel_lod(40, 20, 40, 1) == 2 and world.get_voxel_lod(90, 10, 90, 1) == 0
+    assert world.get_voxel_lod(-6, 0, 0, 1) == 4 and world.get_voxel_lod(-5, 0, 0, 2) == 0
+    assert len(world.lod[1]) == 5 and len(world.lod[2]) == 1  # Negative pair thins out at LOD2
+    print(f"  ✓ LOD1/LOD2 built: {len(world.lod[1])} + {len(world.lod[2])} nodes")
+
+    # LOD1 matches a brute-force majority over every 2x2x2 cell
+    for x in range(0, 128, 2):
+        for z in range(0, 48, 2):
+            for y in range(0, 44, 2):
+                cell = [world.get_voxel(x + dx, y + dy, z + dz)
+                        for dy in (0, 1) for dz in (0, 1) for dx in (0, 1)]
+                solid = [m for m in cell if m]
+                expected = max(solid, key=solid.count) if len(solid) >= LOD_SOLID_MIN else 0
+                assert world.get_voxel_lod(x, y, z, 1) == expected
+    print(f"  ✓ LOD1 matches per-cell majority vote")
+
+    # Carving a chunk empty is flushed when it unloads; clean unloads keep the summary
+    world.fill_box(-32, -1, 0, 31, 0, 31, 0)
+    assert (-1, 0, 0) not in world.chunks and world.get_voxel_lod(-6, 0, 0, 1) == 0
+    assert (-1, 0, 0) not in world.lod[1] and (-1, 0, 0) not in world.lod[2]
+    assert world.unload_far_chunks(1000, 0, 1000, max_distance=1) == 17  # Floor + pillar top
+    assert world.chunk_count() == 0 and world.get_voxel_lod(40, 20, 40, 1) == 2
+    world.set_voxel(100, 2, 7, 5)  # Reloads chunk (3, 0, 0) with one voxel: only its octant is rebuilt
+    world.clear_dirty_chunks()
+    assert world.get_voxel_lod(100, 2, 7, 1) == 0 and world.get_voxel_lod(70, 2, 7, 1) == 1
+    print(f"  ✓ Summaries survive unload_far_chunks; edits rewrite one octant")
+
+    world.clear_all()
+    assert not world.lod[1] and not world.lod[2]
+    print(f"  ✓ LOD layer complete!")
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -781,6 +1965,8 @@ if __name__ == "__main__":
     test_distance_unloading()
     test_deltabus_integration()
     test_region_queries()
+    test_bulk_set()
+    test_lod_layer()
 
     print()
     print("=" * 80)
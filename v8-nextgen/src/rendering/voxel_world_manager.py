@@ -30,12 +30,16 @@ Principles:
 from typing import Optional, Dict, List, Tuple, Callable, Any
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import chain
 import time
 
+import numpy as np
+
 # Import voxel system
 import sys
 sys.path.insert(0, '.')
 from voxel_world import ChunkedVoxelWorld
+from voxel_chunk import MAX_MATERIAL
 from voxel_encoding import CHUNK_SIZE
 
 
@@ -51,7 +55,7 @@ class ChunkLoadPolicy(Enum):
     AGGRESSIVE = "aggressive"       # Pre-load neighboring chunks
 
 
-@dataclass
+@dataclass(slots=True)
 class VoxelWorldConfig:
     """Configuration for VoxelWorldManager."""
 
@@ -71,7 +75,7 @@ class VoxelWorldConfig:
     verbose: bool = False           # Log operations
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceStats:
     """Performance tracking for voxel world."""
 
@@ -81,15 +85,25 @@ class PerformanceStats:
     total_chunks_loaded: int = 0
     total_chunks_unloaded: int = 0
 
-    # Timing
-    total_update_time_ms: float = 0.0
-    total_render_sync_time_ms: float = 0.0
+    # Timing (integer perf_counter_ns sums: no float drift over long sessions)
+    total_update_time_ns: int = 0
+    total_render_sync_time_ns: int = 0
 
     # Current state
     current_chunk_count: int = 0
     current_voxel_count: int = 0
     current_dirty_count: int = 0
 
+    @property
+    def total_update_time_ms(self) -> float:
+        """Total frame update time in milliseconds."""
+        return self.total_update_time_ns / 1e6
+
+    @property
+    def total_render_sync_time_ms(self) -> float:
+        """Total render sync time in milliseconds."""
+        return self.total_render_sync_time_ns / 1e6
+
     def reset(self):
         """Reset all stats."""
         self.__init__()
@@ -141,6 +155,12 @@ class VoxelWorldManager:
         self.focus_y: Optional[int] = None
         self.focus_z: Optional[int] = None
 
+        # Reused output of get_render_chunk_array (grows as needed)
+        self._dirty_buffer = np.empty((1024, 3), dtype=np.int32)
+
+        # Voxel offset tables for batched event boxes, keyed by box shape
+        self._box_offsets: Dict[Tuple[int, int, int], np.ndarray] = {}
+
         # Event hooks (can be set by Mall_OS)
         self.on_chunk_loaded: Optional[Callable[[Tuple[int, int, int]], None]] = None
         self.on_chunk_unloaded: Optional[Callable[[Tuple[int, int, int]], None]] = None
@@ -162,7 +182,7 @@ class VoxelWorldManager:
         - Performance counter reset
         """
         self.stats.total_frames += 1
-        self._update_time_start = time.perf_counter()
+        self._update_time_start = time.perf_counter_ns()
 
         # Apply chunk loading policy
         if self.config.load_policy == ChunkLoadPolicy.RADIUS and self.focus_x is not None:
@@ -177,13 +197,12 @@ class VoxelWorldManager:
         - Stats update
         """
         # Update timing
-        elapsed = (time.perf_counter() - self._update_time_start) * 1000  # ms
-        self.stats.total_update_time_ms += elapsed
+        self.stats.total_update_time_ns += time.perf_counter_ns() - self._update_time_start
 
         # Update current state
         self.stats.current_chunk_count = self.world.chunk_count()
         self.stats.current_voxel_count = self.world.voxel_count()
-        self.stats.current_dirty_count = len(self.world.get_dirty_chunks())
+        self.stats.current_dirty_count = len(self.world.dirty_chunks)
 
     # =========================================================================
     # FOCUS & CHUNK MANAGEMENT
@@ -251,6 +270,51 @@ class VoxelWorldManager:
         if self.on_voxels_changed:
             self.on_voxels_changed(1)
 
+    def set_voxels_bulk(self, xs, ys, zs, material) -> int:
+        """
+        Set many voxels in one call (vectorized pass-through).
+
+        Args:
+            xs, ys, zs: Equal-length integer arrays of world coordinates
+            material: Material ID, or array of IDs matching xs
+
+        Returns:
+            Number of voxels changed
+
+        Example:
+            >>> xs, zs = np.meshgrid(np.arange(128), np.arange(10), indexing='ij')
+            >>> manager.set_voxels_bulk(xs.ravel(), np.zeros(xs.size, int), zs.ravel(), material=1)
+            1280
+        """
+        changed = self.world.set_voxels_bulk(xs, ys, zs, material)
+
+        self.stats.total_voxels_changed += changed
+
+        if self.on_voxels_changed:
+            self.on_voxels_changed(changed)
+
+        return changed
+
+    def fill_aabb(self, x_min: int, x_max: int, y_min: int, y_max: int, z_min: int, z_max: int, material: int) -> int:
+        """
+        Fill a world box with per-chunk slice writes (pass-through).
+
+        Args:
+            x_min, x_max, y_min, y_max, z_min, z_max: World bounds (inclusive)
+            material: Material ID
+
+        Returns:
+            Number of voxels changed
+        """
+        changed = self.world.fill_aabb(x_min, x_max, y_min, y_max, z_min, z_max, material)
+
+        self.stats.total_voxels_changed += changed
+
+        if self.on_voxels_changed:
+            self.on_voxels_changed(changed)
+
+        return changed
+
     def get_voxel(self, world_x: int, world_y: int, world_z: int) -> int:
         """
         Get single voxel (direct pass-through).
@@ -278,11 +342,11 @@ class VoxelWorldManager:
         Example:
             >>> manager.apply_footprint(npc.x, npc.y, npc.z, material_id=4)
         """
-        changed = self.world.apply_region_change(
+        changed = self.world.fill_aabb(
             center_x - size, center_x + size,
             center_y, center_y,  # Only affect floor level
             center_z - size, center_z + size,
-            material=material
+            material
         )
 
         self.stats.total_voxels_changed += changed
@@ -308,11 +372,11 @@ class VoxelWorldManager:
             >>> manager.apply_ripple(player.x, player.y, player.z, radius=3, material=5)
         """
         # Simple box ripple (could be enhanced to ring/sphere)
-        changed = self.world.apply_region_change(
+        changed = self.world.fill_aabb(
             center_x - radius, center_x + radius,
             center_y - 1, center_y + 1,
             center_z - radius, center_z + radius,
-            material=material
+            material
         )
 
         self.stats.total_voxels_changed += changed
@@ -336,11 +400,12 @@ class VoxelWorldManager:
         Example:
             >>> manager.apply_destruction(explosion_x, explosion_y, explosion_z, radius=3)
         """
-        changed = self.world.apply_region_change(
+        # In-place air fill per chunk tile (dense chunks clear a slice)
+        changed = self.world.fill_aabb(
             x - radius, x + radius,
             y - radius, y + radius,
             z - radius, z + radius,
-            material=0  # Air
+            0  # Air
         )
 
         self.stats.total_voxels_changed += changed
@@ -378,43 +443,135 @@ class VoxelWorldManager:
             >>> manager.handle_deltabus_event(event)
         """
         kind = event.get('kind')
-        payload = event.get('payload', {})
-
-        if kind == 'VOXEL_CHANGE':
-            # Direct voxel changes: {(x,y,z): material}
-            changes = payload.get('changes', {})
-            return self.world.apply_voxel_delta(changes)
-
-        elif kind == 'FOOTSTEP':
-            # Footprint event
-            x = payload.get('x')
-            y = payload.get('y')
-            z = payload.get('z')
-            material = payload.get('material', 4)
-            size = payload.get('size', 1)
-            return self.apply_footprint(x, y, z, material, size)
-
-        elif kind == 'CLOAK_RIPPLE':
-            # Cloak ripple event
-            x = payload.get('x')
-            y = payload.get('y')
-            z = payload.get('z')
-            radius = payload.get('radius', 2)
-            material = payload.get('material', 5)
-            return self.apply_ripple(x, y, z, radius, material)
-
-        elif kind == 'DESTRUCTION':
-            # Destruction event
-            x = payload.get('x')
-            y = payload.get('y')
-            z = payload.get('z')
-            radius = payload.get('radius', 1)
-            return self.apply_destruction(x, y, z, radius)
-
-        else:
+        handler = self._EVENT_HANDLERS.get(kind)
+        if handler is None:
             if self.config.verbose:
                 print(f"  Unknown event kind: {kind}")
             return 0
+        return handler(self, event.get('payload', {}))
+
+    def _on_voxel_change(self, payload: Dict[str, Any]) -> int:
+        """VOXEL_CHANGE: direct voxel changes {(x, y, z): material}."""
+        changes = payload.get('changes', {})
+        if changes and not (0 <= min(changes.values()) and max(changes.values()) <= MAX_MATERIAL):
+            raise ValueError(f"Material out of range (must be 0-{MAX_MATERIAL})")
+        return self.world.apply_voxel_delta(changes)
+
+    def _on_footstep(self, payload: Dict[str, Any]) -> int:
+        """FOOTSTEP: footprint at (x, y, z)."""
+        return self.apply_footprint(
+            payload.get('x'), payload.get('y'), payload.get('z'),
+            payload.get('material', 4), payload.get('size', 1),
+        )
+
+    def _on_cloak_ripple(self, payload: Dict[str, Any]) -> int:
+        """CLOAK_RIPPLE: ripple box around (x, y, z)."""
+        return self.apply_ripple(
+            payload.get('x'), payload.get('y'), payload.get('z'),
+            payload.get('radius', 2), payload.get('material', 5),
+        )
+
+    def _on_destruction(self, payload: Dict[str, Any]) -> int:
+        """DESTRUCTION: carve a cube around (x, y, z)."""
+        return self.apply_destruction(
+            payload.get('x'), payload.get('y'), payload.get('z'),
+            payload.get('radius', 1),
+        )
+
+    # Event kind -> handler, one dict probe per event instead of an if/elif chain
+    _EVENT_HANDLERS: Dict[str, Callable[['VoxelWorldManager', Dict[str, Any]], int]] = {
+        'VOXEL_CHANGE': _on_voxel_change,
+        'FOOTSTEP': _on_footstep,
+        'CLOAK_RIPPLE': _on_cloak_ripple,
+        'DESTRUCTION': _on_destruction,
+    }
+
+    def handle_deltabus_events(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Apply a batch of DeltaBus events as one bulk write.
+
+        Every event is expanded to its voxels (same regions and payload
+        defaults as handle_deltabus_event), then the whole batch goes
+        through one set_voxels_bulk call. Each touched chunk is written
+        once per batch, and later events still win over earlier ones.
+
+        Args:
+            events: DeltaBus event dicts, in arrival order
+
+        Returns:
+            Number of voxels changed (sum over events)
+
+        Raises:
+            ValueError: If any event writes a material outside 0-MAX_MATERIAL
+                        (nothing is written)
+
+        Example:
+            >>> manager.handle_deltabus_events([
+            ...     {'kind': 'FOOTSTEP', 'payload': {'x': 10, 'y': 0, 'z': 5}},
+            ...     {'kind': 'CLOAK_RIPPLE', 'payload': {'x': 12, 'y': 0, 'z': 5}},
+            ... ])
+            84
+        """
+        boxes: Dict[Tuple[int, int, int], List[Tuple[int, int, int, int, int]]] = {}
+        points = []  # (order, x, y, z, material) arrays from VOXEL_CHANGE events
+        for order, event in enumerate(events):
+            kind = event.get('kind')
+            payload = event.get('payload', {})
+
+            if kind == 'VOXEL_CHANGE':
+                changes = payload.get('changes', {})
+                if changes:
+                    coords = np.array(list(changes.keys()), dtype=np.int64).reshape(-1, 3)
+                    points.append(np.column_stack((
+                        np.full(len(coords), order), coords, np.fromiter(changes.values(), dtype=np.int64),
+                    )))
+                continue
+
+            region = self._event_region(kind, payload)
+            if region is None:
+                if self.config.verbose:
+                    print(f"  Unknown event kind: {kind}")
+                continue
+
+            (x_min, x_max, y_min, y_max, z_min, z_max), material = region
+            shape = (x_max - x_min + 1, y_max - y_min + 1, z_max - z_min + 1)
+            boxes.setdefault(shape, []).append((order, x_min, y_min, z_min, material))
+
+        # Same-shaped boxes expand together from one cached offset table
+        for shape, rows in boxes.items():
+            rows = np.array(rows, dtype=np.int64)
+            offsets = self._box_offsets.get(shape)
+            if offsets is None:
+                offsets = self._box_offsets[shape] = np.indices(shape).reshape(3, -1).T
+            n = len(offsets)
+            voxels = np.empty((len(rows), n, 5), dtype=np.int64)
+            voxels[:, :, 0] = rows[:, None, 0]
+            voxels[:, :, 1:4] = rows[:, None, 1:4] + offsets[None]
+            voxels[:, :, 4] = rows[:, None, 4]
+            points.append(voxels.reshape(-1, 5))
+
+        if not points:
+            return 0
+        voxels = np.concatenate(points)
+        voxels = voxels[np.argsort(voxels[:, 0], kind='stable')]  # Back to arrival order
+        if (voxels[:, 4] & ~MAX_MATERIAL).any():  # Checked even under -O: the cast below would wrap
+            raise ValueError(f"Material out of range (must be 0-{MAX_MATERIAL})")
+        return self.set_voxels_bulk(voxels[:, 1], voxels[:, 2], voxels[:, 3], voxels[:, 4].astype(np.uint8))
+
+    @staticmethod
+    def _event_region(kind: str, payload: Dict[str, Any]) -> Optional[Tuple[Tuple[int, int, int, int, int, int], int]]:
+        """World box and material written by a FOOTSTEP/CLOAK_RIPPLE/DESTRUCTION event."""
+        x, y, z = payload.get('x'), payload.get('y'), payload.get('z')
+        if kind == 'FOOTSTEP':
+            size = payload.get('size', 1)
+            return (x - size, x + size, y, y, z - size, z + size), payload.get('material', 4)
+        if kind == 'CLOAK_RIPPLE':
+            radius = payload.get('radius', 2)
+            return (x - radius, x + radius, y - 1, y + 1, z - radius, z + radius), payload.get('material', 5)
+        if kind == 'DESTRUCTION':
+            radius = payload.get('radius', 1)
+            return (x - radius, x + radius, y - radius, y + radius, z - radius, z + radius), 0
+        return None
 
     # =========================================================================
     # RENDERER INTEGRATION
@@ -435,19 +592,54 @@ class VoxelWorldManager:
             >>> for chunk_coords in dirty:
             ...     renderer.remesh_chunk(chunk_coords)
         """
-        sync_start = time.perf_counter()
-
-        dirty_chunks = self.world.get_dirty_chunks()
+        sync_start = time.perf_counter_ns()
 
+        # One copy of the dirty set per frame; with auto-clear the world's
+        # set is handed over rather than copied and then cleared
         if self.config.auto_clear_dirty:
-            self.world.clear_dirty_chunks()
+            dirty_chunks = list(self.world.take_dirty_chunks())
+        else:
+            dirty_chunks = self.world.get_dirty_chunks()
 
         # Update timing
-        elapsed = (time.perf_counter() - sync_start) * 1000  # ms
-        self.stats.total_render_sync_time_ms += elapsed
+        self.stats.total_render_sync_time_ns += time.perf_counter_ns() - sync_start
 
         return dirty_chunks
 
+    def get_render_chunk_array(self) -> np.ndarray:
+        """
+        Dirty chunks for the renderer as an int32[N, 3] array.
+
+        Same dirty-set handling as get_render_chunks, but coordinates land
+        in a buffer reused across frames, ready for vectorized culling/LOD
+        math. The returned array is a view that the next call overwrites;
+        copy it to keep it.
+
+        Returns:
+            int32[N, 3] chunk coordinates (cx, cy, cz)
+
+        Example:
+            >>> dirty = manager.get_render_chunk_array()
+            >>> near = dirty[np.abs(dirty - focus_chunk).max(axis=1) <= 2]
+        """
+        sync_start = time.perf_counter_ns()
+
+        if self.config.auto_clear_dirty:
+            dirty_chunks = self.world.take_dirty_chunks()
+        else:
+            dirty_chunks = self.world.dirty_chunks
+        count = len(dirty_chunks)
+        if count > len(self._dirty_buffer):
+            self._dirty_buffer = np.empty((max(count, 2 * len(self._dirty_buffer)), 3), dtype=np.int32)
+        coords = self._dirty_buffer[:count]
+        if count:
+            coords[:] = np.fromiter(chain.from_iterable(dirty_chunks), dtype=np.int32, count=3 * count).reshape(count, 3)
+
+        # Update timing
+        self.stats.total_render_sync_time_ns += time.perf_counter_ns() - sync_start
+
+        return coords
+
     def build_mesh_for_chunk(self, chunk_coords: Tuple[int, int, int]) -> Optional[Any]:
         """
         Placeholder for mesh building.
@@ -513,8 +705,39 @@ class VoxelWorldManager:
         Example:
             >>> footprints = manager.count_material_in_region(0, 100, 0, 0, 0, 100, material=4)
         """
-        voxels = self.query_region(x_min, x_max, y_min, y_max, z_min, z_max)
-        return sum(1 for _, _, _, mat in voxels if mat == material)
+        return self.world.count_material_in_region(x_min, x_max, y_min, y_max, z_min, z_max, material)
+
+    def query_region_soa(self, x_min: int, x_max: int, y_min: int, y_max: int, z_min: int, z_max: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Query voxels in region as columns (no per-voxel tuples).
+
+        Args:
+            x_min, x_max, y_min, y_max, z_min, z_max: Region bounds
+
+        Returns:
+            (xs, ys, zs, materials) NumPy arrays
+
+        Example:
+            >>> xs, ys, zs, mats = manager.query_region_soa(0, 100, 0, 10, 0, 100)
+            >>> footprint_count = np.count_nonzero(mats == FOOTPRINT_MAT)
+        """
+        return self.world.region_arrays(x_min, x_max, y_min, y_max, z_min, z_max)
+
+    def count_material_soa(self, x_min: int, x_max: int, y_min: int, y_max: int, z_min: int, z_max: int, material: int) -> int:
+        """
+        Count voxels of specific material in region without building columns.
+
+        Same result as counting query_region_soa materials; delegates to
+        the histogram-pruned ChunkedVoxelWorld.count_material_in_region.
+
+        Args:
+            x_min, x_max, y_min, y_max, z_min, z_max: Region bounds
+            material: Material ID to count
+
+        Returns:
+            Count of matching voxels
+        """
+        return self.world.count_material_in_region(x_min, x_max, y_min, y_max, z_min, z_max, material)
 
     # =========================================================================
     # STATS & DEBUG
@@ -614,6 +837,49 @@ def demo_manager():
 
         manager.on_frame_end()
 
+    # Array form matches the list form
+    manager.apply_ripple(40, 0, 40, radius=3, material=5)
+    expected = sorted(manager.world.dirty_chunks)
+    dirty_array = manager.get_render_chunk_array()
+    assert dirty_array.dtype == np.int32 and dirty_array.shape == (len(expected), 3)
+    assert sorted(map(tuple, dirty_array.tolist())) == expected
+    assert not manager.world.dirty_chunks
+    print(f"  Array sync: {len(dirty_array)} chunks as {dirty_array.dtype}[N, 3]")
+
+    # Region counts agree across the tuple, column and histogram paths
+    bounds = (-10, 50, -1, 1, -10, 50)
+    _, _, _, mats = manager.query_region_soa(*bounds)
+    for material in (4, 5):
+        count = manager.count_material_soa(*bounds, material)
+        assert count == int(np.count_nonzero(mats == material))
+        assert count == sum(1 for *_, m in manager.query_region(*bounds) if m == material)
+    print(f"  Region counts: {manager.count_material_soa(*bounds, 5)} ripple voxels")
+
+    # Per-event dispatch and the batched path build the same world
+    events = [
+        {'kind': 'FOOTSTEP', 'payload': {'x': 10, 'y': 0, 'z': 5}},
+        {'kind': 'CLOAK_RIPPLE', 'payload': {'x': 12, 'y': 0, 'z': 5, 'radius': 3}},
+        {'kind': 'VOXEL_CHANGE', 'payload': {'changes': {(1, 2, 3): 7, (40, 2, 3): 8}}},
+        {'kind': 'DESTRUCTION', 'payload': {'x': 11, 'y': 0, 'z': 5}},
+        {'kind': 'UNKNOWN', 'payload': {}},
+    ]
+    single, batched = VoxelWorldManager(VoxelWorldConfig()), VoxelWorldManager(VoxelWorldConfig())
+    changed = [single.handle_deltabus_event(event) for event in events]
+    assert changed[-1] == 0 and sum(changed) == batched.handle_deltabus_events(events)
+    assert sorted(single.world.iter_voxels()) == sorted(batched.world.iter_voxels())
+    print(f"  DeltaBus dispatch: {sum(changed)} voxels from {len(events)} events")
+
+    # Out-of-range materials are rejected by both paths, not wrapped to uint8
+    bad = {'kind': 'VOXEL_CHANGE', 'payload': {'changes': {(0, 0, 0): MAX_MATERIAL + 45}}}
+    for apply in (single.handle_deltabus_event, lambda event: batched.handle_deltabus_events([event])):
+        try:
+            apply(bad)
+        except ValueError as error:
+            assert "out of range" in str(error)
+        else:
+            raise AssertionError("material 300 should be rejected")
+    assert single.world.get_voxel(0, 0, 0) == batched.world.get_voxel(0, 0, 0) == 0
+
     print()
     manager.print_stats()
 
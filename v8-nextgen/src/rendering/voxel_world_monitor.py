@@ -28,6 +28,8 @@ Usage:
 from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass, field
 
+import numpy as np
+
 # Import voxel system
 import sys
 sys.path.insert(0, '.')
@@ -38,7 +40,7 @@ from voxel_world import ChunkedVoxelWorld
 # MONITOR STATE
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TickStats:
     """Stats for a single tick."""
     tick: int
@@ -130,7 +132,7 @@ class VoxelWorldMonitor:
         # Capture pre-tick state
         self.prev_chunk_count = self.world.chunk_count()
         self.prev_voxel_count = self.world.voxel_count()
-        self.prev_dirty_chunks = set(self.world.get_dirty_chunks())
+        self.prev_dirty_chunks = self.world.dirty_chunks.copy()
 
     def on_tick_end(self):
         """
@@ -164,7 +166,7 @@ class VoxelWorldMonitor:
         """
         current_chunks = self.world.chunk_count()
         current_voxels = self.world.voxel_count()
-        dirty_chunks = self.world.get_dirty_chunks()
+        dirty_count = len(self.world.dirty_chunks)
 
         # Calculate deltas
         chunks_created = max(0, current_chunks - self.prev_chunk_count)
@@ -186,7 +188,7 @@ class VoxelWorldMonitor:
             chunks_active=current_chunks,
             chunks_created=chunks_created,
             chunks_unloaded=chunks_unloaded,
-            dirty_chunks_count=len(dirty_chunks),
+            dirty_chunks_count=dirty_count,
             total_voxels=current_voxels,
             memory_bytes=mem_stats['total_bytes'],
             voxels_changed=voxels_changed,
@@ -259,19 +261,17 @@ class VoxelWorldMonitor:
         print(f"Y={y_level} Slice ({x_max - x_min + 1}x{z_max - z_min + 1}):")
         print()
 
-        # Get all voxels in slice
-        voxels_in_slice = {}
-        for x, y, z, material in self.world.iter_region(x_min, x_max, y_level, y_level, z_min, z_max):
-            voxels_in_slice[(x, z)] = material
-
-        # Render grid
-        for z in range(z_min, z_max + 1):
-            line = ""
-            for x in range(x_min, x_max + 1):
-                material = voxels_in_slice.get((x, z), 0)  # Default to air
-                symbol = self.material_symbols.get(material, '?')
-                line += symbol
-            print(line)
+        # Rasterize the slice into a [z, x] grid of materials (air = 0)
+        grid = np.zeros((z_max - z_min + 1, x_max - x_min + 1), dtype=np.uint8)
+        xs, _, zs, materials = self.world.region_arrays(x_min, x_max, y_level, y_level, z_min, z_max)
+        grid[zs - z_min, xs - x_min] = materials
+
+        # Map materials to symbols in one lookup, then join each row once
+        symbols = np.array(['?'] * 256, dtype=object)
+        for material, symbol in self.material_symbols.items():
+            symbols[material] = symbol
+        for row in symbols[grid]:
+            print(''.join(row))
         print()
 
     def _get_world_bounds(self) -> Optional[Tuple[int, int, int, int, int, int]]:
@@ -281,19 +281,12 @@ class VoxelWorldMonitor:
         Returns:
             (x_min, x_max, y_min, y_max, z_min, z_max) or None if empty
         """
-        voxels = list(self.world.iter_voxels())
-        if not voxels:
+        bounds = self.world.get_bounds()
+        if bounds is None:
             return None
 
-        x_coords = [x for x, y, z, m in voxels]
-        y_coords = [y for x, y, z, m in voxels]
-        z_coords = [z for x, y, z, m in voxels]
-
-        return (
-            min(x_coords), max(x_coords),
-            min(y_coords), max(y_coords),
-            min(z_coords), max(z_coords),
-        )
+        (x_min, y_min, z_min), (x_max, y_max, z_max) = bounds
+        return x_min, x_max, y_min, y_max, z_min, z_max
 
     # =========================================================================
     # HISTORY & ANALYSIS